@@ -30,6 +30,11 @@ Last Updated: 2025-11-07
 
 # === 標準ライブラリ ===
 import os
+import io
+import datetime
+import hashlib
+import math
+import itertools
 import json
 import threading
 import queue
@@ -37,18 +42,39 @@ import subprocess
 import tempfile
 import re
 import shutil
+import struct
+import time
+import weakref
 import zipfile
+import zlib
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Set, List, Callable, Any
+from typing import Dict, Optional, Tuple, Set, List, Callable, Any, Iterator
 from types import MethodType
 from contextlib import contextmanager
 
 # === サードパーティライブラリ ===
 import tkinter as tk
-from tkinter import ttk, filedialog, messagebox, scrolledtext
+from tkinter import ttk, filedialog, messagebox, scrolledtext, simpledialog
 
 from PIL import Image, ImageDraw, ImageFont, ImageTk, ImageChops
 
+# [ADD] 2026-10-19: numpyは任意（インク範囲の行・列集計に使用。無い場合はPillowのみで処理）
+try:
+    import numpy as np  # type: ignore
+except ImportError:
+    np = None  # type: ignore
+
+# [ADD] 2026-10-19: sqlite3は任意（プロジェクト索引 index.db に使用。無い場合は索引を作らない）
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None  # type: ignore
+
 
 
 
@@ -73,6 +99,10 @@ class Config:
     # ===== PNG書き出し設定 (2025-10-17: デフォルト2048px) =====
     DEFAULT_PNG_EXPORT_SIZE = 2048  # PNG書き出し時のデフォルトサイズ
     
+    # ===== BDF書き出し設定 ([ADD] 2026-10-19) =====
+    BDF_PIXEL_SIZES = (16, 24, 32)  # 書き出すピクセルサイズ（サイズ毎に1ファイル）
+    BDF_PROPORTIONAL = False  # True: 送り幅をインクの右端+1pxにする / False: 全角（ピクセルサイズ）固定
+    
     # ===== TTF書き出し設定 =====
     ASCENT_RATIO = 0.8  # アセント比率
     DESCENT_RATIO = 0.2  # ディセント比率
@@ -141,6 +171,48 @@ class Config:
     # ナビゲーション設定
     NAV_SIZE = 150  # ナビゲーションウィンドウのサイズ
 
+    # ===== テキスト挿入設定 (2026-10-19: 描画キャッシュ・入力デバウンス) =====
+    TEXT_INPUT_DEBOUNCE_MS = 120  # キー入力から再描画までの待ち時間 (ms)
+    TEXT_RENDER_CACHE_SIZE = 32  # エディタ毎に保持するテキストレイヤーの数
+
+    # ===== プレビュー表示設定 (2026-10-19: タイル表示) =====
+    PREVIEW_TILE_SIZE = 256  # 編集プレビューのタイルサイズ (表示px)
+
+    # ===== 編集エディタ設定 (2026-10-19: プール型エディタ) =====
+    EDITOR_REUSE_WINDOW = True  # 文字編集時に既存のエディタウィンドウを使い回す
+    EDITOR_MAX_SESSIONS = 20  # 1ウィンドウで保持するグリフ数（未保存の変更があるものは除く）
+    EDITOR_UNDO_LIMIT = 50  # グリフ毎のアンドゥ履歴数
+
+    # ===== プロジェクト保存設定 (2026-10-19: グリフコンテナ形式) =====
+    PROJECT_STORAGE = 'container'  # 'container': glyphs.fgc に一括格納 / 'folder': glyphs/*.png
+    PROJECT_IO_WORKERS = 4  # グリフPNG圧縮・展開（保存/読込/先読み）のスレッド数
+    PNG_COMPRESS_LEVEL = 6  # 0(無圧縮・最速) ～ 9(最小サイズ・最遅)
+    PROJECT_COMPACT_RATIO = 0.5  # 差分保存で死領域が有効データのこの割合を超えたらコンテナを詰め直す
+    PROJECT_COMPACT_MIN_BYTES = 4 * 1024 * 1024  # これ未満の死領域は詰め直さない
+    PROJECT_JOURNAL = True  # 確定した編集をプロジェクトフォルダの journal.fgj へ追記（異常終了からの復元用）
+    JOURNAL_FSYNC = True  # 追記のたびにディスクへ同期する
+    MAX_BACKUP_GENERATIONS = 10  # 保存ごとに残すバックアップ世代数（0で作らない）
+    PROJECT_INDEX = True  # プロジェクトフォルダに検索用の索引 index.db (SQLite) を作る
+    RECENT_FILTER_HOURS = 24  # 「最近変更したもの」フィルタの対象期間（時間）
+
+    # ===== アウトライン変換設定 (2026-10-19: 内蔵トレーサー) =====
+    TRACE_BACKEND = 'native'  # 'native': 内蔵トレーサー（numpy必須。無ければpotrace） / 'potrace': potraceコマンド
+    TRACE_THRESHOLD = 128  # この値未満の画素をインクとみなす
+    TRACE_TURDSIZE = 2  # この面積(px)以下の輪郭を捨てる（potrace --turdsize 相当）
+    TRACE_ALPHAMAX = 1.0  # 角の判定しきい値（potrace --alphamax 相当。小さいほど角が増える）
+    TRACE_OPTTOLERANCE = 0.2  # 曲線をまとめる許容誤差(px)（potrace --opttolerance 相当。0でまとめない）
+    TRACE_POLY_TOLERANCE = 1.0  # 境界を折れ線に近似する許容誤差(px)
+    EXPORT_WORKERS = 0  # アウトライン変換のプロセス数（0でCPU数。1なら並列化しない）
+    # [ADD] 2026-10-19: 変換後のアウトライン最適化（単位はキャンバス座標 = フォント単位）
+    OUTLINE_SIMPLIFY_TOLERANCE = 1.0  # 直線上・重複とみなす点のずれ（0で点を間引かない）
+    OUTLINE_MIN_CONTOUR_AREA = 16.0  # この面積未満の輪郭を捨てる
+    OUTLINE_CU2QU_MAX_ERR = 1.0  # 3次→2次曲線変換の許容誤差
+    # 'patch': 元のTTFを開いて、編集・追加したグリフだけ差し替える（他のテーブル・名前・メトリクスは元のまま）
+    # 'rebuild': 全グリフから新しいフォントを組み立てる
+    TTF_EXPORT_MODE = 'patch'
+    # [ADD] 2026-10-19: 埋め込みビットマップ（EBDT/EBLC）のppem（4～127。例: (12, 16, 20, 24)。空なら埋め込まない）
+    TTF_BITMAP_STRIKES: Tuple[int, ...] = ()
+
 # ===== [BLOCK1-END] =====
 
 
@@ -155,14 +227,114 @@ class Config:
 # ===== [BLOCK2-BEGIN] データモデル (2025-01-15: 異体字マッピング機能追加) =====
 
 class GlyphData:
-    """1文字分のグリフデータ"""
+    """
+    1文字分のグリフデータ
+    [MOD] 2026-10-19: bitmap は初回アクセス時にローダーから復号する遅延読み込みに対応
+    [MOD] 2026-10-19: 変更のたびに進む版番号 version（差分保存用）
+    """
+
+    _versions = itertools.count(1)  # 全グリフ共通の版カウンタ（単調増加）
     
     def __init__(self, char_code: int, bitmap: Optional[Image.Image] = None, is_edited: bool = False):
         self.char_code = char_code
-        self.bitmap = bitmap
+        self._bitmap = bitmap
+        self._loader: Optional[Callable[[], Optional[Image.Image]]] = None
+        self._load_lock: Optional[threading.Lock] = None
+        self._source: Any = None  # 読み込み元（GlyphContainer / ProjectArchive / GlyphFolder）
         self.is_empty = bitmap is None
         self.is_edited = is_edited
         self.mapping_char = None  # [ADD] 2025-01-15: 読みマッピング
+        self.version = GlyphData.next_version()
+
+    @staticmethod
+    def next_version() -> int:
+        """新しい版番号を払い出す (2026-10-19: 新規追加)"""
+        return next(GlyphData._versions)
+
+    def touch(self) -> None:
+        """内容・状態の変更を版番号に反映 (2026-10-19: 新規追加)"""
+        self.version = GlyphData.next_version()
+
+    @classmethod
+    def lazy(cls, char_code: int, loader: Callable[[], Optional[Image.Image]],
+             is_empty: bool = False, is_edited: bool = False,
+             source: Any = None) -> 'GlyphData':
+        """復号を初回アクセスまで遅らせたグリフを作成 (2026-10-19: 新規追加)"""
+        glyph = cls(char_code, None, is_edited)
+        glyph.is_empty = is_empty
+        if not is_empty:
+            glyph._loader = loader
+            glyph._load_lock = threading.Lock()
+            glyph._source = source
+        return glyph
+
+    def stored_blob(self) -> Optional[bytes]:
+        """
+        未復号のグリフなら、格納済みのPNGブロブをそのまま返す (2026-10-19: 新規追加)
+        [MOD] 2026-10-19: フォルダ形式 (GlyphFolder) 由来のグリフにも対応
+        """
+        source = self._source
+        if source is None or self._loader is None:
+            return None
+        return source.read(self.char_code)
+
+    def rebind(self, old_source: Any, loader: Callable[[], Optional[Image.Image]], source: Any) -> None:
+        """
+        old_source 由来の未復号グリフを、別の読み込み元へ付け替える (2026-10-19: 新規追加)
+        保存で読み込み元のファイルを消す時に使う（読み込み中なら完了を待つ）
+        """
+        lock = self._load_lock
+        if lock is None or self._source is not old_source:
+            return
+        with lock:
+            if self._loader is not None and self._source is old_source:
+                self._loader = loader
+                self._source = source
+
+    @property
+    def bitmap(self) -> Optional[Image.Image]:
+        if self._loader is not None:
+            self.load()
+        return self._bitmap
+
+    @bitmap.setter
+    def bitmap(self, value: Optional[Image.Image]) -> None:
+        self._loader = None
+        self._bitmap = value
+
+    @property
+    def is_loaded(self) -> bool:
+        """画像が復号済みか (2026-10-19: 新規追加)"""
+        return self._loader is None
+
+    def load(self, strict: bool = False) -> None:
+        """
+        未復号ならローダーを実行（先読みスレッドからも呼ばれる） (2026-10-19: 新規追加)
+        strict=True では例外を呼び出し元へ送出
+        [MOD] 2026-10-19: 失敗したグリフを空白にしない（ローダーを残し、次のアクセスで読み直す。
+        空白にすると次の保存で空白として書かれ、格納済みの画像が失われる）
+        """
+        lock = self._load_lock
+        if self._loader is None or lock is None:
+            return
+        with lock:
+            loader = self._loader
+            if loader is None:
+                return
+            error = None
+            try:
+                bitmap = loader()
+            except Exception as e:
+                error = e
+            else:
+                self._bitmap = bitmap
+                if bitmap is None:
+                    self.is_empty = True
+                self._loader = None
+        if error is not None:
+            if strict:
+                raise error
+            print(f'グリフ読み込みエラー: U+{self.char_code:04X} {error}')
     
     def get_char(self) -> str:
         """文字コードから文字を取得"""
@@ -191,10 +363,1149 @@ class GlyphData:
         return self.mapping_char
 
 
+class GlyphTable(dict):
+    """
+    変更されたコードポイントを記録するグリフ辞書 (2026-10-19: 新規追加)
+    FontProject.glyphs の実体。追加・置き換え・削除したコードを changed に積み、差分保存で使う
+    """
+
+    def __init__(self, changed: Set[int], *args: Any) -> None:
+        super().__init__(*args)
+        self.changed = changed
+        # 編集済みグリフが格納された時の通知先（編集ジャーナル用）
+        self.on_edit: Optional[Callable[[int, GlyphData], None]] = None
+
+    def __setitem__(self, code: int, glyph: GlyphData) -> None:
+        super().__setitem__(code, glyph)
+        self.changed.add(code)
+        if self.on_edit is not None and getattr(glyph, 'is_edited', False):
+            self.on_edit(code, glyph)
+
+    def __delitem__(self, code: int) -> None:
+        super().__delitem__(code)
+        self.changed.add(code)
+
+    def pop(self, code: int, *default: Any) -> Any:
+        self.changed.add(code)
+        return super().pop(code, *default)
+
+    def popitem(self) -> Tuple[int, GlyphData]:
+        code, glyph = super().popitem()
+        self.changed.add(code)
+        return code, glyph
+
+    def setdefault(self, code: int, glyph: Optional[GlyphData] = None) -> Any:
+        if code not in self:
+            self.changed.add(code)
+        return super().setdefault(code, glyph)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        for code, glyph in dict(*args, **kwargs).items():
+            self[code] = glyph
+
+    def clear(self) -> None:
+        self.changed.update(self.keys())
+        super().clear()
+
+
+class ProjectArchive:
+    """
+    単一ファイル (.fprojz) の読み出し (2026-10-19: 新規追加)
+
+    ZIP内の project.fproj/ 以下をフォルダの代わりに使う。グリフPNGのメンバーはコードポイントで引き、
+    GlyphContainer と同じ read(code) で格納済みPNGを返すので、遅延読み込み元としてそのまま使える
+    """
+
+    ROOT = 'project.fproj'
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._zf: Optional[zipfile.ZipFile] = None
+        self.root = ''
+        self.entries: Dict[int, zipfile.ZipInfo] = {}
+        self._open()
+
+    def _open(self) -> None:
+        """ZIPを開き、グリフメンバーをコードポイントで引けるようにする"""
+        zf = zipfile.ZipFile(self.path, 'r')
+        roots = [name[:-len('metadata.json')] for name in zf.namelist()
+                 if name.endswith('.fproj/metadata.json') and name.count('/') == 1]
+        if not roots:
+            zf.close()
+            raise ValueError('アーカイブ内に .fproj フォルダが見つかりません')
+        entries = {}
+        prefix = roots[0] + 'glyphs/'
+        for info in zf.infolist():
+            if info.filename.startswith(prefix):
+                code = FontProject._code_from_filename(info.filename[len(prefix):])
+                if code is not None:
+                    entries[code] = info
+        self._zf, self.root, self.entries = zf, roots[0], entries
+
+    def replace(self, path: str) -> None:
+        """
+        path のアーカイブでこのファイルを置き換えて開き直す (2026-10-19: 新規追加)
+        遅延読み込み元のまま使える（置き換え中は read を止める）
+        """
+        with self._lock:
+            if self._zf is not None:
+                self._zf.close()
+                self._zf = None
+            os.replace(path, self.path)
+            self._open()
+
+    def member(self, name: str) -> Optional[zipfile.ZipInfo]:
+        """project.fproj/ からの相対名でメンバー情報を得る"""
+        try:
+            return self._zf.getinfo(self.root + name) if self._zf else None
+        except KeyError:
+            return None
+
+    def list_members(self, prefix: str) -> List[str]:
+        """prefix 直下のメンバー名（prefix を除いた名前）"""
+        full = self.root + prefix
+        return [n[len(full):] for n in self._zf.namelist()
+                if n.startswith(full) and '/' not in n[len(full):] and n != full] if self._zf else []
+
+    def read_member(self, name: str) -> Optional[bytes]:
+        info = self.member(name)
+        if info is None:
+            return None
+        with self._lock:
+            return self._zf.read(info)
+
+    def copy_member(self, name: str, dest: Any) -> None:
+        """メンバーをファイルオブジェクトへ書き出す（全体をメモリに載せない）"""
+        with self._lock, self._zf.open(self.root + name) as src:
+            shutil.copyfileobj(src, dest, 1024 * 1024)
+
+    def read(self, code: int) -> Optional[bytes]:
+        """
+        グリフのPNGを読み出す（未登録ならNone）
+        [MOD] 2026-10-19: replace で索引が変わるので、メンバーの参照と読み出しを同じロック内で行う
+        """
+        with self._lock:
+            info = self.entries.get(code)
+            if info is None:
+                return None
+            if self._zf is None:
+                raise ValueError(f'アーカイブは閉じられています: {self.path}')
+            return self._zf.read(info)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._zf is not None:
+                self._zf.close()
+                self._zf = None
+
+
+class GlyphFolder:
+    """
+    フォルダ形式の glyphs/ の読み出し (2026-10-19: 新規追加)
+
+    GlyphContainer と同じ read(code) で格納済みPNGを返すので、遅延読み込み元としてそのまま使える
+    （未復号のグリフは stored_blob で復号せずに書き出せる）
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.entries: Dict[int, str] = {}  # コードポイント → ファイル名
+        for name in os.listdir(path):
+            code = FontProject._code_from_filename(name)
+            if code is not None:
+                self.entries[code] = name
+
+    def read(self, code: int) -> Optional[bytes]:
+        """グリフのPNGを読み出す（未登録ならNone）"""
+        name = self.entries.get(code)
+        if name is None:
+            return None
+        with open(os.path.join(self.path, name), 'rb') as f:
+            return f.read()
+
+    def close(self) -> None:
+        """開いたままのハンドルは持たない"""
+
+
+class EditJournal:
+    """
+    編集ジャーナル（追記専用の先行書き込みログ） (2026-10-19: 新規追加)
+
+    プロジェクトフォルダの journal.fgj に、確定した編集をその都度追記する。
+        ヘッダ   : MAGIC(4) + 形式バージョン(u16) + 予約(10)
+        レコード : RECORD(MAGIC, 種別, コード, 版, メタ長, データ長, CRC32) + メタ(JSON) + データ
+    データは同じコードの直前のレコードとのXOR差分（初回は画像全体）を zlib 圧縮したもの。
+    プロジェクト保存時は未保存の編集だけを全体レコードで書き直す（保存済みの分は捨てる）。
+    異常終了後は replay で有効なレコードを順に適用する（末尾の書きかけレコードは無視）。
+    """
+
+    FILENAME = 'journal.fgj'
+    MAGIC = b'FGJ1'
+    RECORD_MAGIC = b'FGJR'
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct('<4sH10x')
+    RECORD = struct.Struct('<4sBIQIII')
+
+    KIND_FULL = 0  # 画像全体
+    KIND_DELTA = 1  # 直前のレコードとのXOR差分
+    KIND_EMPTY = 2  # 空白グリフ
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.pending = 0  # 開いた時点で残っていた（未保存の）レコード数
+        self._lock = threading.Lock()
+        self._fp = None  # 追記用ハンドル（遅延オープン）
+        # コード → (画像サイズ, 圧縮済み生データ)。次の差分レコードの基準
+        self._last: Dict[int, Tuple[Tuple[int, int], bytes]] = {}
+
+    @classmethod
+    def open(cls, folder_path: str) -> 'EditJournal':
+        """プロジェクトフォルダのジャーナルを開く（無ければ最初の追記で作成）"""
+        journal = cls(os.path.join(folder_path, cls.FILENAME))
+        journal.pending = sum(1 for _ in journal._records())
+        return journal
+
+    @staticmethod
+    def _xor(a: bytes, b: bytes) -> bytes:
+        """同じ長さのバイト列のXOR（差分の作成・適用の両方に使う）"""
+        return (int.from_bytes(a, 'little') ^ int.from_bytes(b, 'little')).to_bytes(len(a), 'little')
+
+    def _records(self) -> Any:
+        """有効なレコードを先頭から順に返す（壊れたレコード以降は読まない）"""
+        if not os.path.isfile(self.path):
+            return
+        with open(self.path, 'rb') as f:
+            head = f.read(self.HEADER.size)
+            if len(head) < self.HEADER.size or self.HEADER.unpack(head)[0] != self.MAGIC:
+                return
+            while True:
+                raw = f.read(self.RECORD.size)
+                if len(raw) < self.RECORD.size:
+                    return
+                magic, kind, code, version, meta_len, data_len, crc = self.RECORD.unpack(raw)
+                if magic != self.RECORD_MAGIC:
+                    return
+                body = f.read(meta_len + data_len)
+                if len(body) < meta_len + data_len or zlib.crc32(body) != crc:
+                    return
+                try:
+                    meta = json.loads(body[:meta_len].decode('utf-8'))
+                except ValueError:
+                    return
+                yield kind, code, version, meta, body[meta_len:]
+
+    def replay(self) -> List[Tuple[int, Optional[Image.Image], Dict[str, Any]]]:
+        """
+        レコードを順に適用した各コードの最終状態を返す
+        Returns: [(コードポイント, 画像 or None(空白), メタ), ...] コード順
+        """
+        states: Dict[int, Tuple[Optional[Tuple[int, int]], Optional[bytes], Dict[str, Any]]] = {}
+        for kind, code, _version, meta, data in self._records():
+            if kind == self.KIND_EMPTY:
+                states[code] = (None, None, meta)
+                continue
+            size = (int(meta['w']), int(meta['h']))
+            raw = zlib.decompress(data)
+            if kind == self.KIND_DELTA:
+                prev = states.get(code)
+                if prev is None or prev[1] is None or prev[0] != size:
+                    continue  # 差分の基準が無い
+                raw = self._xor(zlib.decompress(prev[1]), raw)
+            states[code] = (size, zlib.compress(raw, 1), meta)
+
+        result = []
+        with self._lock:
+            self._last = {}
+            for code, (size, packed, meta) in sorted(states.items()):
+                if packed is None:
+                    result.append((code, None, meta))
+                else:
+                    self._last[code] = (size, packed)
+                    result.append((code, Image.frombytes('L', size, zlib.decompress(packed)), meta))
+        return result
+
+    def append(self, code: int, glyph: 'GlyphData') -> None:
+        """確定した編集を1件追記"""
+        bmp = glyph.bitmap
+        meta: Dict[str, Any] = {'edited': bool(glyph.is_edited), 'mapping': glyph.mapping_char}
+        with self._lock:
+            if bmp is None:
+                kind, data = self.KIND_EMPTY, b''
+                self._last.pop(code, None)
+            else:
+                if bmp.mode != 'L':
+                    bmp = bmp.convert('L')
+                raw = bmp.tobytes()
+                meta['w'], meta['h'] = bmp.size
+                packed = zlib.compress(raw, 1)
+                prev = self._last.get(code)
+                if prev is not None and prev[0] == bmp.size:
+                    kind, data = self.KIND_DELTA, zlib.compress(self._xor(zlib.decompress(prev[1]), raw), 1)
+                else:
+                    kind, data = self.KIND_FULL, packed
+                self._last[code] = (bmp.size, packed)
+            if self._fp is None:
+                new = not os.path.isfile(self.path)
+                self._fp = open(self.path, 'ab')
+                if new:
+                    self._fp.write(self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION))
+            self._write_record(self._fp, kind, code, glyph.version, meta, data)
+            self._fp.flush()
+            if Config.JOURNAL_FSYNC:
+                os.fsync(self._fp.fileno())
+
+    def _write_record(self, f: Any, kind: int, code: int, version: int,
+                      meta: Dict[str, Any], data: bytes) -> None:
+        meta_raw = json.dumps(meta, ensure_ascii=False).encode('utf-8')
+        body = meta_raw + data
+        f.write(self.RECORD.pack(self.RECORD_MAGIC, kind, code, version, len(meta_raw), len(data), zlib.crc32(body)))
+        f.write(body)
+
+    def rewrite(self, glyphs: List[Tuple[int, 'GlyphData']]) -> None:
+        """
+        未保存の編集だけでジャーナルを作り直す（保存完了時） (2026-10-19: 新規追加)
+        glyphs が空ならファイルを削除する
+        """
+        tmp_path = self.path + '.tmp'
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+            self._last = {}
+            self.pending = 0
+            if not glyphs:
+                if os.path.exists(self.path):
+                    os.remove(self.path)
+                return
+            self._fp = open(tmp_path, 'wb')
+            self._fp.write(self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION))
+        try:
+            for code, glyph in glyphs:
+                self.append(code, glyph)
+        finally:
+            with self._lock:
+                self._fp.close()
+                self._fp = None
+        os.replace(tmp_path, self.path)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+
+
+class SavePlan:
+    """FontProject.plan_save で取った保存内容のスナップショット (2026-10-19: 新規追加)"""
+
+    def __init__(self, folder_path: str, storage: str, target: str, incremental: bool, mark_saved: bool):
+        self.folder_path = folder_path
+        self.storage = storage
+        self.target = target  # 差分保存の基準になる書き込み先（コンテナ or glyphsフォルダの絶対パス）
+        self.incremental = incremental
+        self.mark_saved = mark_saved
+        self.glyphs: Dict[int, GlyphData] = {}
+        self.changed: List[int] = []  # 差分保存で処理した変更記録
+        self.updated: List[Tuple[int, GlyphData, int, bool]] = []  # (コード, グリフ, 版, 編集済み)
+        self.removed: List[int] = []
+        self.meta_text = ''
+        self.parts: Dict[str, Dict[str, Any]] = {}
+        self.part_codes: Dict[str, int] = {}  # [ADD] 2026-10-19: コンテナ形式でのパーツ名 → コード
+        self.mappings: Dict[int, str] = {}  # [ADD] 2026-10-19: 索引用の全マッピング
+        self.clean_version = 0  # スナップショット時点の版（これ以前の編集は保存済みになる）
+
+
+class ProjectIOError(Exception):
+    """プロジェクト保存・読込で一部グリフの処理に失敗 (2026-10-19: 新規追加)"""
+
+    def __init__(self, message: str, errors: List[Tuple[int, Exception]]):
+        super().__init__(message)
+        self.errors = errors  # [(コードポイント, 例外), ...] コード順
+
+    def summary(self, limit: int = 10) -> str:
+        """ダイアログ表示用の要約"""
+        lines = [f'U+{code:04X}: {e}' for code, e in self.errors[:limit]]
+        if len(self.errors) > limit:
+            lines.append(f'...他 {len(self.errors) - limit} 件')
+        return f'{self}\n' + '\n'.join(lines)
+
+
+class GlyphContainer:
+    """
+    プロジェクト用の単一ファイル・グリフコンテナ (glyphs.fgc) (2026-10-19: 新規追加)
+
+    レイアウト:
+        ヘッダ        : MAGIC(4) + 形式バージョン(u16) + 予約(10)
+        ブロブ        : グリフ毎のPNGバイト列を順に追記
+        インデックス  : 1件40バイト (コードポイント u32, オフセット u64, 長さ u32, 版 u32, フラグ u32, 内容ハッシュ 16)
+        フッタ        : インデックス位置(u64) + 件数(u32) + FOOTER_MAGIC(4)
+
+    更新は追記のみで行う（新しいブロブ → 新しいインデックス → フッタをファイル末尾へ書く）。
+    置き換えられたブロブや古いインデックスは死領域となり、compactで詰め直す。
+    末尾のフッタが壊れている場合（書き込み中断など）は、直前の有効なフッタから読み込む。
+
+    [MOD] 2026-10-19: ブロブは内容ハッシュ (BLAKE2b 128bit) で管理し、同じ内容は1度だけ書く。
+    複数のエントリが同じブロブを参照し、参照数が0になったブロブだけが死領域になる。
+    偏旁パーツ画像も PART_CODE_BASE 以上のコードで同じコンテナに格納する。
+    旧形式のインデックス（ハッシュなし, FOOTER_MAGIC_V1）も読める（開く時にハッシュを計算する）
+    """
+
+    FILENAME = 'glyphs.fgc'
+    MAGIC = b'FGC1'
+    FOOTER_MAGIC = b'FGC2'
+    FOOTER_MAGIC_V1 = b'FGCI'  # 内容ハッシュなしの旧インデックス（読み込みのみ）
+    FORMAT_VERSION = 1
+    HEADER = struct.Struct('<4sH10x')
+    ENTRY = struct.Struct('<IQIII16s')
+    ENTRY_V1 = struct.Struct('<IQIII')
+    FOOTER = struct.Struct('<QI4s')
+    INDEX_FORMATS = {FOOTER_MAGIC: ENTRY, FOOTER_MAGIC_V1: ENTRY_V1}
+    NO_DIGEST = bytes(16)
+
+    FLAG_EMPTY = 0x1  # 空白グリフ（ブロブなし）
+    FLAG_EDITED = 0x2  # 編集済みグリフ
+    FLAG_PART = 0x4  # [ADD] 2026-10-19: 偏旁パーツ画像
+    PART_CODE_BASE = 0x80000000  # パーツ用のコード（Unicodeの範囲外）
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        # コードポイント → (オフセット, 長さ, 版, フラグ, 内容ハッシュ)
+        self.entries: Dict[int, Tuple[int, int, int, int, bytes]] = {}
+        # [ADD] 2026-10-19: 内容ハッシュ → [オフセット, 長さ, 参照数]
+        self._blobs: Dict[bytes, List[int]] = {}
+        self.dead_bytes = 0  # 参照されなくなった領域のバイト数
+        self._lock = threading.Lock()
+        self._fp = None  # 読み取り用ハンドル（遅延オープン）
+
+    # ----- 読み込み -----
+
+    @classmethod
+    def open(cls, path: str) -> 'GlyphContainer':
+        """既存のコンテナを開いてインデックスを読み込む"""
+        container = cls(path)
+        with open(path, 'rb') as f:
+            magic, version = cls.HEADER.unpack(f.read(cls.HEADER.size))
+            if magic != cls.MAGIC:
+                raise ValueError(f'グリフコンテナではありません: {path}')
+            if version > cls.FORMAT_VERSION:
+                raise ValueError(f'未対応のコンテナ形式です (version {version}): {path}')
+            size = f.seek(0, os.SEEK_END)
+            index_offset, count, entry_format = cls._find_footer(f, size)
+            f.seek(index_offset)
+            raw = f.read(count * entry_format.size)
+            for fields in entry_format.iter_unpack(raw):
+                code, offset, length, ver, flags = fields[:5]
+                if len(fields) > 5:
+                    digest = fields[5]
+                elif length:
+                    # 旧インデックス: ブロブを読んで内容ハッシュを求める（次の書き込みで新形式になる）
+                    f.seek(offset)
+                    digest = cls.content_hash(f.read(length))
+                else:
+                    digest = cls.NO_DIGEST
+                if length:
+                    container._acquire(digest, offset, length)
+                container.entries[code] = (offset, length, ver, flags, digest)
+        container.dead_bytes = max(0, index_offset - cls.HEADER.size - container.live_bytes())
+        return container
+
+    @classmethod
+    def _find_footer(cls, f: Any, size: int) -> Tuple[int, int, struct.Struct]:
+        """有効なフッタを末尾から探し、(インデックス位置, 件数, エントリ形式) を返す"""
+        end = size
+        while end >= cls.HEADER.size + cls.FOOTER.size:
+            f.seek(end - cls.FOOTER.size)
+            index_offset, count, magic = cls.FOOTER.unpack(f.read(cls.FOOTER.size))
+            entry_format = cls.INDEX_FORMATS.get(magic)
+            if (entry_format is not None and index_offset >= cls.HEADER.size
+                    and index_offset + count * entry_format.size + cls.FOOTER.size == end):
+                return index_offset, count, entry_format
+            # 末尾が壊れている: 手前のフッタ候補を探す
+            f.seek(cls.HEADER.size)
+            data = f.read(end - 1 - cls.HEADER.size)
+            pos = max(data.rfind(m) for m in cls.INDEX_FORMATS)
+            if pos < 0:
+                break
+            end = cls.HEADER.size + pos + len(cls.FOOTER_MAGIC)
+        raise ValueError('グリフコンテナのインデックスが見つかりません')
+
+    @staticmethod
+    def content_hash(blob: bytes) -> bytes:
+        """ブロブの内容ハッシュ (2026-10-19: 新規追加)"""
+        return hashlib.blake2b(blob, digest_size=16).digest()
+
+    def digest(self, code: int) -> Optional[bytes]:
+        """エントリが参照するブロブの内容ハッシュ（空白・未登録ならNone） (2026-10-19: 新規追加)"""
+        entry = self.entries.get(code)
+        return entry[4] if entry and entry[1] else None
+
+    def read(self, code: int) -> Optional[bytes]:
+        """
+        グリフのブロブを読み出す（空白・未登録ならNone）
+        [MOD] 2026-10-19: compact・append で位置が変わらないよう、エントリの参照と読み出しを同じロック内で行う
+        """
+        with self._lock:
+            entry = self.entries.get(code)
+            if entry is None or entry[1] == 0:
+                return None
+            return self._read_at(entry[0], entry[1])
+
+    def read_digest(self, digest: bytes) -> Optional[bytes]:
+        """内容ハッシュでブロブを読み出す（格納されていなければNone） (2026-10-19: 新規追加)"""
+        with self._lock:
+            blob = self._blobs.get(digest)
+            return self._read_at(blob[0], blob[1]) if blob else None
+
+    def has_digest(self, digest: bytes) -> bool:
+        """内容ハッシュのブロブが格納されているか (2026-10-19: 新規追加)"""
+        return digest in self._blobs
+
+    def _read_at(self, offset: int, length: int) -> bytes:
+        """self._lock を持った状態で呼ぶ"""
+        if self._fp is None:
+            self._fp = open(self.path, 'rb')
+        self._fp.seek(offset)
+        return self._fp.read(length)
+
+    def close(self) -> None:
+        """読み取り用ハンドルを閉じる"""
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+
+    # ----- 書き込み -----
+
+    @classmethod
+    def create(cls, path: str, items: Any) -> 'GlyphContainer':
+        """
+        新規にコンテナを書き出す（一時ファイルに書いてから置き換え）
+
+        Args:
+            path: 出力先
+            items: (コードポイント, ブロブ or None, 版, フラグ) の反復可能オブジェクト
+        """
+        container = cls(path)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(cls.HEADER.pack(cls.MAGIC, cls.FORMAT_VERSION))
+                container._write_records(f, cls.HEADER.size, items)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            # [ADD] 2026-10-19: items は書き込み中に作られる（途中で失敗しうる）ので書きかけを残さない
+            os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+        return container
+
+    def append(self, items: Any, removed: Any = ()) -> None:
+        """
+        グリフを追記更新する（既存のブロブは書き換えない）
+
+        Args:
+            items: (コードポイント, ブロブ or None, 版, フラグ) の反復可能オブジェクト
+            removed: インデックスから削除するコードポイント
+        """
+        self.close()
+        with self._lock, open(self.path, 'r+b') as f:
+            end = f.seek(0, os.SEEK_END)
+            # 旧インデックス＋フッタは死領域になる
+            self.dead_bytes += len(self.entries) * self.ENTRY.size + self.FOOTER.size
+            for code in removed:
+                self._release(self.entries.pop(code, None))
+            self._write_records(f, end, items)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _write_records(self, f: Any, pos: int, items: Any) -> None:
+        """
+        ブロブ・インデックス・フッタをposから書き込む
+        [MOD] 2026-10-19: 既に格納されている内容のブロブは書かずに参照だけ増やす
+        """
+        f.seek(pos)
+        for code, blob, version, flags in items:
+            if blob:
+                digest = self.content_hash(blob)
+                if digest not in self._blobs:
+                    f.write(blob)
+                    pos += len(blob)
+                offset, length = self._acquire(digest, pos - len(blob), len(blob))
+                entry = (offset, length, version, flags, digest)
+            else:
+                entry = (0, 0, version, flags | self.FLAG_EMPTY, self.NO_DIGEST)
+            # 参照を増やしてから古いエントリを手放す（同じ内容の上書きで死領域を作らない）
+            self._release(self.entries.get(code))
+            self.entries[code] = entry
+        index_offset = pos
+        f.write(b''.join(self.ENTRY.pack(code, *entry) for code, entry in sorted(self.entries.items())))
+        f.write(self.FOOTER.pack(index_offset, len(self.entries), self.FOOTER_MAGIC))
+        f.truncate()
+
+    def compact(self) -> None:
+        """
+        死領域を取り除いてコンテナを書き直す
+        [MOD] 2026-10-19: 書き直し中は read を止め、置き換え後に新しいインデックスへ切り替える
+        """
+        tmp_path = self.path + '.tmp'
+        rebuilt = GlyphContainer(tmp_path)
+        with self._lock:
+            with open(self.path, 'rb') as src, open(tmp_path, 'wb') as f:
+                def records() -> Any:
+                    for code, (offset, length, version, flags, _digest) in sorted(self.entries.items()):
+                        blob = None
+                        if length:
+                            src.seek(offset)
+                            blob = src.read(length)
+                        yield code, blob, version, flags
+
+                f.write(self.HEADER.pack(self.MAGIC, self.FORMAT_VERSION))
+                rebuilt._write_records(f, self.HEADER.size, records())
+                f.flush()
+                os.fsync(f.fileno())
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+            os.replace(tmp_path, self.path)
+            self.entries = rebuilt.entries
+            self._blobs = rebuilt._blobs
+            self.dead_bytes = 0
+
+    def rewrite(self, items: Any) -> None:
+        """
+        items だけでコンテナを作り直す（一時ファイルに書いてから置き換え） (2026-10-19: 新規追加)
+        遅延読み込み元のまま使える: compact と同じく、置き換えの間だけ read を止めて新しいインデックスへ切り替える
+        """
+        tmp_path = self.path + '.new'
+        rebuilt = GlyphContainer.create(tmp_path, items)
+        with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+            os.replace(tmp_path, self.path)
+            self.entries = rebuilt.entries
+            self._blobs = rebuilt._blobs
+            self.dead_bytes = 0
+
+    def _acquire(self, digest: bytes, offset: int, length: int) -> Tuple[int, int]:
+        """ブロブの参照数を増やし、格納位置 (オフセット, 長さ) を返す (2026-10-19: 新規追加)"""
+        blob = self._blobs.get(digest)
+        if blob is None:
+            blob = self._blobs[digest] = [offset, length, 0]
+        blob[2] += 1
+        return blob[0], blob[1]
+
+    def _release(self, entry: Optional[Tuple[int, int, int, int, bytes]]) -> None:
+        """エントリが参照するブロブの参照数を減らし、0になれば死領域にする (2026-10-19: 新規追加)"""
+        if not entry or not entry[1]:
+            return
+        blob = self._blobs.get(entry[4])
+        if blob is None:
+            return
+        blob[2] -= 1
+        if blob[2] <= 0:
+            del self._blobs[entry[4]]
+            self.dead_bytes += blob[1]
+
+    def live_bytes(self) -> int:
+        """
+        有効なブロブの合計バイト数 (2026-10-19: 新規追加)
+        [MOD] 2026-10-19: 共有ブロブは1回だけ数える
+        """
+        return sum(blob[1] for blob in self._blobs.values())
+
+
+class ProjectIndex:
+    """
+    プロジェクト内の検索用SQLite索引 (index.db, WALモード) (2026-10-19: 新規追加)
+
+    グリフ毎の状態・版・更新日時・マッピングと、パーツのメタデータを持つ。
+    保存のたびに変わった行だけを更新する（metadata.json を読み直して全件走査しなくてよい）。
+    検索は最近の変更 (changed_since) と保存済みPNGの内容ハッシュ (digests)。
+    マッピング・編集済みは未保存の編集を含む必要があるので、メモリ上の glyph_mappings / glyphs から引く。
+    正本は metadata.json とコンテナで、索引が無い・壊れている場合は次の保存で作り直す。
+    接続は操作ごとに開閉する（保存はワーカースレッド、検索はUIスレッドから行うため）
+    """
+
+    FILENAME = 'index.db'
+    FILES = (FILENAME, FILENAME + '-wal', FILENAME + '-shm')
+    SCHEMA_VERSION = 1
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS glyphs (
+            code       INTEGER PRIMARY KEY,
+            revision   INTEGER NOT NULL,  -- 内容・状態が変わるたびに増える版
+            edited     INTEGER NOT NULL,
+            empty      INTEGER NOT NULL,
+            mapping    TEXT,
+            digest     BLOB,              -- PNGの内容ハッシュ（不明ならNULL）
+            updated_at REAL NOT NULL      -- 変更を保存した時刻 (UNIX秒)
+        );
+        CREATE INDEX IF NOT EXISTS glyphs_updated ON glyphs (updated_at);
+        CREATE INDEX IF NOT EXISTS glyphs_mapped ON glyphs (code) WHERE mapping IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS glyphs_edited ON glyphs (code) WHERE edited = 1;
+        CREATE TABLE IF NOT EXISTS parts (
+            name       TEXT PRIMARY KEY,
+            meta       TEXT NOT NULL,
+            digest     BLOB,
+            updated_at REAL NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS project (
+            key   TEXT PRIMARY KEY,
+            value TEXT NOT NULL
+        );
+    """
+
+    def __init__(self, folder_path: str) -> None:
+        self.path = os.path.join(folder_path, self.FILENAME)
+
+    @staticmethod
+    def available() -> bool:
+        return sqlite3 is not None and Config.PROJECT_INDEX
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.path)
+
+    @contextmanager
+    def _connect(self, create: bool = False) -> Any:
+        if not create and not self.exists():
+            raise FileNotFoundError(self.path)
+        conn = sqlite3.connect(self.path, timeout=10)
+        try:
+            if create:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute('PRAGMA synchronous=NORMAL')  # WALではコミット毎のfsyncを省いても壊れない
+                version = conn.execute('PRAGMA user_version').fetchone()[0]
+                if version not in (0, self.SCHEMA_VERSION):
+                    raise ValueError(f'未対応の索引形式です (version {version}): {self.path}')
+                conn.executescript(self.SCHEMA)
+                conn.execute(f'PRAGMA user_version={self.SCHEMA_VERSION}')
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    # ----- 更新 -----
+
+    def update(self, rows: List[Tuple[int, bool, bool, Optional[str], Optional[bytes]]],
+               removed: List[int], full: bool, mappings: Optional[Dict[int, str]] = None,
+               parts: Optional[Dict[str, Tuple[str, Optional[bytes]]]] = None,
+               project: Optional[Dict[str, Any]] = None) -> None:
+        """
+        保存内容を索引へ反映（1トランザクション）
+
+        Args:
+            rows: 変わったグリフの (コード, 編集済み, 空白, マッピング, 内容ハッシュ)
+            removed: 削除されたグリフのコード
+            full: True なら rows が全グリフ（rows に無い行は削除）
+            mappings: 全マッピング（変わった時だけ渡す。rows 以外のグリフのマッピングを合わせる）
+            parts: 全パーツの 名前 → (メタデータJSON, 内容ハッシュ)（変わった時だけ渡す）
+            project: プロジェクト設定（変わった時だけ渡す）
+        """
+        now = time.time()
+        with self._connect(create=True) as conn:
+            if full:
+                live = {row[0] for row in rows}
+                removed = [code for (code,) in conn.execute('SELECT code FROM glyphs') if code not in live]
+            conn.executemany('DELETE FROM glyphs WHERE code = ?', ((code,) for code in removed))
+            # 内容・状態が同じ行は版も日時も変えない
+            conn.executemany(
+                """
+                INSERT INTO glyphs (code, revision, edited, empty, mapping, digest, updated_at)
+                VALUES (?, 1, ?, ?, ?, ?, ?)
+                ON CONFLICT (code) DO UPDATE SET
+                    revision = revision + 1, edited = excluded.edited, empty = excluded.empty,
+                    mapping = excluded.mapping, digest = excluded.digest, updated_at = excluded.updated_at
+                WHERE edited IS NOT excluded.edited OR empty IS NOT excluded.empty
+                   OR mapping IS NOT excluded.mapping OR digest IS NOT excluded.digest
+                """,
+                ((code, int(edited), int(empty), mapping, digest, now)
+                 for code, edited, empty, mapping, digest in rows)
+            )
+            if mappings is not None:
+                stale = [code for (code,) in conn.execute('SELECT code FROM glyphs WHERE mapping IS NOT NULL')
+                         if code not in mappings]
+                conn.executemany(
+                    """
+                    UPDATE glyphs SET mapping = ?, revision = revision + 1, updated_at = ?
+                    WHERE code = ? AND mapping IS NOT ?
+                    """,
+                    [(None, now, code, None) for code in stale]
+                    + [(mapping, now, code, mapping) for code, mapping in mappings.items()]
+                )
+            if parts is not None:
+                conn.executemany('DELETE FROM parts WHERE name = ?',
+                                 [(name,) for (name,) in conn.execute('SELECT name FROM parts') if name not in parts])
+                conn.executemany(
+                    """
+                    INSERT INTO parts (name, meta, digest, updated_at) VALUES (?, ?, ?, ?)
+                    ON CONFLICT (name) DO UPDATE SET
+                        meta = excluded.meta, digest = excluded.digest, updated_at = excluded.updated_at
+                    WHERE meta IS NOT excluded.meta OR digest IS NOT excluded.digest
+                    """,
+                    ((name, meta, digest, now) for name, (meta, digest) in parts.items())
+                )
+            if project is not None:
+                conn.executemany('INSERT OR REPLACE INTO project (key, value) VALUES (?, ?)',
+                                 ((key, json.dumps(value, ensure_ascii=False)) for key, value in project.items()))
+
+    # ----- 検索 -----
+
+    def changed_since(self, timestamp: float, code_range: Optional[Tuple[int, int]] = None) -> List[int]:
+        """
+        指定時刻以降に保存された変更のある編集済みのコード
+        [MOD] 2026-10-19: 索引を作った時は全行の時刻が揃うので、読み込んだだけのグリフは含めない
+        """
+        sql, args = 'SELECT code FROM glyphs WHERE updated_at >= ? AND edited = 1', [timestamp]
+        if code_range:
+            sql += ' AND code BETWEEN ? AND ?'
+            args += list(code_range)
+        with self._connect() as conn:
+            return [code for (code,) in conn.execute(sql + ' ORDER BY code', args)]
+
+    def digests(self) -> Dict[int, bytes]:
+        """グリフのコード → 保存したPNGの内容ハッシュ（ハッシュの無い行は含めない）"""
+        with self._connect() as conn:
+            return {code: bytes(digest) for code, digest in
+                    conn.execute('SELECT code, digest FROM glyphs WHERE digest IS NOT NULL')}
+
+
+class OutlineCache:
+    """
+    TTF書き出しのアウトライン変換結果のキャッシュ (outlines.fgc) (2026-10-19: 新規追加)
+
+    文字コード毎に (変換キー, 元画像キー, glyf形式のバイト列) を1件持つ。
+        変換キー  : 変換設定・CANVAS_SIZE と 1bit化したビットマップのハッシュ
+        元画像キー: 変換設定・CANVAS_SIZE と 保存済みPNGの内容ハッシュのハッシュ
+    保存後に変わっていないグリフは元画像キーで照合し、画像を展開せずに結果を使う。
+    設定が変わればどのキーも一致しなくなり、変換し直した結果で上書きされる。
+    プロジェクトフォルダがあれば GlyphContainer 形式で保存し、無ければメモリ上だけに持つ
+    """
+
+    FILENAMES = {'glyf': 'outlines.fgc', 'cff': 'outlines-cff.fgc'}  # [MOD] 2026-10-19: 出力形式 → ファイル名
+    FORMAT_VERSION = 2  # 変換結果の形式が変わったら上げる（古いキャッシュを使わない）
+    RECORD = struct.Struct('<16s16s')  # 変換キー, 元画像キー（無ければ0埋め）
+
+    def __init__(self, target: str = 'glyf') -> None:
+        self.target = target  # [ADD] 2026-10-19: 'glyf'（TrueType）/ 'cff'（CFFのOpenType）
+        self.filename = self.FILENAMES[target]
+        self.folder: Optional[str] = None
+        self._container: Optional[GlyphContainer] = None
+        # 未保存の記録: 文字コード → (変換キー, 元画像キー, glyfバイト列 or None)
+        self._pending: Dict[int, Tuple[bytes, bytes, Optional[bytes]]] = {}
+        self._settings = b''
+
+    def bind(self, folder: Optional[str]) -> None:
+        """
+        プロジェクトフォルダに結び付ける（別の場所へ保存した時はそれまでの記録を新しい場所へ引き継ぐ）
+        """
+        folder = os.path.abspath(folder) if folder else None
+        if folder == self.folder:
+            return
+        container = None
+        if folder is not None and os.path.isfile(os.path.join(folder, self.filename)):
+            try:
+                container = GlyphContainer.open(os.path.join(folder, self.filename))
+            except (OSError, ValueError) as e:
+                print(f'アウトラインキャッシュを読めません（作り直します）: {e}')
+        if container is None and self._container is not None:
+            for code in self._container.entries:
+                record = self._read(code)
+                if record is not None:
+                    self._pending.setdefault(code, record)
+        elif container is not None:
+            self._pending.clear()
+        if self._container is not None:
+            self._container.close()
+        self.folder, self._container = folder, container
+
+    def begin(self) -> None:
+        """書き出しの開始時に変換設定を確定する"""
+        settings = json.dumps([
+            self.FORMAT_VERSION, self.target, Config.CANVAS_SIZE, TTFExporter._trace_backend(), Config.TRACE_THRESHOLD,
+            Config.TRACE_TURDSIZE, Config.TRACE_ALPHAMAX, Config.TRACE_OPTTOLERANCE, Config.TRACE_POLY_TOLERANCE,
+            Config.OUTLINE_SIMPLIFY_TOLERANCE, Config.OUTLINE_MIN_CONTOUR_AREA, Config.OUTLINE_CU2QU_MAX_ERR,
+        ])
+        self._settings = settings.encode('utf-8')
+
+    def trace_key(self, packed: Tuple[int, int, bytes]) -> bytes:
+        """1bit化したビットマップ (幅, 高さ, バイト列) の変換キー"""
+        width, height, data = packed
+        h = hashlib.blake2b(self._settings, digest_size=16)
+        h.update(struct.pack('<II', width, height))
+        h.update(data)
+        return h.digest()
+
+    def source_key(self, digest: Optional[bytes]) -> bytes:
+        """保存済みPNGの内容ハッシュの元画像キー（不明なら0埋め）"""
+        if not digest:
+            return GlyphContainer.NO_DIGEST
+        return hashlib.blake2b(self._settings + digest, digest_size=16).digest()
+
+    def lookup(self, code: int, trace_key: Optional[bytes] = None,
+               source_key: Optional[bytes] = None) -> Tuple[bool, Optional[bytes]]:
+        """キーのどちらかが一致すれば (True, 変換結果のバイト列 or None)、無ければ (False, None)"""
+        record = self._pending.get(code)
+        if record is None:
+            record = self._read(code)
+        if record is None:
+            return False, None
+        cached_trace, cached_source, data = record
+        if trace_key is not None and trace_key == cached_trace:
+            return True, data
+        if source_key is not None and source_key != GlyphContainer.NO_DIGEST and source_key == cached_source:
+            return True, data
+        return False, None
+
+    def store(self, code: int, trace_key: bytes, source_key: bytes, data: Optional[bytes]) -> None:
+        self._pending[code] = (trace_key, source_key, data)
+
+    def _read(self, code: int) -> Optional[Tuple[bytes, bytes, Optional[bytes]]]:
+        if self._container is None:
+            return None
+        try:
+            blob = self._container.read(code)
+        except OSError:
+            return None
+        if blob is None or len(blob) < self.RECORD.size:
+            return None
+        trace_key, source_key = self.RECORD.unpack_from(blob)
+        return trace_key, source_key, blob[self.RECORD.size:] or None
+
+    def save(self) -> None:
+        """未保存の記録をプロジェクトフォルダへ追記（フォルダが無ければ何もしない。失敗しても書き出しは止めない）"""
+        if self.folder is None or not self._pending or not os.path.isdir(self.folder):
+            return
+        items = [(code, self.RECORD.pack(trace_key, source_key) + (data or b''), 0, 0)
+                 for code, (trace_key, source_key, data) in sorted(self._pending.items())]
+        try:
+            if self._container is None:
+                self._container = GlyphContainer.create(os.path.join(self.folder, self.filename), items)
+            else:
+                self._container.append(items)
+                if self._container.dead_bytes > self._container.live_bytes():
+                    self._container.compact()
+            self._pending.clear()
+        except OSError as e:
+            print(f'アウトラインキャッシュの保存エラー: {e}')
+
+    def close(self) -> None:
+        if self._container is not None:
+            self._container.close()
+
+
+class ProjectBackups:
+    """
+    プロジェクトのバックアップ世代（スナップショット） (2026-10-19: 新規追加)
+
+    配置: <プロジェクトの親フォルダ>/.backups/<プロジェクト名>/
+        objects.fgc : 全世代で共有するブロブ置き場（GlyphContainer。内容ハッシュで重複排除、コードは通し番号）
+        <日時>.fbk  : 世代のマニフェスト（zlib圧縮JSON。ファイル・グリフ → 内容ハッシュ）
+
+    世代ごとに書くのは、それまでの世代に無かった内容のブロブとマニフェストだけ
+    （glyphs.fgc のグリフはインデックスの内容ハッシュで判定するので、変更の無いグリフは読みもしない）。
+    古い世代はマニフェストを消し、どの世代からも参照されなくなったブロブをコンテナから外す。
+    """
+
+    DIRNAME = '.backups'
+    OBJECTS = 'objects.fgc'
+    SUFFIX = '.fbk'
+    FORMAT_VERSION = 1
+    # 保存済みの状態ではないもの（ジャーナル）・作り直せるもの（索引・アウトラインキャッシュ）と書き込み途中の一時ファイルは含めない
+    EXCLUDE = {EditJournal.FILENAME, *ProjectIndex.FILES, *OutlineCache.FILENAMES.values()}
+
+    def __init__(self, project_path: str) -> None:
+        self.project_path = os.path.abspath(project_path)
+        self.path = os.path.join(os.path.dirname(self.project_path), self.DIRNAME,
+                                 os.path.basename(self.project_path))
+
+    def generations(self) -> List[Dict[str, str]]:
+        """世代の一覧（新しい順）。ファイル名だけから作るのでマニフェストは読まない"""
+        if not os.path.isdir(self.path):
+            return []
+        backups = []
+        for fname in os.listdir(self.path):
+            if not fname.endswith(self.SUFFIX):
+                continue
+            name = fname[:-len(self.SUFFIX)]
+            try:
+                created = datetime.datetime.strptime(name, '%Y%m%d_%H%M%S_%f')
+            except ValueError:
+                continue
+            backups.append({'name': name, 'path': os.path.join(self.path, fname),
+                            'created': created.strftime('%Y-%m-%d %H:%M:%S')})
+        backups.sort(key=lambda b: b['name'], reverse=True)
+        return backups
+
+    def read_manifest(self, name: str) -> Dict[str, Any]:
+        """世代のマニフェストを読む"""
+        with open(os.path.join(self.path, name + self.SUFFIX), 'rb') as f:
+            manifest = json.loads(zlib.decompress(f.read()).decode('utf-8'))
+        if manifest.get('format', 0) > self.FORMAT_VERSION:
+            raise ValueError(f'未対応のバックアップ形式です: {name}')
+        return manifest
+
+    def create(self, max_generations: int) -> str:
+        """
+        プロジェクトフォルダの現在の内容を新しい世代として記録し、世代名を返す
+
+        Args:
+            max_generations: 残す世代数（超えた分は古い順に削除）
+        """
+        os.makedirs(self.path, exist_ok=True)
+        backups = self.generations()
+        previous = self.read_manifest(backups[0]['name']).get('files', {}) if backups else {}
+        objects = self._open_objects()
+        try:
+            new_blobs: Dict[bytes, bytes] = {}
+
+            def store(digest: bytes, read: Callable[[], bytes]) -> None:
+                if not objects.has_digest(digest) and digest not in new_blobs:
+                    new_blobs[digest] = read()
+
+            # 通常ファイル: サイズと更新時刻が前の世代と同じなら内容ハッシュを流用
+            files = {}
+            for rel, full in self._project_files():
+                st = os.stat(full)
+                prev = previous.get(rel)
+                if prev and prev[1] == st.st_size and prev[2] == st.st_mtime_ns and objects.has_digest(bytes.fromhex(prev[0])):
+                    digest = bytes.fromhex(prev[0])
+                else:
+                    with open(full, 'rb') as f:
+                        data = f.read()
+                    digest = GlyphContainer.content_hash(data)
+                    store(digest, lambda data=data: data)
+                files[rel] = [digest.hex(), st.st_size, st.st_mtime_ns]
+
+            # glyphs.fgc: インデックスの内容ハッシュでグリフ単位に共有
+            glyphs = None
+            container_path = os.path.join(self.project_path, GlyphContainer.FILENAME)
+            if os.path.isfile(container_path):
+                source = GlyphContainer.open(container_path)
+                try:
+                    glyphs = []
+                    for code, (_offset, length, version, flags, digest) in sorted(source.entries.items()):
+                        if length:
+                            store(digest, partial(source.read, code))
+                        glyphs.append([code, digest.hex() if length else '', version, flags])
+                finally:
+                    source.close()
+
+            if new_blobs:
+                next_id = max(objects.entries, default=-1) + 1
+                objects.append([(next_id + i, blob, 0, 0) for i, blob in enumerate(new_blobs.values())])
+        finally:
+            objects.close()
+
+        name = datetime.datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+        manifest = {
+            'format': self.FORMAT_VERSION,
+            'project': os.path.basename(self.project_path),
+            'files': files,
+            'glyphs': glyphs,
+        }
+        dest = os.path.join(self.path, name + self.SUFFIX)
+        with open(dest + '.tmp', 'wb') as f:
+            f.write(zlib.compress(json.dumps(manifest, ensure_ascii=False).encode('utf-8')))
+        os.replace(dest + '.tmp', dest)
+        self.prune(max_generations)
+        return name
+
+    def prune(self, max_generations: int) -> None:
+        """古い世代を削除し、どの世代からも参照されないブロブを外す"""
+        backups = self.generations()
+        if len(backups) <= max_generations:
+            return
+        for backup in backups[max_generations:]:
+            os.remove(backup['path'])
+            print(f'古いバックアップを削除: {backup["name"]}')
+        live: Set[bytes] = set()
+        for backup in backups[:max_generations]:
+            manifest = self.read_manifest(backup['name'])
+            live.update(bytes.fromhex(entry[0]) for entry in manifest.get('files', {}).values())
+            live.update(bytes.fromhex(entry[1]) for entry in manifest.get('glyphs') or () if entry[1])
+        objects = self._open_objects()
+        try:
+            unused = [code for code in objects.entries if objects.digest(code) not in live]
+            if unused:
+                objects.append([], unused)
+            if objects.dead_bytes > max(Config.PROJECT_COMPACT_MIN_BYTES, objects.live_bytes() * Config.PROJECT_COMPACT_RATIO):
+                objects.compact()
+        finally:
+            objects.close()
+
+    def restore(self, name: str, dest: str) -> None:
+        """
+        世代を dest フォルダへ復元（既存の dest は復元が完了してから置き換える）
+        """
+        manifest = self.read_manifest(name)
+        dest = os.path.abspath(dest)
+        work = dest + '.restore'
+        if os.path.exists(work):
+            shutil.rmtree(work)
+        objects = self._open_objects()
+        try:
+            def blob(hex_digest: str) -> bytes:
+                data = objects.read_digest(bytes.fromhex(hex_digest))
+                if data is None:
+                    raise ValueError(f'バックアップのデータが見つかりません: {name}')
+                return data
+
+            for rel, (hex_digest, _size, _mtime) in manifest.get('files', {}).items():
+                full = os.path.join(work, *rel.split('/'))
+                os.makedirs(os.path.dirname(full), exist_ok=True)
+                with open(full, 'wb') as f:
+                    f.write(blob(hex_digest))
+            os.makedirs(work, exist_ok=True)
+            if manifest.get('glyphs') is not None:
+                GlyphContainer.create(
+                    os.path.join(work, GlyphContainer.FILENAME),
+                    ((code, blob(hex_digest) if hex_digest else None, version, flags)
+                     for code, hex_digest, version, flags in manifest['glyphs'])
+                )
+        except Exception:
+            shutil.rmtree(work, ignore_errors=True)
+            raise
+        finally:
+            objects.close()
+        if os.path.exists(dest):
+            old = dest + '.old'
+            if os.path.exists(old):
+                shutil.rmtree(old)
+            os.replace(dest, old)
+            os.replace(work, dest)
+            shutil.rmtree(old, ignore_errors=True)
+        else:
+            os.replace(work, dest)
+
+    def _open_objects(self) -> GlyphContainer:
+        path = os.path.join(self.path, self.OBJECTS)
+        if os.path.isfile(path):
+            return GlyphContainer.open(path)
+        return GlyphContainer.create(path, [])
+
+    def _project_files(self) -> List[Tuple[str, str]]:
+        """バックアップ対象のファイル (相対パス '/' 区切り, フルパス)。glyphs.fgc はグリフ単位で別に扱う"""
+        result = []
+        for root, _dirs, fnames in os.walk(self.project_path):
+            for fname in fnames:
+                rel = os.path.relpath(os.path.join(root, fname), self.project_path).replace(os.sep, '/')
+                if rel in self.EXCLUDE or rel == GlyphContainer.FILENAME or fname.endswith('.tmp'):
+                    continue
+                result.append((rel, os.path.join(root, fname)))
+        return sorted(result)
+
+
 class FontProject:
     """フォントプロジェクト管理"""
     
     def __init__(self):
+        # [ADD] 2026-10-19: 差分保存用の変更記録（glyphs への代入・削除で積まれる）
+        self._changed_codes: Set[int] = set()
         self.glyphs: Dict[int, GlyphData] = {}
         self.font_path: Optional[str] = None
         self.original_ttf_path: Optional[str] = None
@@ -208,24 +1519,108 @@ class FontProject:
         # キーは偏旁名、値は辞書 { 'image': Image.Image, 'meta': dict } を想定。
         self.parts: Dict[str, Dict[str, Any]] = {}
 
+        # [ADD] 2026-10-19: 遅延読み込み用（開いているコンテナと先読みスレッド）
+        self._container: Optional[Any] = None  # GlyphContainer または ProjectArchive
+        self._prefetch_pool: Optional[ThreadPoolExecutor] = None
+        self._temp_paths: List[str] = []
+        self._journal: Optional[EditJournal] = None  # [ADD] 2026-10-19: 編集ジャーナル
+        # [ADD] 2026-10-19: 内容ハッシュ → 復号済み画像（同じ内容のグリフ・パーツで1枚を共有）
+        self._decoded: 'weakref.WeakValueDictionary[bytes, Image.Image]' = weakref.WeakValueDictionary()
+        # [ADD] 2026-10-19: 保存・読込したプロジェクトフォルダ（索引 index.db・アウトラインキャッシュの置き場）
+        self._project_folder: Optional[str] = None
+        self._outline_caches: Dict[str, 'OutlineCache'] = {}  # [ADD] 2026-10-19: 出力形式 → 書き出しの変換結果
+
+        # [ADD] 2026-10-19: 差分保存の基準（最後に保存・読込した場所と、その時点の各グリフの版）
+        self._saved_target: Optional[str] = None
+        self._saved_versions: Dict[int, int] = {}
+        self._saved_meta: Optional[str] = None
+        self._clean_version = 0  # dirty=False にした時点の版
+
+    @property
+    def glyphs(self) -> GlyphTable:
+        return self._glyphs
+
+    @glyphs.setter
+    def glyphs(self, value: Dict[int, GlyphData]) -> None:
+        # スナップショット（dict）を代入されても変更記録は共有する (2026-10-19)
+        if not (isinstance(value, GlyphTable) and value.changed is self._changed_codes):
+            value = GlyphTable(self._changed_codes, value)
+        value.on_edit = self._journal_edit
+        self._glyphs = value
+
     @property
     def dirty(self) -> bool:
-        """未保存判定"""
-        try:
-            return any(getattr(g, 'is_edited', False) for g in self.glyphs.values())
-        except Exception:
-            return False
+        """
+        未保存判定
+        [MOD] 2026-10-19: 前回の保存・読込（または dirty=False）以降に変更された編集済みグリフがあるか。
+                          変更記録のコードだけを調べる
+        """
+        glyphs = self._glyphs
+        for code in list(self._changed_codes):
+            g = glyphs.get(code)
+            if g is None:
+                if code in self._saved_versions:
+                    return True
+            elif getattr(g, 'is_edited', False) and g.version > self._clean_version:
+                return True
+        return False
+
+    @dirty.setter
+    def dirty(self, value: bool) -> None:
+        """dirty=False で現在の状態を保存済みとみなす（True は変更記録から判定するので不要） (2026-10-19: 新規追加)"""
+        if not value:
+            self.mark_clean()
+
+    def mark_clean(self, version: Optional[int] = None) -> None:
+        """指定版（省略時は現在）までの変更を保存済みとみなす (2026-10-19: 新規追加)"""
+        if version is None:
+            version = GlyphData.next_version()
+        self._clean_version = max(self._clean_version, version)
+
+    def save_project(self, folder_path: str, storage: Optional[str] = None,
+                     progress: Optional[Callable[[int, int], None]] = None, mark_saved: bool = True):
+        """
+        プロジェクト保存（*.fproj）
+        [MOD] 2026-10-19: グリフは既定でコンテナ (glyphs.fgc) に格納。storage='folder'で従来のPNGフォルダ形式
+        [MOD] 2026-10-19: PNG圧縮を並列化。progress(現在数, 総数) は呼び出しスレッドで順番どおりに呼ぶ。
+                          失敗したグリフがあれば ProjectIOError（コンテナは置き換えない）
+        [MOD] 2026-10-19: 前回と同じ場所への保存は差分保存（版が進んだグリフとメタデータの変更だけを書く）。
+                          書き出し（エクスポート）用途では mark_saved=False で差分保存の基準を変えない
+        [MOD] 2026-10-19: plan_save → write_save → finish_save の同期実行（別スレッド保存は各メソッドを直接使う）
+        """
+        plan = self.plan_save(folder_path, storage, mark_saved)
+        self.write_save(plan, progress)
+        self.finish_save(plan)
+
+    def plan_save(self, folder_path: str, storage: Optional[str] = None, mark_saved: bool = True) -> 'SavePlan':
+        """
+        保存内容のスナップショットを取る（UIスレッドで呼ぶ） (2026-10-19: 新規追加)
+        グリフ画像は不変値として扱う（編集は GlyphData ごと置き換える）ため、辞書の浅いコピーと
+        各グリフの版・編集済みフラグを控えるだけでよい。以後の編集は保存内容に影響しない
+        """
+        storage = storage or Config.PROJECT_STORAGE
+        glyph_dir = os.path.join(folder_path, 'glyphs')
+        container_path = os.path.join(folder_path, GlyphContainer.FILENAME)
+        target = os.path.abspath(glyph_dir if storage == 'folder' else container_path)
+        with self._lock:
+            glyphs = dict(self.glyphs)
+            changed = sorted(self._changed_codes)
+            clean_version = GlyphData.next_version()
+        incremental = self._saved_target == target and os.path.exists(target)
+        if incremental:
+            # 変更記録のうち、保存済みの版から進んだものだけを書く（ハッシュ計算なし）
+            saved = self._saved_versions
+            codes = [code for code in changed if code in glyphs and saved.get(code) != glyphs[code].version]
+            removed = [code for code in changed if code not in glyphs and code in saved]
+        else:
+            codes = sorted(glyphs)
+            removed = []
+        updated = [(code, glyphs[code], glyphs[code].version, bool(getattr(glyphs[code], 'is_edited', False)))
+                   for code in codes]
 
-    def save_project(self, folder_path: str):
-        """プロジェクト保存（*.fproj）"""
-        import os, json
-        from PIL import Image
-        os.makedirs(folder_path, exist_ok=True)
-        os.makedirs(os.path.join(folder_path, 'glyphs'), exist_ok=True)
-        
         # [ADD] 2025-01-15: マッピング情報を保存
         mappings = {}
-        for code, glyph in self.glyphs.items():
+        for code, glyph in glyphs.items():
             if hasattr(glyph, 'mapping_char') and glyph.mapping_char:
                 mappings[code] = glyph.mapping_char
         
@@ -233,24 +1628,106 @@ class FontProject:
             'font_path': getattr(self, 'font_path', None),
             'original_ttf_path': getattr(self, 'original_ttf_path', None),
             'char_range': list(getattr(self, 'char_range', (0,0))),
-            'edited_codes': [code for code, g in self.glyphs.items() if getattr(g, 'is_edited', False)],
-            'glyph_mappings': mappings  # [ADD] 2025-01-15
+            'edited_codes': [code for code, g in glyphs.items() if getattr(g, 'is_edited', False)],
+            'glyph_mappings': mappings,  # [ADD] 2025-01-15
+            'storage': storage  # [ADD] 2026-10-19
         }
-        with open(os.path.join(folder_path, 'metadata.json'), 'w', encoding='utf-8') as f:
-            json.dump(meta, f, ensure_ascii=False, indent=2)
-        for code, g in self.glyphs.items():
-            bmp = getattr(g, 'bitmap', None)
-            if bmp is None:
-                continue
-            fn = os.path.join(folder_path, 'glyphs', f'U+{code:04X}.png')
-            bmp.save(fn, 'PNG')
+        parts = {name: dict(info) for name, info in (getattr(self, 'parts', None) or {}).items()}
+        part_codes: Dict[str, int] = {}
+        if storage != 'folder':
+            # [ADD] 2026-10-19: パーツ画像もコンテナへ（グリフと同じ内容ならブロブを共有）
+            names = sorted(name for name, info in parts.items() if info.get('image') is not None)
+            part_codes = {name: GlyphContainer.PART_CODE_BASE + i for i, name in enumerate(names)}
+            meta['parts'] = {name: {'code': code, 'meta': parts[name].get('meta', {})}
+                             for name, code in part_codes.items()}
+        plan = SavePlan(folder_path, storage, target, incremental, mark_saved)
+        plan.glyphs = glyphs
+        plan.changed = changed if incremental else []
+        plan.updated = updated
+        plan.removed = removed
+        plan.meta_text = json.dumps(meta, ensure_ascii=False, indent=2)
+        plan.parts = parts
+        plan.part_codes = part_codes
+        plan.mappings = mappings
+        plan.clean_version = clean_version
+        return plan
+
+    def write_save(self, plan: 'SavePlan', progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """
+        スナップショットをディスクへ書く（ワーカースレッドから呼んでよい） (2026-10-19: 新規追加)
+        progress(現在数, 総数) は呼び出したスレッドで呼ばれる
+        """
+        folder_path = plan.folder_path
+        os.makedirs(folder_path, exist_ok=True)
+        glyph_dir = os.path.join(folder_path, 'glyphs')
+        container_path = os.path.join(folder_path, GlyphContainer.FILENAME)
+
+        if plan.storage == 'folder':
+            os.makedirs(glyph_dir, exist_ok=True)
+            digests = self._run_glyph_io(partial(self._write_png_glyph, glyph_dir), plan.updated, progress)
+            digest_of = dict(zip((item[0] for item in plan.updated), digests)).get
+            for code in plan.removed:
+                fn = os.path.join(glyph_dir, f'U+{code:04X}.png')
+                if os.path.exists(fn):
+                    os.remove(fn)
+            # 古いコンテナが残っていると読み込み時に優先されるため削除
+            stale = os.path.join(folder_path, GlyphContainer.FILENAME)
+            if os.path.exists(stale):
+                source = self._container
+                if source is not None and os.path.abspath(source.path) == os.path.abspath(stale):
+                    # [MOD] 2026-10-19: 復号せずに、未復号グリフの読み込み元を書き出したPNGへ付け替える
+                    self._rebind_lazy_glyphs(plan, source, GlyphFolder(glyph_dir))
+                    source.close()
+                    self._container = None
+                os.remove(stale)
+        else:
+            # [ADD] 2026-10-19: 全グリフを1ファイルのコンテナへ（空白グリフもフラグで保持）
+            # [MOD] 2026-10-19: ブロブは一定数ずつ作りながら書き込む（全グリフ分を同時にメモリへ載せない）
+            items = self._container_items(plan.updated, progress)
+            part_items = self._part_items(plan)
+            same_source = self._container is not None and os.path.abspath(self._container.path) == plan.target
+            if plan.incremental:
+                # 差分は変わったグリフだけなので先に揃える（append はロックを持ったまま items を読むため、
+                # 同じコンテナから読む未復号グリフのブロブを書き込み中に作れない）
+                items = list(items)
+                container = self._container if same_source else GlyphContainer.open(container_path)
+                try:
+                    # 内容が変わったパーツと、無くなったパーツだけを反映
+                    items += [item for item in part_items
+                              if container.digest(item[0]) != GlyphContainer.content_hash(item[1])]
+                    live_parts = set(plan.part_codes.values())
+                    removed = plan.removed + [code for code in container.entries
+                                              if code >= GlyphContainer.PART_CODE_BASE and code not in live_parts]
+                    if items or removed:
+                        container.append(items, removed)
+                    live = container.live_bytes()
+                    if container.dead_bytes > max(Config.PROJECT_COMPACT_MIN_BYTES, live * Config.PROJECT_COMPACT_RATIO):
+                        container.compact()
+                finally:
+                    if not same_source:
+                        container.close()
+                digest_of = container.digest
+            elif same_source:
+                # [MOD] 2026-10-19: 読み込み元を開いたまま作り直す（未復号グリフは新しいインデックスから読む）
+                self._container.rewrite(itertools.chain(items, part_items))
+                digest_of = self._container.digest
+            else:
+                digest_of = GlyphContainer.create(container_path, itertools.chain(items, part_items)).digest
+
+        # [MOD] 2026-10-19: 内容が変わった時だけ書く（一時ファイル経由で置き換え）
+        meta_path = os.path.join(folder_path, 'metadata.json')
+        if not (plan.incremental and plan.meta_text == self._saved_meta and os.path.exists(meta_path)):
+            with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+                f.write(plan.meta_text)
+            os.replace(meta_path + '.tmp', meta_path)
 
         # [ADD] 2025-10-23: 偏旁エディタ用パーツデータを保存
-        if getattr(self, 'parts', None):
+        # [MOD] 2026-10-19: コンテナ形式ではコンテナに格納済み（フォルダ形式のみ parts/ へ書く）
+        if plan.parts and plan.storage == 'folder':
             parts_dir = os.path.join(folder_path, 'parts')
             os.makedirs(parts_dir, exist_ok=True)
             parts_meta = {}
-            for name, info in self.parts.items():
+            for name, info in plan.parts.items():
                 img = info.get('image')
                 meta = info.get('meta', {})
                 if img is None:
@@ -268,69 +1745,644 @@ class FontProject:
                 with open(os.path.join(parts_dir, 'metadata.json'), 'w', encoding='utf-8') as pf:
                     json.dump(parts_meta, pf, ensure_ascii=False, indent=2)
 
-    def load_project(self, folder_path: str):
-        """プロジェクト読込"""
+        # [ADD] 2026-10-19: 保存した状態を索引とバックアップ世代に記録（書き出しでは作らない）
+        if plan.mark_saved:
+            self._update_index(plan, digest_of)
+            self.create_backup(folder_path)
+
+    def _update_index(self, plan: 'SavePlan', digest_of: Callable[[int], Optional[bytes]]) -> None:
+        """
+        保存内容を索引 (index.db) へ反映（ワーカースレッド可。失敗しても保存は止めない） (2026-10-19: 新規追加)
+        差分保存では変わったグリフの行だけ、索引が無ければ全グリフで作り直す
+        """
+        if not ProjectIndex.available():
+            return
+        index = ProjectIndex(plan.folder_path)
+        full = not plan.incremental or not index.exists()
+        if full:
+            entries = [(code, g, bool(getattr(g, 'is_edited', False))) for code, g in sorted(plan.glyphs.items())]
+        else:
+            entries = [(code, g, edited) for code, g, _version, edited in plan.updated]
+        rows = [(code, edited, bool(getattr(g, 'is_empty', False)), plan.mappings.get(code), digest_of(code))
+                for code, g, edited in entries]
+        parts = {name: (json.dumps(info.get('meta', {}), ensure_ascii=False, sort_keys=True),
+                        digest_of(plan.part_codes[name]) if name in plan.part_codes else None)
+                 for name, info in plan.parts.items() if info.get('image') is not None}
+        project = None
+        if full or plan.meta_text != self._saved_meta:
+            meta = json.loads(plan.meta_text)
+            project = {key: value for key, value in meta.items() if key not in ('edited_codes', 'glyph_mappings')}
+        try:
+            index.update(rows, plan.removed, full, mappings=plan.mappings if project is not None else None,
+                         parts=parts, project=project)
+        except Exception as e:
+            print(f'索引の更新エラー: {e}')
+
+    def project_index(self) -> Optional[ProjectIndex]:
+        """開いているプロジェクトの索引（無ければNone） (2026-10-19: 新規追加)"""
+        if self._project_folder is None or not ProjectIndex.available():
+            return None
+        index = ProjectIndex(self._project_folder)
+        return index if index.exists() else None
+
+    def outline_cache(self, target: str = 'glyf') -> OutlineCache:
+        """
+        書き出し用のアウトラインキャッシュ（プロジェクトフォルダがあればそこへ保存） (2026-10-19: 新規追加)
+        [MOD] 2026-10-19: 出力形式（'glyf' / 'cff'）ごとに持つ
+        """
+        cache = self._outline_caches.get(target)
+        if cache is None:
+            cache = self._outline_caches[target] = OutlineCache(target)
+        cache.bind(self._project_folder)
+        return cache
+
+    def stored_digests(self, codes: Any) -> Dict[int, bytes]:
+        """
+        保存・読込した時から変わっていないグリフの、格納PNGの内容ハッシュ (2026-10-19: 新規追加)
+        開いているコンテナのインデックス、無ければ索引 (index.db) から引く（分からないグリフは含めない）
+        """
+        container = self._container
+        if isinstance(container, GlyphContainer):
+            lookup = container.digest
+        else:
+            index = self.project_index()
+            if index is None:
+                return {}
+            try:
+                lookup = index.digests().get
+            except Exception as e:
+                print(f'索引の検索エラー: {e}')
+                return {}
+        with self._lock:
+            glyphs, saved = self.glyphs, self._saved_versions
+            unchanged = [code for code in codes
+                         if code in glyphs and code not in self._changed_codes
+                         and glyphs[code].version == saved.get(code)]
+        return {code: digest for code, digest in ((code, lookup(code)) for code in unchanged) if digest}
+
+    def recently_changed(self, hours: float) -> Set[int]:
+        """
+        指定時間内に変更された編集済みグリフ（保存済みの変更は索引から、未保存の変更は変更記録から） (2026-10-19: 新規追加)
+        """
+        codes: Set[int] = set()
+        index = self.project_index()
+        if index is not None:
+            try:
+                codes.update(index.changed_since(time.time() - hours * 3600, self.char_range))
+            except Exception as e:
+                print(f'索引の検索エラー: {e}')
+        with self._lock:
+            codes.update(code for code in self._changed_codes
+                         if getattr(self.glyphs.get(code), 'is_edited', False))
+        return codes
+
+    def create_backup(self, project_path: str) -> Optional[str]:
+        """
+        バックアップを作成（保存済みのプロジェクトフォルダを新しい世代として記録） (2026-10-19: 新規追加)
+        v1.831 の世代ごとの全体コピーではなく、前の世代から変わった内容だけを書くスナップショット
+
+        Returns:
+            世代名、失敗時はNone（バックアップの失敗で保存は止めない）
+        """
+        if not os.path.isdir(project_path) or Config.MAX_BACKUP_GENERATIONS <= 0:
+            return None
+        try:
+            return ProjectBackups(project_path).create(Config.MAX_BACKUP_GENERATIONS)
+        except Exception as e:
+            print(f'バックアップ作成エラー: {e}')
+            return None
+
+    def list_backups(self, project_path: str) -> List[Dict[str, str]]:
+        """バックアップ世代の一覧（新しい順） (2026-10-19: 新規追加)"""
+        return ProjectBackups(project_path).generations()
+
+    def restore_backup(self, project_path: str, name: str, lazy: bool = True,
+                       progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """
+        バックアップ世代を project_path へ復元して読み込む（未保存の編集は破棄される） (2026-10-19: 新規追加)
+        """
+        self._release_lazy_sources()  # 復元先のコンテナを開いたままにしない
+        self._open_journal(None)
+        ProjectBackups(project_path).restore(name, project_path)
+        self.load_project(project_path, lazy=lazy, progress=progress)
+
+    def finish_save(self, plan: 'SavePlan') -> None:
+        """
+        書き込み完了後に差分保存の基準を更新（UIスレッドで呼ぶ） (2026-10-19: 新規追加)
+        保存中に再び変更されたグリフは変更記録に残す
+        """
+        if not plan.mark_saved:
+            return
+        with self._lock:
+            if plan.incremental:
+                for code, _glyph, version, _edited in plan.updated:
+                    self._saved_versions[code] = version
+                for code in plan.removed:
+                    self._saved_versions.pop(code, None)
+            else:
+                self._saved_versions = {code: version for code, _glyph, version, _edited in plan.updated}
+            glyphs = self.glyphs
+            saved = self._saved_versions
+            pending = plan.changed if plan.incremental else list(self._changed_codes)
+            for code in pending:
+                g = glyphs.get(code)
+                if (g.version if g is not None else None) == saved.get(code):
+                    self._changed_codes.discard(code)
+            self._saved_target = plan.target
+            self._saved_meta = plan.meta_text
+            self._project_folder = plan.folder_path
+            unsaved = [(code, glyphs[code]) for code in sorted(self._changed_codes)
+                       if code in glyphs and getattr(glyphs[code], 'is_edited', False)]
+
+        # [ADD] 2026-10-19: 保存済みの編集をジャーナルから除き、保存中の編集だけを残す
+        journal_dir = os.path.dirname(plan.target)  # target はフォルダ内の glyphs.fgc / glyphs
+        if self._journal is not None and os.path.dirname(os.path.abspath(self._journal.path)) != journal_dir:
+            self._journal.rewrite([])  # 別の場所へ保存した: 元の場所のジャーナルは不要
+            self._journal.close()
+            self._journal = None
+        if self._journal is None and Config.PROJECT_JOURNAL:
+            self._journal = EditJournal(os.path.join(journal_dir, EditJournal.FILENAME))
+        if self._journal is not None:
+            self._run_journal(self._journal.rewrite, unsaved)
+
+    def _journal_edit(self, code: int, glyph: GlyphData) -> None:
+        """確定した編集をジャーナルへ追記 (2026-10-19: 新規追加)"""
+        if self._journal is not None:
+            self._run_journal(self._journal.append, code, glyph)
+
+    @staticmethod
+    def _run_journal(func: Callable[..., None], *args: Any) -> None:
+        """ジャーナルの失敗で編集・保存を止めない"""
+        try:
+            func(*args)
+        except Exception as e:
+            print(f'ジャーナル書き込みエラー: {e}')
+
+    def _open_journal(self, folder_path: Optional[str]) -> None:
+        """プロジェクトフォルダのジャーナルを開く（None なら閉じるだけ） (2026-10-19: 新規追加)"""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        if folder_path and Config.PROJECT_JOURNAL:
+            self._journal = EditJournal.open(folder_path)
+
+    def journal_pending(self) -> int:
+        """前回セッションから残っている未保存の編集レコード数 (2026-10-19: 新規追加)"""
+        return self._journal.pending if self._journal is not None else 0
+
+    def recover_from_journal(self) -> int:
+        """
+        ジャーナルの編集を適用して前回セッションを復元 (2026-10-19: 新規追加)
+        復元したグリフは未保存（dirty）扱い。Returns: 復元した文字数
+        """
+        journal = self._journal
+        if journal is None:
+            return 0
+        states = journal.replay()
+        self._journal = None  # 適用中は再記録しない（レコードはファイルに残っている）
+        try:
+            for code, bitmap, meta in states:
+                glyph = GlyphData(code, bitmap, is_edited=bool(meta.get('edited', True)))
+                if meta.get('mapping'):
+                    glyph.set_mapping(meta['mapping'])
+                self.glyphs[code] = glyph
+        finally:
+            self._journal = journal
+        journal.pending = 0
+        return len(states)
+
+    def discard_journal(self) -> None:
+        """前回セッションの未保存の編集を破棄 (2026-10-19: 新規追加)"""
+        if self._journal is not None:
+            self._run_journal(self._journal.rewrite, [])
+
+    def load_project(self, folder_path: str, lazy: bool = True,
+                     progress: Optional[Callable[[int, int], None]] = None):
+        """
+        プロジェクト読込
+        [MOD] 2026-10-19: lazy=True ではインデックスのみ読み、画像は初回アクセス時に復号
+        （読み込み後に folder_path を削除する場合は lazy=False: 並列に一括復号し progress で進捗通知）
+        復号に失敗したグリフは空白として読み込み、最後に ProjectIOError で報告する
+        """
         import os, json
-        from PIL import Image
         with open(os.path.join(folder_path, 'metadata.json'), 'r', encoding='utf-8') as f:
             meta = json.load(f)
-        self.font_path = meta.get('font_path')
-        self.original_ttf_path = meta.get('original_ttf_path')
-        cr = meta.get('char_range')
-        if isinstance(cr, list) and len(cr) == 2:
-            self.char_range = (int(cr[0]), int(cr[1]))
-        
-        # [ADD] 2025-01-15: マッピング情報を読込
-        self.glyph_mappings = {}
-        mappings = meta.get('glyph_mappings', {})
+        self._release_lazy_sources()
+        self._open_journal(None)
+        edited, mappings = self._apply_metadata(meta)
         
         self.glyphs.clear()
-        edited = set(meta.get('edited_codes', []))
         glyph_dir = os.path.join(folder_path, 'glyphs')
-        if os.path.isdir(glyph_dir):
-            for name in os.listdir(glyph_dir):
-                if not name.lower().endswith('.png'):
-                    continue
-                try:
-                    codepoint = int(name[2:6], 16)
-                except Exception:
-                    continue
-                img = Image.open(os.path.join(glyph_dir, name)).convert('L')
-                glyph = GlyphData(codepoint, img, is_edited=(codepoint in edited))
-                
-                # [ADD] 2025-01-15: マッピングを設定
-                if str(codepoint) in mappings:
-                    glyph.set_mapping(mappings[str(codepoint)])
-                
-                self.glyphs[codepoint] = glyph
+        container_path = os.path.join(folder_path, GlyphContainer.FILENAME)
+        if os.path.isfile(container_path):
+            # [ADD] 2026-10-19: コンテナ形式（フォルダ形式より優先）
+            self._add_container_glyphs(GlyphContainer.open(container_path), edited, mappings)
+        elif os.path.isdir(glyph_dir):
+            # [MOD] 2026-10-19: GlyphFolder を読み込み元にする（未復号のまま保存・書き出しできる）
+            folder = GlyphFolder(glyph_dir)
+            for codepoint in folder.entries:
+                loader = partial(self._read_container_glyph, folder, codepoint)
+                self._add_lazy_glyph(codepoint, loader, edited, mappings, source=folder)
+            self._add_emptied_glyphs(edited)
+
+        # [ADD] 2026-10-19: 読み込んだ状態を差分保存の基準にする
+        self._reset_saved_state(os.path.abspath(
+            container_path if os.path.isfile(container_path) else glyph_dir))
+        self._project_folder = folder_path
+        self._open_journal(folder_path)  # [ADD] 2026-10-19: 復元は journal_pending / recover_from_journal で
 
         # [ADD] 2025-10-23: 偏旁エディタ用パーツデータを読み込む
         # 保存時に parts ディレクトリに保存されていれば読み出す
-        self.parts = {}
+        # [MOD] 2026-10-19: metadata.json にパーツ表があればコンテナから読む
         parts_dir = os.path.join(folder_path, 'parts')
-        if os.path.isdir(parts_dir):
+        parts_meta: Any = {}
+        part_files = []
+        if isinstance(meta.get('parts'), dict) and isinstance(self._container, GlyphContainer):
+            self._set_container_parts(self._container, meta['parts'])
+        elif os.path.isdir(parts_dir):
             # メタデータを読み込む
             meta_path = os.path.join(parts_dir, 'metadata.json')
-            parts_meta = {}
             if os.path.isfile(meta_path):
                 try:
                     with open(meta_path, 'r', encoding='utf-8') as pf:
                         parts_meta = json.load(pf)
                 except Exception:
                     parts_meta = {}
-            # 個々のパーツ画像を読み込み、辞書に格納
-            for fname in os.listdir(parts_dir):
-                if not fname.lower().endswith('.png'):
-                    continue
-                part_name = os.path.splitext(fname)[0]
-                img_path = os.path.join(parts_dir, fname)
-                try:
-                    img = Image.open(img_path).convert('L')
-                except Exception:
-                    continue
-                # メタデータを取得（存在しない場合は空辞書）
-                meta = parts_meta.get(part_name, {}) if isinstance(parts_meta, dict) else {}
-                self.parts[part_name] = {'image': img, 'meta': meta}
+            part_files = [(fname, os.path.join(parts_dir, fname)) for fname in os.listdir(parts_dir)]
+            self._set_parts(parts_meta, part_files)
+        else:
+            self.parts = {}
+
+        if not lazy:
+            self._load_all_glyphs(progress)
+
+    def load_archive(self, archive_path: str, lazy: bool = True,
+                     progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """
+        単一ファイル (.fprojz) を展開せずに読み込む (2026-10-19: 新規追加)
+        グリフPNGはアーカイブのメンバーから初回アクセス時に直接復号する。
+        glyphs.fgc を含むアーカイブはそのメンバーだけ一時ファイルへ取り出してコンテナとして開く
+        """
+        archive = ProjectArchive(archive_path)
+        try:
+            meta = json.loads(archive.read_member('metadata.json').decode('utf-8'))
+            parts_raw = archive.read_member('parts/metadata.json')
+            parts_meta = json.loads(parts_raw.decode('utf-8')) if parts_raw else {}
+            part_files = [(name, io.BytesIO(archive.read_member('parts/' + name)))
+                          for name in archive.list_members('parts/')]
+        except Exception:
+            archive.close()
+            raise
+        self._release_lazy_sources()
+        self._open_journal(None)  # アーカイブにはジャーナルを置かない
+        edited, mappings = self._apply_metadata(meta)
+
+        self.glyphs.clear()
+        if archive.member(GlyphContainer.FILENAME) is not None:
+            fd, tmp_path = tempfile.mkstemp(prefix='fproj_', suffix='.fgc')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    archive.copy_member(GlyphContainer.FILENAME, f)
+                container = GlyphContainer.open(tmp_path)
+            except Exception:
+                os.remove(tmp_path)
+                raise
+            finally:
+                archive.close()
+            self._temp_paths.append(tmp_path)
+            self._add_container_glyphs(container, edited, mappings)
+            if isinstance(meta.get('parts'), dict):
+                parts_meta, part_files = None, []
+                self._set_container_parts(container, meta['parts'])
+        else:
+            for codepoint in sorted(archive.entries):
+                loader = partial(self._read_container_glyph, archive, codepoint)
+                self._add_lazy_glyph(codepoint, loader, edited, mappings, source=archive)
+            self._add_emptied_glyphs(edited)
+            self._container = archive
+
+        # アーカイブへの差分保存はできないので、次の .fproj 保存は全体保存
+        self._reset_saved_state(None)
+        self._project_folder = None
+        if parts_meta is not None:
+            self._set_parts(parts_meta, part_files)
+
+        if not lazy:
+            self._load_all_glyphs(progress)
+
+    def _apply_metadata(self, meta: Dict[str, Any]) -> Tuple[Set[int], Dict[str, str]]:
+        """metadata.json の内容を反映し、(編集済みコード, マッピング) を返す (2026-10-19: load_projectから分離)"""
+        self.font_path = meta.get('font_path')
+        self.original_ttf_path = meta.get('original_ttf_path')
+        cr = meta.get('char_range')
+        if isinstance(cr, list) and len(cr) == 2:
+            self.char_range = (int(cr[0]), int(cr[1]))
+        
+        # [ADD] 2025-01-15: マッピング情報を読込
+        self.glyph_mappings = {}
+        mappings = meta.get('glyph_mappings', {})
+        return set(meta.get('edited_codes', [])), mappings
+
+    def _add_lazy_glyph(self, codepoint: int, loader: Callable[[], Optional[Image.Image]],
+                        edited: Set[int], mappings: Dict[str, str], is_empty: bool = False,
+                        is_edited: bool = False, source: Any = None) -> None:
+        """遅延読み込みグリフを登録 (2026-10-19: 新規追加)"""
+        glyph = GlyphData.lazy(codepoint, loader, is_empty=is_empty,
+                               is_edited=is_edited or codepoint in edited, source=source)
+        # [ADD] 2025-01-15: マッピングを設定
+        if str(codepoint) in mappings:
+            glyph.set_mapping(mappings[str(codepoint)])
+        self.glyphs[codepoint] = glyph
+
+    def _add_container_glyphs(self, container: GlyphContainer, edited: Set[int], mappings: Dict[str, str]) -> None:
+        """コンテナの全エントリを遅延読み込みグリフとして登録 (2026-10-19: 新規追加)"""
+        for codepoint, (_offset, length, _version, flags, _digest) in container.entries.items():
+            if flags & GlyphContainer.FLAG_PART:
+                continue
+            loader = partial(self._read_container_glyph, container, codepoint)
+            self._add_lazy_glyph(codepoint, loader, edited, mappings, is_empty=not length,
+                                 is_edited=bool(flags & GlyphContainer.FLAG_EDITED), source=container)
+        self._container = container
+
+    def _add_emptied_glyphs(self, edited: Set[int]) -> None:
+        """フォルダ形式: PNGが無い編集済みコードは「空白にした」グリフ (2026-10-19: 新規追加)"""
+        for codepoint in edited:
+            if codepoint not in self.glyphs:
+                self.glyphs[codepoint] = GlyphData(codepoint, None, is_edited=True)
+
+    def _reset_saved_state(self, target: Optional[str]) -> None:
+        """読み込んだ状態を差分保存・未保存判定の基準にする (2026-10-19: 新規追加)"""
+        self._changed_codes.clear()
+        self._saved_versions = {code: g.version for code, g in self.glyphs.items()}
+        self._saved_target = target
+        self._saved_meta = None
+        self._clean_version = GlyphData.next_version()
+
+    def _set_parts(self, parts_meta: Any, part_files: List[Tuple[str, Any]]) -> None:
+        """パーツ画像（パスまたはファイルオブジェクト）を読み込んで self.parts に格納 (2025-10-23 / 2026-10-19: 分離)"""
+        self.parts = {}
+        # 個々のパーツ画像を読み込み、辞書に格納
+        for fname, src in part_files:
+            if not fname.lower().endswith('.png'):
+                continue
+            part_name = os.path.splitext(fname)[0]
+            try:
+                if hasattr(src, 'read'):
+                    data = src.read()
+                else:
+                    with open(src, 'rb') as f:
+                        data = f.read()
+                img = self._decode_shared(data)
+            except Exception:
+                continue
+            # メタデータを取得（存在しない場合は空辞書）
+            meta = parts_meta.get(part_name, {}) if isinstance(parts_meta, dict) else {}
+            self.parts[part_name] = {'image': img, 'meta': meta}
+
+    def _set_container_parts(self, container: GlyphContainer, manifest: Dict[str, Any]) -> None:
+        """コンテナに格納したパーツ画像を読み込んで self.parts に格納 (2026-10-19: 新規追加)"""
+        self.parts = {}
+        for part_name, info in manifest.items():
+            try:
+                blob = container.read(int(info['code']))
+                img = self._decode_shared(blob) if blob else None
+            except Exception:
+                continue
+            if img is not None:
+                self.parts[part_name] = {'image': img, 'meta': info.get('meta', {})}
+
+    def _load_all_glyphs(self, progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """未復号グリフを一括復号（並列）し、読み込み元を閉じる (2026-10-19: 新規追加)"""
+        pending = [(code, g) for code, g in sorted(self.glyphs.items()) if not g.is_loaded]
+        try:
+            self._run_glyph_io(lambda item: item[1].load(strict=True), pending, progress)
+        finally:
+            self._release_lazy_sources()
+
+    @staticmethod
+    def _code_from_filename(name: str) -> Optional[int]:
+        """'U+XXXX.png' からコードポイントを得る（5桁以上にも対応） (2026-10-19: 新規追加)"""
+        if not name.lower().endswith('.png') or not name.upper().startswith('U+'):
+            return None
+        try:
+            return int(name[2:-4], 16)
+        except ValueError:
+            return None
+
+    def write_archive(self, plan: 'SavePlan', dest: str,
+                      progress: Optional[Callable[[int, int], None]] = None) -> None:
+        """
+        スナップショットを単一ファイル (.fprojz) へ直接書く（ワーカースレッド可） (2026-10-19: 新規追加)
+        一時フォルダを経由せず、グリフPNGは圧縮済みなので無圧縮メンバー (ZIP_STORED) として格納する。
+        plan は plan_save(dest, storage='folder', mark_saved=False) で作る（中身はフォルダ形式と同じ配置）
+        """
+        root = ProjectArchive.ROOT
+        tmp_path = dest + '.tmp'
+        total = len(plan.updated)
+        chunk = max(1, Config.PROJECT_IO_WORKERS) * 64  # 同時にメモリへ載せるPNGを抑える
+        try:
+            with zipfile.ZipFile(tmp_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+                for start in range(0, total, chunk):
+                    batch = plan.updated[start:start + chunk]
+                    blobs = self._run_glyph_io(self._glyph_blob, batch)
+                    for item, blob in zip(batch, blobs):
+                        if blob:
+                            zf.writestr(f'{root}/glyphs/U+{item[0]:04X}.png', blob,
+                                        compress_type=zipfile.ZIP_STORED)
+                    if progress:
+                        progress(start + len(batch), total)
+                zf.writestr(f'{root}/metadata.json', plan.meta_text)
+
+                # [ADD] 2025-10-23: 偏旁エディタ用パーツデータ
+                parts_meta = {}
+                for name, info in plan.parts.items():
+                    img = info.get('image')
+                    if img is None:
+                        continue
+                    try:
+                        zf.writestr(f'{root}/parts/{name}.png', self._encode_glyph(img),
+                                    compress_type=zipfile.ZIP_STORED)
+                    except Exception:
+                        continue
+                    parts_meta[name] = info.get('meta', {})
+                if parts_meta:
+                    zf.writestr(f'{root}/parts/metadata.json',
+                                json.dumps(parts_meta, ensure_ascii=False, indent=2))
+            source = self._container
+            if isinstance(source, ProjectArchive) and os.path.abspath(source.path) == os.path.abspath(dest):
+                # [MOD] 2026-10-19: 読み込み元のアーカイブを開いたまま置き換える（全グリフを復号しない）
+                source.replace(tmp_path)
+            else:
+                os.replace(tmp_path, dest)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _run_glyph_io(self, func: Callable[[Tuple[int, Any]], Any],
+                      items: List[Tuple[int, Any]],
+                      progress: Optional[Callable[[int, int], None]] = None) -> List[Any]:
+        """
+        グリフ単位のI/O（PNG圧縮・展開）をスレッドプールで並列実行 (2026-10-19: 新規追加)
+        Pillowは圧縮・展開中にGILを解放するため、スレッド数に応じて速くなる。
+        items は (コードポイント, 値) のリスト。結果と progress(現在数, 総数) は items の順、
+        失敗は全件処理後に ProjectIOError としてまとめて送出する
+        [MOD] 2026-10-19: 一度に投入するのは一定数まで（処理待ちのタスクと結果でメモリを使い切らない）
+        """
+        total = len(items)
+        results: List[Any] = [None] * total
+        errors: List[Tuple[int, Exception]] = []
+        workers = max(1, Config.PROJECT_IO_WORKERS)
+        chunk = workers * 64
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='glyph-io') as pool:
+            for start in range(0, total, chunk):
+                futures = [pool.submit(func, item) for item in items[start:start + chunk]]
+                for i, future in enumerate(futures, start):
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        errors.append((items[i][0], e))
+                    if progress:
+                        progress(i + 1, total)
+        if errors:
+            raise ProjectIOError(f'{len(errors)} 文字のグリフ処理に失敗しました', errors)
+        return results
+
+    @staticmethod
+    def _encode_glyph(bitmap: Image.Image) -> bytes:
+        """グリフ画像をPNGバイト列にする (2026-10-19: 新規追加)"""
+        buf = io.BytesIO()
+        bitmap.save(buf, 'PNG', compress_level=Config.PNG_COMPRESS_LEVEL)
+        return buf.getvalue()
+
+    @classmethod
+    def _write_png_glyph(cls, glyph_dir: str, item: Tuple[int, GlyphData, int, bool]) -> Optional[bytes]:
+        """
+        フォルダ形式: 1グリフをPNGファイルに書き出す（空白グリフはファイルを置かない） (2026-10-19: 新規追加)
+        [MOD] 2026-10-19: 書いたPNGの内容ハッシュを返す（索引用。空白ならNone）
+        [MOD] 2026-10-19: 未復号のグリフは格納済みPNGをそのまま書く（復号・再圧縮しない）
+        """
+        code = item[0]
+        blob = cls._glyph_blob(item)
+        fn = os.path.join(glyph_dir, f'U+{code:04X}.png')
+        if blob is None:
+            if os.path.exists(fn):
+                os.remove(fn)  # 差分保存で空白になったグリフ
+            return None
+        with open(fn, 'wb') as f:
+            f.write(blob)
+        return GlyphContainer.content_hash(blob)
+
+    @staticmethod
+    def _decode_glyph(blob: bytes) -> Image.Image:
+        """PNGバイト列からグリフ画像（'L'）を復元 (2026-10-19: 新規追加)"""
+        img = Image.open(io.BytesIO(blob))
+        return img.convert('L') if img.mode != 'L' else img.copy()
+
+    def _decode_shared(self, blob: bytes) -> Image.Image:
+        """
+        PNGバイト列を復号（同じ内容の画像が既にあればそれを共有する） (2026-10-19: 新規追加)
+        グリフ画像は不変値として扱う（編集時はコピーする）ので共有してよい
+        """
+        key = GlyphContainer.content_hash(blob)
+        img = self._decoded.get(key)
+        if img is None:
+            img = self._decode_glyph(blob)
+            self._decoded[key] = img
+        return img
+
+    def _read_container_glyph(self, container: Any, code: int) -> Optional[Image.Image]:
+        """
+        コンテナから1グリフを読み出して復号（遅延読み込み用） (2026-10-19: 新規追加)
+        [MOD] 2026-10-19: ProjectArchive・GlyphFolder など read(code) を持つ読み込み元にも使う
+        """
+        blob = container.read(code)
+        return self._decode_shared(blob) if blob else None
+
+    def _rebind_lazy_glyphs(self, plan: 'SavePlan', old_source: Any, source: Any) -> None:
+        """old_source を読み込み元とする未復号グリフを source へ付け替える (2026-10-19: 新規追加)"""
+        glyphs = {id(g): g for g in list(plan.glyphs.values()) + list(self.glyphs.values())}
+        for glyph in glyphs.values():
+            if isinstance(glyph, GlyphData):
+                glyph.rebind(old_source, partial(self._read_container_glyph, source, glyph.char_code), source)
+
+    def prefetch_glyphs(self, codes: Any) -> None:
+        """
+        指定コードの未復号グリフを先読みスレッドで復号 (2026-10-19: 新規追加)
+        表示側はそのまま bitmap を参照すればよい（復号中なら完了を待つ）
+        """
+        pending = [g for g in (self.glyphs.get(c) for c in codes) if g is not None and not g.is_loaded]
+        if not pending:
+            return
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(
+                max_workers=max(1, Config.PROJECT_IO_WORKERS),
+                thread_name_prefix='glyph-prefetch'
+            )
+        for glyph in pending:
+            self._prefetch_pool.submit(glyph.load)
+
+    def _release_lazy_sources(self) -> None:
+        """先読みを打ち切り、遅延読み込み元のコンテナを閉じる (2026-10-19: 新規追加)"""
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=True, cancel_futures=True)
+            self._prefetch_pool = None
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+        # [ADD] 2026-10-19: 別のプロジェクトの変換結果を持ち越さない
+        for cache in self._outline_caches.values():
+            cache.close()
+        self._outline_caches.clear()
+        # アーカイブから取り出した一時ファイル
+        for path in self._temp_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._temp_paths = []
+
+    @classmethod
+    def _glyph_blob(cls, item: Tuple[int, GlyphData, int, bool]) -> Optional[bytes]:
+        """書き込むPNGバイト列（未復号のグリフは格納済みPNGをそのまま使い、復号・再圧縮しない） (2026-10-19: 新規追加)"""
+        glyph = item[1]
+        blob = glyph.stored_blob() if isinstance(glyph, GlyphData) else None
+        if blob:
+            return blob
+        bmp = getattr(glyph, 'bitmap', None)
+        return None if bmp is None else cls._encode_glyph(bmp)
+
+    def _part_items(self, plan: 'SavePlan') -> List[Tuple[int, bytes, int, int]]:
+        """コンテナ書き込み用のパーツ画像の (コード, ブロブ, 版, フラグ) を作成 (2026-10-19: 新規追加)"""
+        items = []
+        for name, code in plan.part_codes.items():
+            try:
+                blob = self._encode_glyph(plan.parts[name]['image'])
+            except Exception:
+                continue  # 従来どおり書けないパーツは飛ばす
+            items.append((code, blob, 0, GlyphContainer.FLAG_PART))
+        return items
+
+    def _container_items(self, glyphs: List[Tuple[int, GlyphData, int, bool]],
+                         progress: Optional[Callable[[int, int], None]] = None) -> Iterator[Tuple[int, Optional[bytes], int, int]]:
+        """
+        コンテナ書き込み用の (コード, ブロブ, 版, フラグ) を作成（PNG圧縮は並列） (2026-10-19: 新規追加)
+        glyphs は plan_save で控えた (コード, グリフ, 版, 編集済み) のリスト
+        [MOD] 2026-10-19: 一定数ずつ作って順に返すジェネレーター（write_archive と同じく、
+        同時にメモリへ載せるブロブを抑える。失敗はその区切りの分をまとめて送出）
+        """
+        total = len(glyphs)
+        chunk = max(1, Config.PROJECT_IO_WORKERS) * 64
+        for start in range(0, total, chunk):
+            batch = glyphs[start:start + chunk]
+            blobs = self._run_glyph_io(self._glyph_blob, batch)
+            for (code, _glyph, version, edited), blob in zip(batch, blobs):
+                flags = GlyphContainer.FLAG_EDITED if edited else 0
+                if blob is None:
+                    flags |= GlyphContainer.FLAG_EMPTY
+                yield code, blob, version, flags
+            if progress:
+                progress(start + len(batch), total)
 
     def set_range(self, range_name: str):
         """文字範囲を設定（表示フィルタのみ、データは保持）"""
@@ -370,7 +2422,13 @@ class FontProject:
     def mark_as_edited(self, char_code: int):
         """グリフを編集済みとしてマーク"""
         if char_code in self.glyphs:
-            self.glyphs[char_code].is_edited = True
+            glyph = self.glyphs[char_code]
+            was_edited = glyph.is_edited
+            glyph.is_edited = True
+            glyph.touch()  # [ADD] 2026-10-19: 差分保存の対象にする
+            self._changed_codes.add(char_code)
+            if not was_edited:
+                self._journal_edit(char_code, glyph)
     
     def get_edited_glyphs(self) -> list:
         """編集済みグリフのリストを取得"""
@@ -400,7 +2458,22 @@ class FontProject:
 
 class FontRenderer:
     """フォントレンダリング処理"""
-    
+
+    # [ADD] 2026-10-19: UIスレッドで使い回すフォントフェイスの共有キャッシュ
+    # キーは (フォントパス, サイズ)。FreeTypeFontはスレッドセーフではないため、
+    # バックグラウンドローダーでは使用せずUIスレッド専用とする。
+    _shared_fonts: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
+
+    @staticmethod
+    def get_shared_font(font_path: str, size: int) -> ImageFont.FreeTypeFont:
+        """共有フォントフェイスを取得（未読込なら読み込んでキャッシュ） (2026-10-19: 新規追加)"""
+        key = (font_path, size)
+        font = FontRenderer._shared_fonts.get(key)
+        if font is None:
+            font = ImageFont.truetype(font_path, size=size)
+            FontRenderer._shared_fonts[key] = font
+        return font
+
     @staticmethod
     def load_font(
         font_path: str, 
@@ -583,6 +2656,8 @@ class GridView(tk.Frame):
         
         # フィルタ適用
         filtered = []
+        # [ADD] 2026-10-19: 最近の変更は索引（保存済み）と変更記録（未保存）から求める
+        recent = self.project.recently_changed(Config.RECENT_FILTER_HOURS) if self.filter == 'recent' else set()
         for code in char_codes:
             g = self.project.glyphs.get(code)
             if self.filter == 'all':
@@ -599,8 +2674,14 @@ class GridView(tk.Frame):
             elif self.filter == 'defined':
                 if g and not g.is_empty:
                     filtered.append(code)
+            elif self.filter == 'recent':
+                if code in recent:
+                    filtered.append(code)
         char_codes = filtered
 
+        # [ADD] 2026-10-19: 表示範囲のグリフを並列に先読み（遅延読み込みプロジェクト用）
+        self.project.prefetch_glyphs(char_codes)
+
         for idx, code in enumerate(char_codes):
             row = idx // columns
             col = idx % columns
@@ -781,44 +2862,399 @@ class GridView(tk.Frame):
                 dialog.destroy()
                 messagebox.showinfo('設定完了', f'U+{char_code:04X} に「{mapping}」を設定しました')
             else:
-                messagebox.showwarning('警告', '読みを入力してください')
-        
-        button_frame = tk.Frame(dialog)
-        button_frame.pack(pady=10)
-        
-        tk.Button(button_frame, text='設定', command=apply, width=10).pack(side='left', padx=5)
-        tk.Button(button_frame, text='キャンセル', command=dialog.destroy, width=10).pack(side='left', padx=5)
-        
-        entry.bind('<Return>', lambda e: apply())
-        dialog.bind('<Escape>', lambda e: dialog.destroy())
-    
-    def _clear_glyph_mapping(self, char_code: int) -> None:
-        """グリフマッピングをクリア (2025-01-15: 新規追加)"""  # [ADD]
-        if messagebox.askyesno('確認', f'U+{char_code:04X} のマッピングを解除しますか？'):
-            glyph = self.project.glyphs.get(char_code)
-            if glyph:
-                glyph.set_mapping(None)
-                if char_code in self.project.glyph_mappings:
-                    del self.project.glyph_mappings[char_code]
-            self.refresh()
-            messagebox.showinfo('解除完了', f'U+{char_code:04X} のマッピングを解除しました')
+                messagebox.showwarning('警告', '読みを入力してください')
+        
+        button_frame = tk.Frame(dialog)
+        button_frame.pack(pady=10)
+        
+        tk.Button(button_frame, text='設定', command=apply, width=10).pack(side='left', padx=5)
+        tk.Button(button_frame, text='キャンセル', command=dialog.destroy, width=10).pack(side='left', padx=5)
+        
+        entry.bind('<Return>', lambda e: apply())
+        dialog.bind('<Escape>', lambda e: dialog.destroy())
+    
+    def _clear_glyph_mapping(self, char_code: int) -> None:
+        """グリフマッピングをクリア (2025-01-15: 新規追加)"""  # [ADD]
+        if messagebox.askyesno('確認', f'U+{char_code:04X} のマッピングを解除しますか？'):
+            glyph = self.project.glyphs.get(char_code)
+            if glyph:
+                glyph.set_mapping(None)
+                if char_code in self.project.glyph_mappings:
+                    del self.project.glyph_mappings[char_code]
+            self.refresh()
+            messagebox.showinfo('解除完了', f'U+{char_code:04X} のマッピングを解除しました')
+
+# ===== [BLOCK4-END] =====
+
+
+
+
+
+
+
+
+
+
+
+# ===== [BLOCK5-BEGIN] 編集エディタGUI (2025-10-13: 基本部分) =====
+
+class TiledPreview:
+    """
+    ズーム後のプレビューを固定サイズのタイルに分割して表示するレイヤー (2026-10-19: 新規追加)
+
+    タイル毎に長寿命のPhotoImageとキャンバス項目を保持し、元画像の該当領域が
+    前回から変化したタイルだけをPhotoImage.pasteでその場更新する。
+    表示範囲外のタイルは破棄し、メモリ使用量を可視領域程度に抑える。
+    """
+
+    TAG = 'tile'
+
+    def __init__(self, canvas: tk.Canvas, tile_size: int = Config.PREVIEW_TILE_SIZE) -> None:
+        self.canvas = canvas
+        self.tile_size = max(16, int(tile_size))
+        # (tx, ty) -> {'photo', 'item', 'src', 'resample'}
+        self._tiles: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        self._zoom: Optional[float] = None
+        self._source: Optional[Image.Image] = None
+        self._resample: int = Image.NEAREST
+
+    def reset(self) -> None:
+        """全タイルを破棄（ズーム変更時など）"""
+        self.canvas.delete(self.TAG)
+        self._tiles.clear()
+
+    def _zoomed_size(self) -> Tuple[int, int]:
+        w, h = self._source.size
+        return max(1, int(w * self._zoom)), max(1, int(h * self._zoom))
+
+    def _visible_range(self) -> Tuple[int, int, int, int]:
+        """表示中のタイル範囲 (tx0, ty0, tx1, ty1) を返す（終端は含まない）"""
+        zw, zh = self._zoomed_size()
+        nx = (zw + self.tile_size - 1) // self.tile_size
+        ny = (zh + self.tile_size - 1) // self.tile_size
+        try:
+            x0 = self.canvas.canvasx(0)
+            y0 = self.canvas.canvasy(0)
+            vw = self.canvas.winfo_width()
+            vh = self.canvas.winfo_height()
+        except tk.TclError:
+            return 0, 0, nx, ny
+        if vw <= 1 or vh <= 1:
+            # ウィンドウ生成中はサイズ未確定のため全タイルを対象にする
+            return 0, 0, nx, ny
+        tx0 = max(0, int(x0 // self.tile_size))
+        ty0 = max(0, int(y0 // self.tile_size))
+        tx1 = min(nx, int((x0 + vw) // self.tile_size) + 1)
+        ty1 = min(ny, int((y0 + vh) // self.tile_size) + 1)
+        return tx0, ty0, tx1, ty1
+
+    def render(
+        self,
+        source: Image.Image,
+        zoom: float,
+        resample: int = Image.LANCZOS,
+        dirty: Optional[Tuple[int, int, int, int]] = None
+    ) -> List[Tuple[int, int, int, int]]:
+        """
+        元画像をズームして表示する
+
+        Args:
+            source: キャンバスサイズの表示用画像
+            zoom: ズーム倍率
+            resample: リサンプリングフィルタ
+            dirty: 変更があった元画像上の領域 (x0, y0, x1, y1)。
+                   指定時はこの領域に掛からないタイルの比較を省略する。
+
+        Returns:
+            再描画したタイルの元画像上の領域リスト
+        """
+        if zoom != self._zoom or (self._source is not None and source.size != self._source.size):
+            self.reset()
+        self._source = source
+        self._zoom = zoom
+        self._resample = resample
+        return self._paint(dirty)
+
+    def refresh_visible(self) -> List[Tuple[int, int, int, int]]:
+        """スクロール等で新たに見えたタイルを描画（既存タイルは比較しない）"""
+        if self._source is None:
+            return []
+        return self._paint((0, 0, 0, 0))
+
+    def _paint(self, dirty: Optional[Tuple[int, int, int, int]]) -> List[Tuple[int, int, int, int]]:
+        source = self._source
+        zoom = self._zoom
+        ts = self.tile_size
+        zw, zh = self._zoomed_size()
+        # ズーム後座標 -> 元画像座標 の倍率（全体リサイズと同じ対応にする）
+        sx = source.width / zw
+        sy = source.height / zh
+        # フィルタの参照範囲分だけ比較領域を広げる
+        margin = 1 if self._resample == Image.NEAREST else int(3 / min(zoom, 1.0)) + 1
+
+        tx0, ty0, tx1, ty1 = self._visible_range()
+        visible = set()
+        changed: List[Tuple[int, int, int, int]] = []
+        created = False
+
+        for ty in range(ty0, ty1):
+            for tx in range(tx0, tx1):
+                key = (tx, ty)
+                visible.add(key)
+                zx0, zy0 = tx * ts, ty * ts
+                zx1, zy1 = min(zw, zx0 + ts), min(zh, zy0 + ts)
+                box = (zx0 * sx, zy0 * sy, zx1 * sx, zy1 * sy)
+                src_box = (
+                    max(0, int(box[0]) - margin), max(0, int(box[1]) - margin),
+                    min(source.width, int(box[2] + 0.999) + margin),
+                    min(source.height, int(box[3] + 0.999) + margin),
+                )
+                tile = self._tiles.get(key)
+
+                if tile is not None and tile['resample'] == self._resample:
+                    if dirty is not None and not self._intersects(src_box, dirty):
+                        continue
+                    src = source.crop(src_box)
+                    if ImageChops.difference(src, tile['src']).getbbox() is None:
+                        continue
+                else:
+                    src = source.crop(src_box)
+
+                zoomed = source.resize((zx1 - zx0, zy1 - zy0), self._resample, box=box)
+                if tile is None:
+                    photo = ImageTk.PhotoImage(zoomed)
+                    item = self.canvas.create_image(zx0, zy0, anchor='nw', image=photo, tags=self.TAG)
+                    tile = {'photo': photo, 'item': item}
+                    self._tiles[key] = tile
+                    created = True
+                else:
+                    tile['photo'].paste(zoomed)
+                tile['src'] = src
+                tile['resample'] = self._resample
+                changed.append(src_box)
+
+        # 表示範囲外のタイルは破棄
+        for key in [k for k in self._tiles if k not in visible]:
+            self.canvas.delete(self._tiles.pop(key)['item'])
+
+        # 新規タイルはオーバーレイより下に配置
+        if created:
+            self.canvas.tag_lower(self.TAG)
+        return changed
+
+
+    @staticmethod
+    def _intersects(a: Tuple[int, int, int, int], b: Tuple[int, int, int, int]) -> bool:
+        """矩形 (x0, y0, x1, y1) 同士が重なるか"""
+        return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+class InkTracker:
+    """
+    編集画像のインク範囲（255未満の画素）を変更領域から差分更新で保持する (2026-10-19: 新規追加)
+
+    インクの有無を0/1のマスク画像として控えておき、変更領域だけ数え直して
+    行・列ごとのインク画素数（ヒストグラム）を更新する。外接矩形はヒストグラムの
+    両端を探すだけで求まる。numpyが無い環境ではマスク画像のgetbboxで求める。
+    """
+
+    # 255未満 -> 1（インク）, 255 -> 0（透過）
+    INK_LUT = [1] * 255 + [0]
+
+    def __init__(self) -> None:
+        self._mask: Optional[Image.Image] = None
+        self.rows: Optional[Any] = None  # 行ごとのインク画素数 (numpy配列)
+        self.cols: Optional[Any] = None  # 列ごとのインク画素数 (numpy配列)
+        self._bbox: Optional[Tuple[int, int, int, int]] = None
+        self._bbox_valid = False
+
+    def reset(self, image: Image.Image) -> None:
+        """画像全体からマスクとヒストグラムを作り直す"""
+        self._mask = image.point(self.INK_LUT)
+        if np is not None:
+            arr = np.asarray(self._mask, dtype=np.int32)
+            self.rows = arr.sum(axis=1)
+            self.cols = arr.sum(axis=0)
+        self._bbox_valid = False
+
+    def update(self, image: Image.Image, box: Optional[Tuple[int, int, int, int]]) -> None:
+        """変更領域boxのみマスクとヒストグラムを更新（boxがNoneなら変更なし）"""
+        if self._mask is None or self._mask.size != image.size:
+            self.reset(image)
+            return
+        if not box:
+            return
+        region = image.crop(box).point(self.INK_LUT)
+        if np is not None:
+            new = np.asarray(region, dtype=np.int32)
+            old = np.asarray(self._mask.crop(box), dtype=np.int32)
+            x0, y0, x1, y1 = box
+            self.rows[y0:y1] += new.sum(axis=1) - old.sum(axis=1)
+            self.cols[x0:x1] += new.sum(axis=0) - old.sum(axis=0)
+        self._mask.paste(region, box[:2])
+        self._bbox_valid = False
+
+    def sync(self, image: Image.Image) -> None:
+        """控えのマスクと比較して変更領域を求め、差分更新する"""
+        if self._mask is None or self._mask.size != image.size:
+            self.reset(image)
+            return
+        self.update(image, ImageChops.difference(image.point(self.INK_LUT), self._mask).getbbox())
+
+    def bbox(self) -> Optional[Tuple[int, int, int, int]]:
+        """インク全体の外接矩形 (x0, y0, x1, y1)。インクが無ければNone"""
+        if self._mask is None:
+            return None
+        if not self._bbox_valid:
+            if self.rows is not None:
+                ys = np.flatnonzero(self.rows)
+                xs = np.flatnonzero(self.cols)
+                self._bbox = None if ys.size == 0 else (int(xs[0]), int(ys[0]), int(xs[-1]) + 1, int(ys[-1]) + 1)
+            else:
+                self._bbox = self._mask.getbbox()
+            self._bbox_valid = True
+        return self._bbox
 
-# ===== [BLOCK4-END] =====
+    def bbox_in(self, box: Tuple[int, int, int, int]) -> Optional[Tuple[int, int, int, int]]:
+        """指定領域内のインク外接矩形（キャンバス座標）。インクが無ければNone"""
+        if self._mask is None:
+            return None
+        inner = self._mask.crop(box).getbbox()
+        if not inner:
+            return None
+        return (box[0] + inner[0], box[1] + inner[1], box[0] + inner[2], box[1] + inner[3])
+
+
+class EditHistory:
+    """
+    差分方式のアンドゥ/リドゥ履歴 (2026-10-19: 新規追加)
+
+    状態毎に全体画像を複製せず、直前の状態から変化した矩形領域の前後の内容だけを保持する。
+    非アクティブなグリフの履歴はcompactで現在画像・差分ともzlib圧縮して保持する。
+    [MOD] 2026-10-19: 状態ごとの番号 position と、保存した時点の番号を持つ（アンドゥで保存時に戻ったかの判定用）
+    """
 
+    _positions = itertools.count(1)  # 全履歴共通の状態番号（作り直しても重複しない）
 
+    def __init__(self, image: Image.Image, limit: int = 50) -> None:
+        self.limit = limit
+        self._mode = image.mode
+        self._size = image.size
+        self._current: Optional[Image.Image] = image.copy()
+        self._packed: Optional[bytes] = None
+        # (領域, 変更前, 変更後, 変更前の状態番号, 変更後の状態番号)。変更前/後はImageまたは圧縮済みタプル
+        self._undo: List[Tuple[Tuple[int, int, int, int], Any, Any, int, int]] = []
+        self._redo: List[Tuple[Tuple[int, int, int, int], Any, Any, int, int]] = []
+        self.position = next(EditHistory._positions)  # 現在の状態の番号
+        self.saved_position = self.position  # 保存（プロジェクトへ反映）した状態の番号
 
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
 
+    @property
+    def is_saved(self) -> bool:
+        """現在の状態が保存した状態と同じか (2026-10-19: 新規追加)"""
+        return self.position == self.saved_position
+
+    def mark_saved(self) -> None:
+        """現在の状態を保存した状態として記録 (2026-10-19: 新規追加)"""
+        self.saved_position = self.position
+
+    def current(self) -> Image.Image:
+        """最後に確定した状態の複製を返す"""
+        self.expand()
+        return self._current.copy()
+
+    def commit(self, image: Image.Image) -> bool:
+        """画像を新しい状態として確定する。変化が無ければ何もせずFalse"""
+        self.expand()
+        if image.size != self._size or image.mode != self._mode:
+            # サイズが変わった場合は差分を取れないため履歴を作り直す
+            saved = self.saved_position
+            self.__init__(image, self.limit)
+            self.saved_position = saved
+            return True
+        box = ImageChops.difference(image, self._current).getbbox()
+        if not box:
+            return False
+        after = image.crop(box)
+        position = next(EditHistory._positions)
+        self._undo.append((box, self._current.crop(box), after, self.position, position))
+        self.position = position
+        self._current.paste(after, box[:2])
+        if len(self._undo) > self.limit:
+            self._undo.pop(0)
+        self._redo.clear()
+        return True
 
+    def undo(self) -> Image.Image:
+        """1つ前の状態に戻し、その画像の複製を返す"""
+        self.expand()
+        entry = self._undo.pop()
+        box, before, _after, self.position, _position = entry
+        self._current.paste(self._unpack(before), box[:2])
+        self._redo.append(entry)
+        return self._current.copy()
+
+    def redo(self) -> Image.Image:
+        """やり直し、その画像の複製を返す"""
+        self.expand()
+        entry = self._redo.pop()
+        box, _before, after, _position, self.position = entry
+        self._current.paste(self._unpack(after), box[:2])
+        self._undo.append(entry)
+        return self._current.copy()
+
+    def compact(self) -> None:
+        """非アクティブ時用に現在画像と差分を圧縮する"""
+        if self._current is None:
+            return
+        self._packed = zlib.compress(self._current.tobytes(), 1)
+        self._current = None
+        self._undo = [(box, self._pack(a), self._pack(b), *positions) for box, a, b, *positions in self._undo]
+        self._redo = [(box, self._pack(a), self._pack(b), *positions) for box, a, b, *positions in self._redo]
+
+    def expand(self) -> None:
+        """compactで圧縮した現在画像を展開する（差分は使用時に展開）"""
+        if self._current is not None:
+            return
+        self._current = Image.frombytes(self._mode, self._size, zlib.decompress(self._packed))
+        self._packed = None
 
+    @staticmethod
+    def _pack(img: Any) -> Any:
+        if isinstance(img, Image.Image):
+            return (img.mode, img.size, zlib.compress(img.tobytes(), 1))
+        return img
 
+    @staticmethod
+    def _unpack(data: Any) -> Image.Image:
+        if isinstance(data, Image.Image):
+            return data
+        mode, size, raw = data
+        return Image.frombytes(mode, size, zlib.decompress(raw))
 
 
+class GlyphSession:
+    """プール型エディタで開いているグリフ1件分の編集状態 (2026-10-19: 新規追加)"""
 
+    def __init__(self, char_code: int, history: EditHistory) -> None:
+        self.char_code = char_code
+        self.history = history
+        self.modified = False  # プロジェクトへ未反映の変更があるか
+        self.last_used = 0  # LRU判定用の使用順
 
-# ===== [BLOCK5-BEGIN] 編集エディタGUI (2025-10-13: 基本部分) =====
 
 class GlyphEditor(tk.Toplevel):
     """グリフ編集ウィンドウ(レイヤー方式テキスト挿入対応)"""
+
+    # [ADD] 2026-10-19: 背景チェック柄はエディタ間で共有する（キー: (キャンバスサイズ, タイル幅)）
+    _shared_bg: Dict[Tuple[int, int], Image.Image] = {}
     
     def __init__(
         self, 
@@ -858,11 +3294,22 @@ class GlyphEditor(tk.Toplevel):
 
         # [ADD] 2025-10-23: エッジ形状設定 ('sharp' または 'round')
         self.edge_style_var: tk.StringVar = tk.StringVar(value='sharp')
-        
+
+        # [ADD] 2026-10-19: テキストレイヤー描画キャッシュ
+        # _text_raster_cache: (テキスト, フォントパス, サイズ) → トリミング済みラスタ
+        # _text_edge_cache: (テキスト, フォントパス, サイズ, スタイル) → (レイヤー, プレビュー用マスク, コミット用マスク)
+        # _text_line_raster: 直前に描画した1行分のラスタ（追加入力分のみ描き足すために保持）
+        self._text_raster_cache: 'OrderedDict[Tuple[str, str, int], Image.Image]' = OrderedDict()
+        self._text_edge_cache: 'OrderedDict[Tuple[Any, ...], Tuple[Image.Image, Optional[Image.Image], Optional[Image.Image]]]' = OrderedDict()
+        self._text_line_raster: Optional[Dict[str, Any]] = None
+        self._text_layer_key: Optional[Tuple[Any, ...]] = None  # 現在のレイヤーの元になったキー（PNG読込時はNone）
+        self._text_render_after_id: Optional[str] = None  # デバウンス用のafter ID
+
         # アンドゥ・リドゥ用履歴
-        self.undo_stack: List[Image.Image] = []
-        self.redo_stack: List[Image.Image] = []
-        self._save_to_undo()
+        # [MOD] 2026-10-19: 差分方式の履歴とし、グリフ毎のセッションで保持する
+        self.history: EditHistory = EditHistory(self.edit_bitmap, Config.EDITOR_UNDO_LIMIT)
+        self._sessions: Dict[int, GlyphSession] = {char_code: GlyphSession(char_code, self.history)}
+        self._session_clock: int = 0
         
         # 描画ツール状態
         self.current_tool: str = 'pen'
@@ -919,8 +3366,26 @@ class GlyphEditor(tk.Toplevel):
         self.is_panning: bool = False
         self.pan_start: Optional[Tuple[int, int]] = None
         
-        # PhotoImage参照保持
-        self.photo: Optional[ImageTk.PhotoImage] = None
+        # [MOD] 2026-10-19: プレビューはタイル表示レイヤーが長寿命のPhotoImageを保持する
+        self._tile_view: Optional[TiledPreview] = None
+        self._scrollregion: Optional[Tuple[int, int, int, int]] = None
+        # [ADD] 2026-10-19: 前回表示した合成画像と背景合成済み画像（差分更新用）
+        self._display_composite: Optional[Image.Image] = None
+        self._display_merged: Optional[Image.Image] = None
+        # グリッド線を作成したズーム倍率（未作成ならNone）と表示状態
+        self._grid_zoom: Optional[float] = None
+        self._grid_visible: bool = False
+        # ナビゲーション表示用の縮小画像と表示範囲枠の座標
+        self._nav_image: Optional[Image.Image] = None
+        self._nav_rect_coords: Optional[Tuple[float, float, float, float]] = None
+        # [ADD] 2026-10-19: インク範囲の差分追跡（中央配置・整列で使用）
+        self._ink = InkTracker()
+        self._ink_fresh: bool = False  # Trueなら_inkは表示中の編集画像と一致
+        # 選択内容の貼り付けマスク（選択画像が変わった時のみ再生成）
+        self._selection_mask_img: Optional[Image.Image] = None
+        self._selection_mask_src: Optional[Image.Image] = None
+        # 移動プレビュー画像の元（選択画像, ズーム倍率）
+        self._move_photo_src: Optional[Tuple[Image.Image, float]] = None
         
         # ツールボタン管理
         self.tool_buttons: Dict[str, tk.Button] = {}
@@ -928,13 +3393,19 @@ class GlyphEditor(tk.Toplevel):
         # ドラッグ開始座標
         self.drag_start: Optional[Tuple[int, int]] = None
         
-        # ハンドル描画用ID保存
-        self.resize_handle_ids: List[int] = []
+        # [MOD] 2026-10-19: オーバーレイ項目（選択枠・ハンドル・ガイド等）は削除せず座標更新で再利用
+        self._overlay_items: Dict[str, int] = {}
+        self._overlay_opts: Dict[str, Dict[str, Any]] = {}
+        self._overlay_coords: Dict[str, Tuple[float, ...]] = {}
+        self._overlay_visible: Set[str] = set()
+        self._overlay_drawn: Set[str] = set()
+        self._persistent_overlays: Set[str] = set()
         
         self.title(f'編集: U+{char_code:04X}')
         self.geometry('1400x900')
         
         self._setup_ui()
+        self._refresh_tabs()
 
         # 初期化時に背景パターンを生成
         # パターンサイズは8px単位で作成し、全体用のタイルも生成する
@@ -969,11 +3440,9 @@ class GlyphEditor(tk.Toplevel):
         self.bind('<Down>', lambda e: self._nudge(0, 1))
     
     def _save_to_undo(self) -> None:
-        """現在の状態をアンドゥスタックに保存"""
-        self.undo_stack.append(self.edit_bitmap.copy())
-        if len(self.undo_stack) > 50:
-            self.undo_stack.pop(0)
-        self.redo_stack.clear()
+        """現在の状態をアンドゥ履歴に保存（変化した領域のみ）"""
+        if self.history.commit(self.edit_bitmap):
+            self._set_session_modified(True)
 
     # ===== 背景チェックパターン関連 =====
     def _create_bg_pattern(self, tile_size: int = 30) -> Image.Image:
@@ -1010,12 +3479,19 @@ class GlyphEditor(tk.Toplevel):
             return
         tile = self._bg_pattern
         w, h = Config.CANVAS_SIZE, Config.CANVAS_SIZE
-        bg = Image.new('L', (w, h), 255)
-        # タイルを繰り返し貼り付け
-        for y in range(0, h, tile.height):
-            for x in range(0, w, tile.width):
-                bg.paste(tile, (x, y))
+        # [MOD] 2026-10-19: 生成済みの背景は全エディタで共有（読み取り専用として扱う）
+        key = (w, tile.width)
+        bg = GlyphEditor._shared_bg.get(key)
+        if bg is None:
+            bg = Image.new('L', (w, h), 255)
+            # タイルを繰り返し貼り付け
+            for y in range(0, h, tile.height):
+                for x in range(0, w, tile.width):
+                    bg.paste(tile, (x, y))
+            GlyphEditor._shared_bg[key] = bg
         self._bg_full = bg
+        # 背景が変わったため表示用の合成結果を作り直す
+        self._display_composite = None
 
     def _fit_zoom_to_window(self) -> None:
         """
@@ -1071,6 +3547,15 @@ class GlyphEditor(tk.Toplevel):
         tk.Button(toolbar, text='+', command=self._zoom_in, width=2).pack(side='left', padx=2)
         tk.Button(toolbar, text='0', command=self._reset_zoom, width=2).pack(side='left', padx=2)
         
+        # [ADD] 2026-10-19: グリフ切り替え（前後の文字・開いているグリフのタブ）
+        tab_bar = tk.Frame(self, bg=Config.COLOR_BG)
+        tab_bar.pack(side='top', fill='x', padx=5)
+        tk.Button(tab_bar, text='◀', command=lambda: self._open_adjacent_glyph(-1), width=2).pack(side='left', padx=2)
+        tk.Button(tab_bar, text='▶', command=lambda: self._open_adjacent_glyph(1), width=2).pack(side='left', padx=2)
+        self.tab_frame = tk.Frame(tab_bar, bg=Config.COLOR_BG)
+        self.tab_frame.pack(side='left', fill='x', padx=(10, 0))
+        self.protocol('WM_DELETE_WINDOW', self._on_close_window)
+        
         # メインフレーム
         main_frame = tk.Frame(self, bg=Config.COLOR_BG)
         main_frame.pack(fill='both', expand=True, padx=5, pady=5)
@@ -1210,6 +3695,10 @@ class GlyphEditor(tk.Toplevel):
         self.preview_canvas.bind('<B1-Motion>', self._on_mouse_drag)
         self.preview_canvas.bind('<ButtonRelease-1>', self._on_mouse_up)
         self.preview_canvas.bind('<Motion>', self._on_mouse_move)
+        self.preview_canvas.bind('<Configure>', self._on_preview_configure)
+
+        # [ADD] 2026-10-19: タイル表示レイヤー
+        self._tile_view = TiledPreview(self.preview_canvas, Config.PREVIEW_TILE_SIZE)
     
     def _set_tool(self, tool: str) -> None:
         """ツール切り替え (2025-10-12: テキストツール追加)"""
@@ -1457,6 +3946,7 @@ class GlyphEditor(tk.Toplevel):
             
             self.text_layer = img
             self.text_layer_original = img.copy()
+            self._text_layer_key = None  # PNGはテキストキャッシュの対象外
             
             x_pos = (Config.CANVAS_SIZE - img.width) // 2
             y_pos = (Config.CANVAS_SIZE - img.height) // 2
@@ -1480,6 +3970,7 @@ class GlyphEditor(tk.Toplevel):
         エッジが有効な場合はその領域を preview で白色として表示し、決定時には透過となるよう
         自前のエッジマスク (self.text_edge_mask) と描画用レイヤー (self.text_layer) を生成する。
         エッジ幅が 0 またはエッジ表示が無効な場合はマスクを生成せず元画像を使用する。
+        (2026-10-19: ImageChops演算化、テキスト由来のレイヤーは結果をキャッシュ)
         """
         # テキストレイヤーが存在しない場合は何もしない
         if not self.text_layer_original:
@@ -1505,18 +3996,29 @@ class GlyphEditor(tk.Toplevel):
             self._update_preview()
             return
 
+        # Edge style: 'sharp' or 'round'. For 'round', smooth the mask before dilation to round corners
+        edge_style = getattr(self, 'edge_style_var', None).get() if hasattr(self, 'edge_style_var') else 'sharp'
+
+        # [ADD] 2026-10-19: 同じテキスト・スタイルの結果が残っていれば再計算しない
+        cache_key = None
+        if self._text_layer_key is not None:
+            cache_key = self._text_layer_key + ((edge_width, edge_style),)
+            cached = self._text_edge_cache.get(cache_key)
+            if cached is not None:
+                self._text_edge_cache.move_to_end(cache_key)
+                self.text_layer, self.text_edge_mask, self.text_edge_mask_commit = cached
+                self._update_preview()
+                return
+
         from PIL import ImageFilter
 
-        # テキストレイヤーのコピー（グレースケール）
-        base = self.text_layer_original.copy()
-        width, height = base.size
+        # テキストレイヤー（グレースケール）
+        base = self.text_layer_original
 
         # 元の黒領域マスクを作成：文字部分は0、背景は255
         # 250未満のピクセルを文字とみなす（アンチエイリアス部分も含む）
         mask_original = base.point(lambda p: 0 if p < 250 else 255)
 
-        # Edge style: 'sharp' or 'round'. For 'round', smooth the mask before dilation to round corners
-        edge_style = getattr(self, 'edge_style_var', None).get() if hasattr(self, 'edge_style_var') else 'sharp'
         mask_to_dilate = mask_original
         if edge_style == 'round':
             # Apply a slight Gaussian blur to soften corners before dilation. The blur radius of 1
@@ -1536,33 +4038,12 @@ class GlyphEditor(tk.Toplevel):
         else:
             dilated = mask_to_dilate.copy()
 
-        # 結果となるレイヤーとエッジマスクを初期化
-        result = Image.new('L', base.size, 255)
-        edge_mask_commit = Image.new('L', base.size, 0)  # コミット用
-        edge_mask_preview = Image.new('L', base.size, 0)  # プレビュー用 (sharp=original, round=加工)
-
-        orig_pixels = base.load()
-        mask_pixels = mask_original.load()
-        dil_pixels = dilated.load()
-        res_pixels = result.load()
-        edge_pixels_commit = edge_mask_commit.load()
-        edge_pixels_preview = edge_mask_preview.load()
-
-        # ピクセル単位で分類
-        for y in range(height):
-            for x in range(width):
-                # 元の文字部分はそのまま（濃度を保持）
-                if mask_pixels[x, y] == 0:
-                    res_pixels[x, y] = orig_pixels[x, y]
-                # 膨張した領域かつ元の文字ではない → エッジ領域
-                elif dil_pixels[x, y] == 0 and mask_pixels[x, y] != 0:
-                    # レイヤー上では透過（255）とする
-                    res_pixels[x, y] = 255
-                    # コミット用マスク：エッジ領域は255
-                    edge_pixels_commit[x, y] = 255
-                    # プレビュー用マスク: 初期状態はsharpと同様
-                    edge_pixels_preview[x, y] = 255
-                # それ以外は背景のまま
+        # [MOD] 2026-10-19: ピクセル単位ループをImageChopsの画像演算に置き換え
+        # 元の文字部分はそのまま（濃度を保持）、それ以外は透過（255）
+        result = ImageChops.lighter(base, mask_original)
+        # 膨張した領域かつ元の文字ではない → エッジ領域（255）。コミット用・プレビュー用の初期状態は同じ
+        edge_mask_commit = ImageChops.multiply(ImageChops.invert(dilated), mask_original)
+        edge_mask_preview = edge_mask_commit
 
         # エッジ形状が丸の場合、プレビュー用マスクをぼかして角を丸める
         if edge_style == 'round' and edge_width > 0:
@@ -1572,14 +4053,8 @@ class GlyphEditor(tk.Toplevel):
                 blurred = edge_mask_preview.filter(ImageFilter.GaussianBlur(blur_radius))
                 # 一旦二値化（少しでも白くなった部分をエッジとする）
                 thresholded = blurred.point(lambda p: 255 if p > 0 else 0)
-                # 内部侵食を防ぐため、元の文字部分(mask_pixels==0)ではマスクを0に設定する
-                preview_pixels = thresholded.load()
-                for yy in range(height):
-                    for xx in range(width):
-                        # mask_pixels[x,y]==0 は元の文字領域
-                        if mask_pixels[xx, yy] == 0:
-                            preview_pixels[xx, yy] = 0
-                edge_mask_preview = thresholded
+                # 内部侵食を防ぐため、元の文字部分(mask_original==0)ではマスクを0に設定する
+                edge_mask_preview = ImageChops.multiply(thresholded, mask_original)
             except Exception:
                 pass
 
@@ -1589,12 +4064,99 @@ class GlyphEditor(tk.Toplevel):
         self.text_edge_mask_commit = edge_mask_commit
         # プレビュー用エッジマスク
         self.text_edge_mask = edge_mask_preview
+        if cache_key is not None:
+            self._cache_text_entry(self._text_edge_cache, cache_key, (result, edge_mask_preview, edge_mask_commit))
         # プレビュー更新
         self._update_preview()
-    
+
+    @staticmethod
+    def _cache_text_entry(cache: 'OrderedDict', key: Any, value: Any) -> None:
+        """LRUキャッシュに登録し、上限を超えた古いエントリを破棄 (2026-10-19: 新規追加)"""
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > Config.TEXT_RENDER_CACHE_SIZE:
+            cache.popitem(last=False)
+
+    def _cancel_pending_text_render(self) -> None:
+        """予約済みのテキスト再描画を取り消す (2026-10-19: 新規追加)"""
+        if self._text_render_after_id is not None:
+            try:
+                self.after_cancel(self._text_render_after_id)
+            except Exception:
+                pass
+            self._text_render_after_id = None
+
     def _on_text_changed(self, event=None) -> None:
-        """テキスト入力変更時"""
-        text = self.text_entry.get().strip()
+        """テキスト入力変更時 (2026-10-19: 連続入力をデバウンスしてから描画)"""
+        self._cancel_pending_text_render()
+        self._text_render_after_id = self.after(Config.TEXT_INPUT_DEBOUNCE_MS, self._render_text_layer)
+
+    def _render_text_line(self, text: str, font_path: str, size: int) -> Image.Image:
+        """
+        テキスト1行を白背景にラスタライズする (2026-10-19: 新規追加)。
+        直前の入力に文字を追加しただけの場合は、前回のラスタに追加分のみを描き足す。
+        左右の張り出しに備えて上下左右に size//4 の余白を確保する。
+        """
+        font = FontRenderer.get_shared_font(font_path, size)
+        ascent, descent = font.getmetrics()
+        pad = size // 4
+        width = int(font.getlength(text)) + 1 + pad * 2
+        height = ascent + descent + pad * 2
+
+        prev = self._text_line_raster
+        if (prev and prev['font'] == (font_path, size) and prev['text']
+                and text.startswith(prev['text']) and prev['image'].height == height):
+            # 追加入力分のみ描画
+            line = Image.new('L', (max(width, prev['image'].width), height), 255)
+            line.paste(prev['image'], (0, 0))
+            draw = ImageDraw.Draw(line)
+            suffix = text[len(prev['text']):]
+            # 全体幅から追加分の幅を引いた位置に描くことで、継ぎ目のカーニングも反映される
+            x = pad + font.getlength(text) - font.getlength(suffix)
+            draw.text((x, pad + ascent), suffix, fill=0, font=font, anchor='ls')
+        else:
+            line = Image.new('L', (width, height), 255)
+            draw = ImageDraw.Draw(line)
+            draw.text((pad, pad + ascent), text, fill=0, font=font, anchor='ls')
+
+        self._text_line_raster = {'font': (font_path, size), 'text': text, 'image': line}
+        return line
+
+    def _get_text_raster(self, text: str, font_path: str, size: int) -> Optional[Image.Image]:
+        """
+        トリミング済みのテキストラスタを取得 (2026-10-19: 新規追加)。
+        キャンバス中央に配置した場合にはみ出す部分は切り落とす。
+        """
+        key = (text, font_path, size)
+        cached = self._text_raster_cache.get(key)
+        if cached is not None:
+            self._text_raster_cache.move_to_end(key)
+            return cached
+
+        line = self._render_text_line(text, font_path, size)
+        # 白背景(255)のためinvertしてから墨のある範囲を求める
+        bbox = ImageChops.invert(line).getbbox()
+        if not bbox:
+            return None
+        trimmed = line.crop(bbox)
+        # キャンバスより大きい場合は中央部分のみ残す（従来の描画範囲に合わせる）
+        if trimmed.width > Config.CANVAS_SIZE or trimmed.height > Config.CANVAS_SIZE:
+            left = max(0, (trimmed.width - Config.CANVAS_SIZE) // 2)
+            top = max(0, (trimmed.height - Config.CANVAS_SIZE) // 2)
+            trimmed = trimmed.crop((left, top,
+                                    left + min(trimmed.width, Config.CANVAS_SIZE),
+                                    top + min(trimmed.height, Config.CANVAS_SIZE)))
+        self._cache_text_entry(self._text_raster_cache, key, trimmed)
+        return trimmed
+
+    def _render_text_layer(self) -> None:
+        """テキストレイヤーを描画 (2026-10-19: _on_text_changedから分離、キャッシュ対応)"""
+        self._text_render_after_id = None
+        try:
+            text = self.text_entry.get().strip()
+        except tk.TclError:
+            # ダイアログが既に閉じられている
+            return
         
         if not text:
             if not hasattr(self, 'text_layer_original') or self.text_layer_original is None:
@@ -1614,25 +4176,25 @@ class GlyphEditor(tk.Toplevel):
         try:
             target_size = self.text_layer_resized_size
             target_pos = self.text_layer_resized_pos
-            
-            font = ImageFont.truetype(self.project.font_path, size=Config.FONT_RENDER_SIZE)
-            
-            char_img = Image.new('L', (Config.CANVAS_SIZE, Config.CANVAS_SIZE), 255)
-            draw = ImageDraw.Draw(char_img)
-            
-            bbox = draw.textbbox((0, 0), text, font=font)
-            w = bbox[2] - bbox[0]
-            h = bbox[3] - bbox[1]
-            
-            x = (Config.CANVAS_SIZE - w) / 2 - bbox[0]
-            y = (Config.CANVAS_SIZE - h) / 2 - bbox[1]
-            
-            draw.text((x, y), text, fill=0, font=font)
-            
-            bbox = char_img.getbbox()
-            if bbox:
-                trimmed = char_img.crop(bbox)
-                
+            font_path = self.project.font_path
+            font_size = Config.FONT_RENDER_SIZE
+
+            layer_key = (text, font_path, font_size, target_size if (target_size and target_pos) else None)
+            if layer_key == self._text_layer_key and self.text_layer_original is not None:
+                # テキスト・フォント・サイズが変わっていなければラスタライズを省略
+                trimmed = None
+            else:
+                trimmed = self._get_text_raster(text, font_path, font_size)
+                if trimmed is None:
+                    self.text_layer = None
+                    self.text_layer_original = None
+                    self.text_layer_resized_size = None
+                    self.text_layer_resized_pos = None
+                    self._text_layer_key = None
+                    self._update_preview()
+                    return
+
+            if trimmed is not None:
                 if target_size and target_pos:
                     target_w, target_h = target_size
                     self.text_layer_original = trimmed.resize((target_w, target_h), Image.LANCZOS)
@@ -1642,19 +4204,17 @@ class GlyphEditor(tk.Toplevel):
                     x_pos = (Config.CANVAS_SIZE - trimmed.width) // 2
                     y_pos = (Config.CANVAS_SIZE - trimmed.height) // 2
                     self.text_layer_pos = (x_pos, y_pos)
-                
-                if self.text_edge_var.get():
-                    self._apply_edge_to_layer()
-                else:
-                    # エッジ無しの場合は元画像をそのまま使用し、エッジマスクをクリア
-                    self.text_layer = self.text_layer_original.copy()
-                    self.text_edge_mask = None
-            else:
-                self.text_layer = None
-                self.text_layer_original = None
-                self.text_layer_resized_size = None
-                self.text_layer_resized_pos = None
-            
+                self._text_layer_key = layer_key
+
+            if self.text_edge_var.get():
+                # _apply_edge_to_layer内でプレビューも更新される
+                self._apply_edge_to_layer()
+                return
+
+            # エッジ無しの場合は元画像をそのまま使用し、エッジマスクをクリア
+            self.text_layer = self.text_layer_original.copy()
+            self.text_edge_mask = None
+            self.text_edge_mask_commit = None
             self._update_preview()
             
         except Exception as e:
@@ -1704,6 +4264,7 @@ class GlyphEditor(tk.Toplevel):
         self.edit_bitmap = new_bitmap
 
         # テキスト関連データのリセット
+        self._cancel_pending_text_render()
         self.text_layer = None
         self.text_layer_original = None
         self.text_layer_resized_size = None
@@ -1722,6 +4283,7 @@ class GlyphEditor(tk.Toplevel):
     
     def _cancel_text_input(self) -> None:
         """テキスト入力をキャンセル"""
+        self._cancel_pending_text_render()
         self.text_layer = None
         self.text_layer_original = None
         self.text_layer_resized_size = None
@@ -1873,20 +4435,11 @@ class GlyphEditor(tk.Toplevel):
                 # 念のためエラー時はそのまま表示
                 pass
 
-        # 背景パターンと合成
-        # 255の場所（完全な白）は透過とみなし、背景パターンが表示される。
-        # それ以外は黒や薄い灰色をそのまま前景として描画する。
-        # まずマスク画像を生成: 255->0, その他->255
-        mask = composite.point(lambda p: 0 if p == 255 else 255)
-        merged = Image.composite(composite, self._bg_full, mask)
-
-        # ズームリサイズ
-        zoomed = merged.resize((new_width, new_height), Image.NEAREST if self.is_moving or self.is_resizing else Image.LANCZOS)
+        # [MOD] 2026-10-19: 背景合成とズーム表示は変更領域のタイルのみ更新する
+        resample = Image.NEAREST if self.is_moving or self.is_resizing else Image.LANCZOS
+        dirty = self._present(composite, resample)
 
-        # キャンバスに描画
-        self.photo = ImageTk.PhotoImage(zoomed)
-        self.preview_canvas.delete('all')
-        self.preview_canvas.create_image(0, 0, anchor='nw', image=self.photo, tags='base')
+        self._begin_overlays()
 
         # グリッド線描画
         self._draw_grid()
@@ -1916,21 +4469,15 @@ class GlyphEditor(tk.Toplevel):
                 self._draw_text_layer_handles()
 
         # ガイドライン描画
-        for guide_type, pos in self.guidelines:
-            if guide_type == 'h':
-                y_canvas = pos * self.zoom_level
-                self.preview_canvas.create_line(0, y_canvas, new_width, y_canvas,
-                                               fill='#FF00FF', dash=(5, 5), tags='guide')
-            elif guide_type == 'v':
-                x_canvas = pos * self.zoom_level
-                self.preview_canvas.create_line(x_canvas, 0, x_canvas, new_height,
-                                               fill='#FF00FF', dash=(5, 5), tags='guide')
+        self._draw_guides()
 
-        # ナビゲーション更新
-        self._update_nav()
+        self._end_overlays()
 
-        # スクロール領域更新
-        self.preview_canvas.configure(scrollregion=(0, 0, new_width, new_height))
+        # ナビゲーション更新（変更領域のみ）
+        self._update_nav(dirty)
+
+        # スクロール領域更新（変化した場合のみ）
+        self._set_scrollregion(new_width, new_height)
     
     def _update_preview_fast(self) -> None:
         """高速プレビュー更新（ドラッグ中専用：グリッド・ハンドル省略）"""  # [ADD] 2025-10-13
@@ -1942,9 +4489,6 @@ class GlyphEditor(tk.Toplevel):
         if self._bg_full is None or self._bg_full.size != (Config.CANVAS_SIZE, Config.CANVAS_SIZE):
             self._create_full_bg()
 
-        # グリッド線を削除（高速更新では描画しないため）
-        self.preview_canvas.delete('grid')
-
         # 合成処理（高速バージョン）
         if self.text_layer:
             # レイヤーをベースに貼り付けて暗い方を採用
@@ -1968,61 +4512,192 @@ class GlyphEditor(tk.Toplevel):
             except Exception:
                 pass
 
-        # 背景と合成
-        mask = composite.point(lambda p: 0 if p == 255 else 255)
-        merged = Image.composite(composite, self._bg_full, mask)
+        # 背景と合成・変化したタイルのみ更新
+        dirty = self._present(composite, Image.NEAREST)
 
-        zoomed = merged.resize((new_width, new_height), Image.NEAREST)
-
-        self.photo = ImageTk.PhotoImage(zoomed)
-        # ベース画像のみ更新（タグ指定で高速化）
-        self.preview_canvas.delete('base')
-        self.preview_canvas.create_image(0, 0, anchor='nw', image=self.photo, tags='base')
-        
-        # テキストレイヤーの枠のみ描画（簡易表示）
+        # オーバーレイは操作中の枠とガイドのみ表示（グリッドは非表示にする）
+        self._set_grid_visible(False)
+        self._begin_overlays()
+        if self.is_moving and self.move_current_pos and self.selected_image:
+            self._draw_moving_preview()
+        if self.is_resizing and self.resize_preview_rect:
+            self._draw_resizing_preview()
         if self.is_text_mode and self.text_layer:
-            self.preview_canvas.delete('text_layer_rect')
-            
-            x_pos, y_pos = self.text_layer_pos
-            x_end = x_pos + self.text_layer.width
-            y_end = y_pos + self.text_layer.height
-            
-            cx1 = x_pos * self.zoom_level
-            cy1 = y_pos * self.zoom_level
-            cx2 = x_end * self.zoom_level
-            cy2 = y_end * self.zoom_level
-            
-            self.preview_canvas.create_rectangle(cx1, cy1, cx2, cy2, 
-                                                outline='#00FF00', width=2, 
-                                                dash=(5, 5), tags='text_layer_rect')
+            self._draw_text_layer_preview()
+        self._draw_guides()
+        self._end_overlays()
         
         # ナビゲーション更新（軽量版）
-        self._update_nav()
+        self._update_nav(dirty)
+        self._set_scrollregion(new_width, new_height)
+    
+    def _present(self, composite: Image.Image, resample: int) -> Optional[Tuple[int, int, int, int]]:
+        """
+        合成画像を背景と合成してタイル表示に渡す (2026-10-19: 新規追加)
+        
+        前回表示した合成画像との差分領域だけを背景合成し直し、
+        その領域をタイル表示・ナビゲーションの更新範囲として使う。
+        
+        Returns:
+            変更領域 (x0, y0, x1, y1)。変化が無い場合はNone
+        """
+        if self._display_composite is None or self._display_composite.size != composite.size:
+            self._display_composite = Image.new('L', composite.size, 255)
+            self._display_merged = Image.new('L', composite.size, 255)
+            dirty = (0, 0) + composite.size
+        else:
+            dirty = ImageChops.difference(composite, self._display_composite).getbbox()
+
+        if dirty:
+            region = composite.crop(dirty)
+            # 255の場所（完全な白）は透過とみなし、背景パターンが表示される。
+            # それ以外は黒や薄い灰色をそのまま前景として描画する。
+            # まずマスク画像を生成: 255->0, その他->255
+            mask = region.point(lambda p: 0 if p == 255 else 255)
+            merged = Image.composite(region, self._bg_full.crop(dirty), mask)
+            self._display_merged.paste(merged, dirty[:2])
+            self._display_composite.paste(region, dirty[:2])
+
+        # 合成画像が編集画像そのものなら、同じ変更領域でインク範囲も更新する
+        if composite is self.edit_bitmap:
+            if self._ink_fresh:
+                self._ink.update(composite, dirty)
+            else:
+                self._ink.sync(composite)
+                self._ink_fresh = True
+        else:
+            self._ink_fresh = False
+
+        # 変化したタイルのみ更新（変更が無ければ比較も省略）
+        self._tile_view.render(self._display_merged, self.zoom_level, resample, dirty or (0, 0, 0, 0))
+        return dirty
+    
+    # ===== オーバーレイ管理 (2026-10-19: 座標更新による再利用) =====
+    
+    def _overlay(self, key: str, kind: str, coords: Tuple[float, ...], persistent: bool = False, **options: Any) -> int:
+        """
+        オーバーレイ図形を表示（既存項目があれば変化した座標と属性のみ更新）
+        
+        Args:
+            key: 項目の識別名（タグとしても使用）
+            kind: 'line' / 'rectangle' / 'oval' / 'image'
+            coords: キャンバス座標
+            persistent: Trueの場合はフレーム終了時の自動非表示対象外
+            **options: create_*に渡す属性
+        
+        Returns:
+            キャンバス項目ID
+        """
+        canvas = self.preview_canvas
+        item = self._overlay_items.get(key)
+        if item is None:
+            create = getattr(canvas, f'create_{kind}')
+            item = create(*coords, tags=('overlay', key), **options)
+            self._overlay_items[key] = item
+            self._overlay_opts[key] = options
+            self._overlay_coords[key] = coords
+        else:
+            if coords != self._overlay_coords.get(key):
+                canvas.coords(item, *coords)
+                self._overlay_coords[key] = coords
+            if options != self._overlay_opts.get(key):
+                canvas.itemconfigure(item, **options)
+                self._overlay_opts[key] = options
+            if key not in self._overlay_visible:
+                canvas.itemconfigure(item, state='normal')
+        self._overlay_visible.add(key)
+        if persistent:
+            self._persistent_overlays.add(key)
+        else:
+            self._overlay_drawn.add(key)
+        return item
+    
+    def _hide_overlay(self, key: str) -> None:
+        """オーバーレイ図形を非表示にする（項目は再利用のため残す）"""
+        if key in self._overlay_visible:
+            self.preview_canvas.itemconfigure(self._overlay_items[key], state='hidden')
+            self._overlay_visible.discard(key)
+    
+    def _begin_overlays(self) -> None:
+        """フレーム内で描画したオーバーレイの記録を開始"""
+        self._overlay_drawn = set()
+    
+    def _end_overlays(self) -> None:
+        """今回のフレームで描画されなかったオーバーレイを非表示にする"""
+        for key in list(self._overlay_visible):
+            if key not in self._overlay_drawn and key not in self._persistent_overlays:
+                self._hide_overlay(key)
+    
+    def _set_scrollregion(self, width: int, height: int) -> None:
+        """スクロール領域を設定（変化時のみ）"""
+        region = (0, 0, width, height)
+        if region != self._scrollregion:
+            self.preview_canvas.configure(scrollregion=region)
+            self._scrollregion = region
+    
+    def _on_preview_configure(self, event: tk.Event) -> None:
+        """キャンバスサイズ変更時に新たに見えたタイルを描画"""
+        self._tile_view.refresh_visible()
+        self._update_nav_viewport()
     
     # ===== 描画補助メソッド (2025-10-13: プレビュー用) =====
     
     def _draw_grid(self) -> None:
-        """グリッド線を描画"""
-        # グリッド表示がオフの場合は描画しない
+        """
+        グリッド線を描画
+        [MOD] 2026-10-19: 線は初回のみ作成し、ズーム変更時はcanvas.scaleで一括移動する
+        """
+        # グリッド表示がオフの場合は非表示にする
         if not self.grid_visible_var.get():
+            self._set_grid_visible(False)
             return
 
-        new_width = int(Config.CANVAS_SIZE * self.zoom_level)
-        new_height = int(Config.CANVAS_SIZE * self.zoom_level)
+        if self._grid_zoom is None:
+            new_width = int(Config.CANVAS_SIZE * self.zoom_level)
+            new_height = int(Config.CANVAS_SIZE * self.zoom_level)
 
-        # 縦線
-        for x in range(0, Config.CANVAS_SIZE, Config.GRID_SPACING):
-            x_canvas = x * self.zoom_level
-            color = Config.GRID_CENTER_COLOR if x == Config.CANVAS_SIZE // 2 else Config.GRID_COLOR
-            self.preview_canvas.create_line(x_canvas, 0, x_canvas, new_height,
-                                           fill=color, tags='grid')
+            # 縦線
+            for x in range(0, Config.CANVAS_SIZE, Config.GRID_SPACING):
+                x_canvas = x * self.zoom_level
+                color = Config.GRID_CENTER_COLOR if x == Config.CANVAS_SIZE // 2 else Config.GRID_COLOR
+                self.preview_canvas.create_line(x_canvas, 0, x_canvas, new_height,
+                                               fill=color, tags='grid')
 
-        # 横線
-        for y in range(0, Config.CANVAS_SIZE, Config.GRID_SPACING):
-            y_canvas = y * self.zoom_level
-            color = Config.GRID_CENTER_COLOR if y == Config.CANVAS_SIZE // 2 else Config.GRID_COLOR
-            self.preview_canvas.create_line(0, y_canvas, new_width, y_canvas,
-                                           fill=color, tags='grid')
+            # 横線
+            for y in range(0, Config.CANVAS_SIZE, Config.GRID_SPACING):
+                y_canvas = y * self.zoom_level
+                color = Config.GRID_CENTER_COLOR if y == Config.CANVAS_SIZE // 2 else Config.GRID_COLOR
+                self.preview_canvas.create_line(0, y_canvas, new_width, y_canvas,
+                                               fill=color, tags='grid')
+            self._grid_zoom = self.zoom_level
+            self._grid_visible = True
+        elif self._grid_zoom != self.zoom_level:
+            factor = self.zoom_level / self._grid_zoom
+            self.preview_canvas.scale('grid', 0, 0, factor, factor)
+            self._grid_zoom = self.zoom_level
+
+        self._set_grid_visible(True)
+    
+    def _set_grid_visible(self, visible: bool) -> None:
+        """グリッド線の表示/非表示を切り替え（状態が変わる時のみ）"""
+        if self._grid_zoom is None or visible == self._grid_visible:
+            return
+        self.preview_canvas.itemconfigure('grid', state='normal' if visible else 'hidden')
+        self._grid_visible = visible
+    
+    def _draw_guides(self) -> None:
+        """ガイドラインを描画（座標が変わらない項目はTkコマンドを発行しない）"""
+        new_width = int(Config.CANVAS_SIZE * self.zoom_level)
+        new_height = int(Config.CANVAS_SIZE * self.zoom_level)
+        for i, (guide_type, pos) in enumerate(self.guidelines):
+            if guide_type == 'h':
+                y_canvas = pos * self.zoom_level
+                self._overlay(f'guide{i}', 'line', (0, y_canvas, new_width, y_canvas),
+                              fill='#FF00FF', dash=(5, 5))
+            elif guide_type == 'v':
+                x_canvas = pos * self.zoom_level
+                self._overlay(f'guide{i}', 'line', (x_canvas, 0, x_canvas, new_height),
+                              fill='#FF00FF', dash=(5, 5))
     
     def _draw_selection_rect(self) -> None:
         """選択矩形を描画"""
@@ -2037,9 +4712,8 @@ class GlyphEditor(tk.Toplevel):
         cx2 = x2 * self.zoom_level
         cy2 = y2 * self.zoom_level
         
-        self.preview_canvas.create_rectangle(cx1, cy1, cx2, cy2, 
-                                            outline='#0000FF', width=2, 
-                                            dash=(5, 5), tags='selection')
+        self._overlay('selection', 'rectangle', (cx1, cy1, cx2, cy2),
+                      outline='#0000FF', width=2, dash=(5, 5))
     
     def _draw_resize_handles(self) -> None:
         """リサイズハンドルを描画"""
@@ -2066,19 +4740,11 @@ class GlyphEditor(tk.Toplevel):
             (cx1, cy2), (cx_mid, cy2), (cx2, cy2)
         ]
         
-        # 既存のハンドルを削除
-        for hid in self.resize_handle_ids:
-            self.preview_canvas.delete(hid)
-        self.resize_handle_ids.clear()
-        
-        # 新しいハンドルを描画
-        for hx, hy in handles:
-            hid = self.preview_canvas.create_rectangle(
-                hx - handle_size, hy - handle_size,
-                hx + handle_size, hy + handle_size,
-                fill='white', outline='blue', width=2, tags='handle'
-            )
-            self.resize_handle_ids.append(hid)
+        # ハンドルは8個の項目を座標更新で使い回す
+        for i, (hx, hy) in enumerate(handles):
+            self._overlay(f'handle{i}', 'rectangle',
+                          (hx - handle_size, hy - handle_size, hx + handle_size, hy + handle_size),
+                          fill='white', outline='blue', width=2)
     
     def _draw_text_layer_handles(self) -> None:
         """テキストレイヤーのハンドルを描画"""
@@ -2106,12 +4772,10 @@ class GlyphEditor(tk.Toplevel):
         ]
         
         # テキストレイヤーハンドルを描画
-        for hx, hy in handles:
-            self.preview_canvas.create_rectangle(
-                hx - handle_size, hy - handle_size,
-                hx + handle_size, hy + handle_size,
-                fill='lime', outline='green', width=2, tags='text_handle'
-            )
+        for i, (hx, hy) in enumerate(handles):
+            self._overlay(f'text_handle{i}', 'rectangle',
+                          (hx - handle_size, hy - handle_size, hx + handle_size, hy + handle_size),
+                          fill='lime', outline='green', width=2)
     
     def _draw_moving_preview(self) -> None:
         """移動中のプレビュー描画"""
@@ -2128,20 +4792,18 @@ class GlyphEditor(tk.Toplevel):
         cy2 = (y + h) * self.zoom_level
         
         # 選択範囲の内容をプレビューに描画し、枠線を表示
-        # 既存の移動画像を削除
-        self.preview_canvas.delete('moving_img')
-        # 描画内容を貼り付け
+        # [MOD] 2026-10-19: 移動中は内容が変わらないため、拡大画像は選択内容かズームが変わった時のみ作成
         try:
-            # 拡大縮小された選択内容を作成
-            preview_sel = self.selected_image.resize((int(w * self.zoom_level), int(h * self.zoom_level)), Image.NEAREST)
-            self._move_photo = ImageTk.PhotoImage(preview_sel)
-            self.preview_canvas.create_image(cx1, cy1, anchor='nw', image=self._move_photo, tags='moving_img')
+            if self._move_photo is None or self._move_photo_src != (self.selected_image, self.zoom_level):
+                preview_sel = self.selected_image.resize((max(1, int(w * self.zoom_level)), max(1, int(h * self.zoom_level))), Image.NEAREST)
+                self._move_photo = ImageTk.PhotoImage(preview_sel)
+                self._move_photo_src = (self.selected_image, self.zoom_level)
+            self._overlay('moving_img', 'image', (cx1, cy1), anchor='nw', image=self._move_photo)
         except Exception:
             pass
         # 枠線を描画
-        self.preview_canvas.create_rectangle(cx1, cy1, cx2, cy2,
-                                            outline='#00FF00', width=2,
-                                            dash=(3, 3), tags='moving')
+        self._overlay('moving', 'rectangle', (cx1, cy1, cx2, cy2),
+                      outline='#00FF00', width=2, dash=(3, 3))
     
     def _draw_resizing_preview(self) -> None:
         """リサイズ中のプレビュー描画"""
@@ -2155,9 +4817,8 @@ class GlyphEditor(tk.Toplevel):
         cx2 = x2 * self.zoom_level
         cy2 = y2 * self.zoom_level
         
-        self.preview_canvas.create_rectangle(cx1, cy1, cx2, cy2, 
-                                            outline='#FF00FF', width=2, 
-                                            dash=(3, 3), tags='resizing')
+        self._overlay('resizing', 'rectangle', (cx1, cy1, cx2, cy2),
+                      outline='#FF00FF', width=2, dash=(3, 3))
     
     def _draw_shape_preview(self) -> None:
         """図形プレビュー描画"""
@@ -2173,14 +4834,11 @@ class GlyphEditor(tk.Toplevel):
         cy2 = y2 * self.zoom_level
         
         if self.current_tool == 'line':
-            self.preview_canvas.create_line(cx1, cy1, cx2, cy2, 
-                                           fill='red', width=2, tags='shape_preview')
+            self._overlay('shape_line', 'line', (cx1, cy1, cx2, cy2), fill='red', width=2)
         elif self.current_tool == 'rect':
-            self.preview_canvas.create_rectangle(cx1, cy1, cx2, cy2, 
-                                                outline='red', width=2, tags='shape_preview')
+            self._overlay('shape_rect', 'rectangle', (cx1, cy1, cx2, cy2), outline='red', width=2)
         elif self.current_tool == 'ellipse':
-            self.preview_canvas.create_oval(cx1, cy1, cx2, cy2, 
-                                           outline='red', width=2, tags='shape_preview')
+            self._overlay('shape_oval', 'oval', (cx1, cy1, cx2, cy2), outline='red', width=2)
     
     def _draw_text_layer_preview(self) -> None:
         """テキストレイヤーのプレビュー描画"""
@@ -2197,21 +4855,42 @@ class GlyphEditor(tk.Toplevel):
         cy2 = y_end * self.zoom_level
         
         # 緑色の枠で表示
-        self.preview_canvas.create_rectangle(cx1, cy1, cx2, cy2, 
-                                            outline='#00FF00', width=2, 
-                                            dash=(5, 5), tags='text_layer')
+        self._overlay('text_layer', 'rectangle', (cx1, cy1, cx2, cy2),
+                      outline='#00FF00', width=2, dash=(5, 5))
     
+
     # ===== ナビゲーション更新 (2025-10-13) =====
     
-    def _update_nav(self) -> None:
-        """ナビゲーションウィンドウ更新"""
-        # 現在の画像を縮小してナビゲーションに表示
-        nav_img = self.edit_bitmap.resize((Config.NAV_SIZE, Config.NAV_SIZE), Image.NEAREST)
-        self._nav_photo = ImageTk.PhotoImage(nav_img)
-        
-        self.nav_canvas.delete('all')
-        self.nav_canvas.create_image(0, 0, anchor='nw', image=self._nav_photo)
-        
+    def _update_nav(self, dirty: Optional[Tuple[int, int, int, int]] = None) -> None:
+        """
+        ナビゲーションウィンドウ更新
+        [MOD] 2026-10-19: 表示項目は使い回し、表示パイプラインの変更領域だけ縮小し直す
+        """
+        source = self._display_composite if self._display_composite is not None else self.edit_bitmap
+        size = Config.NAV_SIZE
+        if self._nav_image is None:
+            # 初回のみ全体を縮小してナビゲーションに表示
+            self._nav_image = source.resize((size, size), Image.NEAREST)
+            self._nav_photo = ImageTk.PhotoImage(self._nav_image)
+            self.nav_canvas.create_image(0, 0, anchor='nw', image=self._nav_photo, tags='nav_image')
+        elif dirty:
+            # 変更領域に対応するナビゲーション画素のみ再サンプリング
+            # （box指定のNEARESTは全体縮小と同じ画素を参照する）
+            sx = source.width / size
+            sy = source.height / size
+            nx0 = max(0, int(dirty[0] / sx))
+            ny0 = max(0, int(dirty[1] / sy))
+            nx1 = min(size, int(dirty[2] / sx) + 1)
+            ny1 = min(size, int(dirty[3] / sy) + 1)
+            part = source.resize((nx1 - nx0, ny1 - ny0), Image.NEAREST,
+                                 box=(nx0 * sx, ny0 * sy, nx1 * sx, ny1 * sy))
+            self._nav_image.paste(part, (nx0, ny0))
+            self._nav_photo.paste(self._nav_image)
+        
+        self._update_nav_viewport()
+    
+    def _update_nav_viewport(self) -> None:
+        """ナビゲーション上の表示範囲枠を更新（座標が変わった時のみ）"""
         # 現在の表示範囲を赤枠で表示
         # visible_w/h: 画像上で表示されている幅・高さ
         visible_w = self.preview_canvas.winfo_width() / self.zoom_level
@@ -2231,8 +4910,12 @@ class GlyphEditor(tk.Toplevel):
         img_y0 = y0_canvas / self.zoom_level
         nav_x = img_x0 * ratio
         nav_y = img_y0 * ratio
-        self.nav_canvas.create_rectangle(nav_x, nav_y, nav_x + nav_w, nav_y + nav_h,
-                                        outline='red', width=2)
+        rect = (nav_x, nav_y, nav_x + nav_w, nav_y + nav_h)
+        if self._nav_rect_coords is None:
+            self.nav_canvas.create_rectangle(*rect, outline='red', width=2, tags='nav_view')
+        elif rect != self._nav_rect_coords:
+            self.nav_canvas.coords('nav_view', *rect)
+        self._nav_rect_coords = rect
 
     def _on_nav_click(self, event: tk.Event) -> None:
         """
@@ -2270,10 +4953,14 @@ class GlyphEditor(tk.Toplevel):
     def _on_xscroll(self, *args) -> None:
         """横スクロール"""
         self.preview_canvas.xview(*args)
+        self._tile_view.refresh_visible()
+        self._update_nav_viewport()
     
     def _on_yscroll(self, *args) -> None:
         """縦スクロール"""
         self.preview_canvas.yview(*args)
+        self._tile_view.refresh_visible()
+        self._update_nav_viewport()
 
 # ===== [BLOCK5.6-END] =====
 
@@ -2327,7 +5014,7 @@ class GlyphEditor(tk.Toplevel):
         draw.rectangle((x1, y1, x2 - 1, y2 - 1), fill=255)
         # 新しい位置に貼り付け（透過部分は無視）
         dest_x, dest_y = self.move_current_pos
-        mask = self.selected_image.point(lambda p: 255 if p < 255 else 0)
+        mask = self._selection_mask()
         self.edit_bitmap.paste(self.selected_image, (dest_x, dest_y), mask)
         # 選択状態を更新
         w = self.selected_image.width
@@ -2379,7 +5066,7 @@ class GlyphEditor(tk.Toplevel):
             # マスクを作成し、選択範囲の黒／灰色ピクセルのみを貼り付け
             # 250未満は描画すべき領域、その他は透過扱い
             # 非透過ピクセルをすべて移動対象とする
-            mask = self.selected_image.point(lambda p: 255 if p < 255 else 0)
+            mask = self._selection_mask()
             self.edit_bitmap.paste(self.selected_image, (new_x1, new_y1), mask)
             # 選択状態を更新
             w = x2 - x1
@@ -2459,6 +5146,35 @@ class GlyphEditor(tk.Toplevel):
         self._save_to_undo()
         self._update_preview()
     
+    def _selection_mask(self) -> Image.Image:
+        """選択内容の貼り付けマスク（255未満を不透過）。選択画像が変わった時のみ作り直す (2026-10-19)"""
+        if self._selection_mask_src is not self.selected_image:
+            self._selection_mask_img = self.selected_image.point(lambda p: 255 if p < 255 else 0)
+            self._selection_mask_src = self.selected_image
+        return self._selection_mask_img
+    
+    def _ink_bbox(self) -> Optional[Tuple[int, int, int, int]]:
+        """編集画像のインク外接矩形。差分追跡済みの値を返す (2026-10-19: 新規追加)"""
+        if not self._ink_fresh:
+            self._ink.sync(self.edit_bitmap)
+            self._ink_fresh = True
+        return self._ink.bbox()
+    
+    def _move_ink(self, bbox: Tuple[int, int, int, int], dest_x: int, dest_y: int) -> None:
+        """
+        インク外接矩形の内容を指定位置へ移動する (2026-10-19: 新規追加)
+        外接矩形の外は白なので、領域を切り出して元を白で消し、移動先に貼るだけで済む。
+        """
+        content = self.edit_bitmap.crop(bbox)
+        draw = ImageDraw.Draw(self.edit_bitmap)
+        draw.rectangle((bbox[0], bbox[1], bbox[2] - 1, bbox[3] - 1), fill=255)
+        self.edit_bitmap.paste(content, (dest_x, dest_y))
+        # 移動量が分かっているのでインク範囲もそのまま更新しておく
+        self._ink.update(self.edit_bitmap, (
+            min(bbox[0], dest_x), min(bbox[1], dest_y),
+            max(bbox[2], dest_x + content.width), max(bbox[3], dest_y + content.height)
+        ))
+    
     def _center_horizontal(self) -> None:
         """左右中央配置。選択中は選択範囲をキャンバス中心に移動し、
         選択していない場合は描画部分全体を中央に配置する。"""
@@ -2478,7 +5194,7 @@ class GlyphEditor(tk.Toplevel):
                 # 新しい位置に貼り付け（透明部分を無視）
                 new_x1 = max(0, min(target_x, Config.CANVAS_SIZE - sel_width))
                 # 255未満のピクセルを全て貼り付け対象とする
-                mask = self.selected_image.point(lambda p: 255 if p < 255 else 0)
+                mask = self._selection_mask()
                 self.edit_bitmap.paste(self.selected_image, (new_x1, y1), mask)
                 # 選択状態を更新
                 self.selection_start = (new_x1, y1)
@@ -2487,7 +5203,8 @@ class GlyphEditor(tk.Toplevel):
                 self._update_preview()
             return
         # 選択されていない場合はコンテンツ全体を対象
-        bbox = self.edit_bitmap.getbbox()
+        # [MOD] 2026-10-19: 差分追跡しているインク範囲を使い、領域移動のみで中央配置する
+        bbox = self._ink_bbox()
         if not bbox:
             return
         x1, y1, x2, y2 = bbox
@@ -2496,11 +5213,7 @@ class GlyphEditor(tk.Toplevel):
         offset_x = target_x - x1
         if offset_x == 0:
             return
-        # 新しい画像を作成し中央配置
-        new_img = Image.new('L', (Config.CANVAS_SIZE, Config.CANVAS_SIZE), 255)
-        content = self.edit_bitmap.crop(bbox)
-        new_img.paste(content, (target_x, y1))
-        self.edit_bitmap = new_img
+        self._move_ink(bbox, target_x, y1)
         self._save_to_undo()
         self._update_preview()
     
@@ -2518,7 +5231,7 @@ class GlyphEditor(tk.Toplevel):
                 draw.rectangle((x1, y1, x2 - 1, y2 - 1), fill=255)
                 new_y1 = max(0, min(target_y, Config.CANVAS_SIZE - sel_height))
                 # マスクを使用して透明部分を無視
-                mask = self.selected_image.point(lambda p: 255 if p < 255 else 0)
+                mask = self._selection_mask()
                 self.edit_bitmap.paste(self.selected_image, (x1, new_y1), mask)
                 self.selection_start = (x1, new_y1)
                 self.selection_end = (x2, new_y1 + sel_height)
@@ -2526,7 +5239,7 @@ class GlyphEditor(tk.Toplevel):
                 self._update_preview()
             return
         # 選択が無い場合は全体を上下中央に配置
-        bbox = self.edit_bitmap.getbbox()
+        bbox = self._ink_bbox()
         if not bbox:
             return
         x1, y1, x2, y2 = bbox
@@ -2535,10 +5248,7 @@ class GlyphEditor(tk.Toplevel):
         offset_y = target_y - y1
         if offset_y == 0:
             return
-        new_img = Image.new('L', (Config.CANVAS_SIZE, Config.CANVAS_SIZE), 255)
-        content = self.edit_bitmap.crop(bbox)
-        new_img.paste(content, (x1, target_y))
-        self.edit_bitmap = new_img
+        self._move_ink(bbox, x1, target_y)
         self._save_to_undo()
         self._update_preview()
     
@@ -2558,7 +5268,7 @@ class GlyphEditor(tk.Toplevel):
             new_x1 = max(0, min(target_x, Config.CANVAS_SIZE - sel_w))
             new_y1 = max(0, min(target_y, Config.CANVAS_SIZE - sel_h))
             # マスクを使用して黒い部分のみを貼り付け
-            mask = self.selected_image.point(lambda p: 255 if p < 255 else 0)
+            mask = self._selection_mask()
             self.edit_bitmap.paste(self.selected_image, (new_x1, new_y1), mask)
             self.selection_start = (new_x1, new_y1)
             self.selection_end = (new_x1 + sel_w, new_y1 + sel_h)
@@ -2566,7 +5276,7 @@ class GlyphEditor(tk.Toplevel):
             self._update_preview()
             return
         # 選択が無ければ全体を中央に配置
-        bbox = self.edit_bitmap.getbbox()
+        bbox = self._ink_bbox()
         if not bbox:
             return
         x1, y1, x2, y2 = bbox
@@ -2574,10 +5284,9 @@ class GlyphEditor(tk.Toplevel):
         content_height = y2 - y1
         target_x = (Config.CANVAS_SIZE - content_width) // 2
         target_y = (Config.CANVAS_SIZE - content_height) // 2
-        new_img = Image.new('L', (Config.CANVAS_SIZE, Config.CANVAS_SIZE), 255)
-        content = self.edit_bitmap.crop(bbox)
-        new_img.paste(content, (target_x, target_y))
-        self.edit_bitmap = new_img
+        if (target_x, target_y) == (x1, y1):
+            return
+        self._move_ink(bbox, target_x, target_y)
         self._save_to_undo()
         self._update_preview()
     
@@ -2585,19 +5294,18 @@ class GlyphEditor(tk.Toplevel):
     
     def _undo(self) -> None:
         """元に戻す"""
-        if len(self.undo_stack) > 1:
-            # 現在の状態をリドゥスタックへ
-            self.redo_stack.append(self.undo_stack.pop())
-            # 1つ前の状態を復元
-            self.edit_bitmap = self.undo_stack[-1].copy()
+        if self.history.can_undo:
+            # 1つ前の状態を復元（変更領域のみ書き戻す）
+            self.edit_bitmap = self.history.undo()
+            # [MOD] 2026-10-19: 保存した状態まで戻ったら未保存ではない
+            self._set_session_modified(not self.history.is_saved)
             self._update_preview()
     
     def _redo(self) -> None:
         """やり直し"""
-        if self.redo_stack:
-            state = self.redo_stack.pop()
-            self.undo_stack.append(state)
-            self.edit_bitmap = state.copy()
+        if self.history.can_redo:
+            self.edit_bitmap = self.history.redo()
+            self._set_session_modified(not self.history.is_saved)
             self._update_preview()
     
     def _copy(self) -> None:
@@ -2636,6 +5344,8 @@ class GlyphEditor(tk.Toplevel):
         # グリフを更新
         self.project.set_glyph(self.char_code, self.edit_bitmap.copy(), is_edited=True)
         self.project.mark_as_edited(self.char_code)
+        self.glyph = self.project.glyphs.get(self.char_code)
+        self._set_session_modified(False)
         
         # コールバック実行
         if self.on_save:
@@ -2677,7 +5387,8 @@ class GlyphEditor(tk.Toplevel):
             if self.on_save:
                 self.on_save()
             
-            self.destroy()
+            # [MOD] 2026-10-19: プール型エディタではこのグリフのタブのみ閉じる
+            self._close_session(self.char_code, confirm=False)
     
     def _load_from_other_font(self) -> None:
         """他のフォントから読み込み"""
@@ -3367,19 +6078,176 @@ class GlyphEditor(tk.Toplevel):
                 self.preview_canvas.config(cursor='')
         
         # ペン・消しゴムツール選択時、ブラシカーソル表示
+        # [MOD] 2026-10-19: カーソル項目は作り直さず座標を更新する（スクロール位置も考慮）
         if self.current_tool in ['pen', 'eraser']:
-            if self.brush_cursor:
-                self.preview_canvas.delete(self.brush_cursor)
-            
             radius = int(self.brush_size * self.zoom_level / 2)
+            cx = self.preview_canvas.canvasx(event.x)
+            cy = self.preview_canvas.canvasy(event.y)
             
-            self.brush_cursor = self.preview_canvas.create_oval(
-                event.x - radius, event.y - radius,
-                event.x + radius, event.y + radius,
+            self.brush_cursor = self._overlay(
+                'brush_cursor', 'oval',
+                (cx - radius, cy - radius, cx + radius, cy + radius),
+                persistent=True,
                 outline='red' if self.current_tool == 'pen' else 'blue',
                 width=1,
                 dash=(2, 2)
             )
+        else:
+            self._hide_overlay('brush_cursor')
+
+    # ===== グリフ切り替え (2026-10-19: プール型エディタ) =====
+    
+    def open_glyph(self, char_code: int) -> None:
+        """
+        このウィンドウで別のグリフを開く
+        キャンバス・背景・表示タイル・ズーム等は使い回し、グリフ毎の編集状態のみ切り替える。
+        開いていたグリフの履歴は圧縮してタブに残す。
+        """
+        self.deiconify()
+        self.lift()
+        if char_code == self.char_code:
+            return
+        if self.is_text_mode:
+            messagebox.showinfo('切り替え', 'テキスト入力を確定またはキャンセルしてから切り替えてください')
+            return
+        
+        self._stash_session()
+        session = self._sessions.get(char_code)
+        if session is None:
+            glyph = self.project.glyphs.get(char_code)
+            if glyph and not glyph.is_empty:
+                bitmap = glyph.bitmap.copy()
+            else:
+                bitmap = Image.new('L', (Config.CANVAS_SIZE, Config.CANVAS_SIZE), 255)
+            session = GlyphSession(char_code, EditHistory(bitmap, Config.EDITOR_UNDO_LIMIT))
+            self._sessions[char_code] = session
+        self._activate_session(session)
+        self._evict_sessions()
+        self._refresh_tabs()
+    
+    def _open_adjacent_glyph(self, step: int) -> None:
+        """現在の範囲で前後の文字を開く"""
+        codes = self.project.get_char_codes()
+        if not codes:
+            return
+        try:
+            idx = codes.index(self.char_code) + step
+        except ValueError:
+            idx = 0
+        if 0 <= idx < len(codes):
+            self.open_glyph(codes[idx])
+    
+    def _stash_session(self) -> None:
+        """表示中のグリフの状態を履歴に確定して圧縮する"""
+        self._save_to_undo()
+        self.history.compact()
+    
+    def _activate_session(self, session: GlyphSession) -> None:
+        """セッションを表示中のグリフにする"""
+        self._session_clock += 1
+        session.last_used = self._session_clock
+        self.char_code = session.char_code
+        self.glyph = self.project.glyphs.get(session.char_code)
+        self.history = session.history
+        self.edit_bitmap = session.history.current()
+        
+        # グリフ固有の操作状態をリセット
+        self.is_drawing = False
+        self.last_x = None
+        self.last_y = None
+        self.selection_start = None
+        self.selection_end = None
+        self.selected_image = None
+        self.is_moving = False
+        self.move_start_offset = None
+        self.move_current_pos = None
+        self.is_resizing = False
+        self.resize_origin = None
+        self.resize_handle = None
+        self.resize_preview_rect = None
+        self.shape_start = None
+        self.shape_end = None
+        self._ink_fresh = False
+        
+        self.title(f'編集: U+{session.char_code:04X}')
+        # 表示は前回との差分領域のみ更新される
+        self._update_preview()
+    
+    def _evict_sessions(self) -> None:
+        """上限を超えた未変更のセッションを古い順に破棄する"""
+        while len(self._sessions) > Config.EDITOR_MAX_SESSIONS:
+            candidates = [s for s in self._sessions.values()
+                          if s.char_code != self.char_code and not s.modified]
+            if not candidates:
+                break
+            oldest = min(candidates, key=lambda s: s.last_used)
+            del self._sessions[oldest.char_code]
+    
+    def _close_session(self, char_code: int, confirm: bool = True) -> None:
+        """グリフのタブを閉じる。最後の1つならウィンドウを閉じる"""
+        session = self._sessions.get(char_code)
+        if session is None:
+            return
+        if confirm and session.modified:
+            if not messagebox.askyesno('確認', f'U+{char_code:04X} の未保存の変更を破棄しますか？'):
+                return
+        if len(self._sessions) <= 1:
+            self.destroy()
+            return
+        if char_code == self.char_code:
+            if self.is_text_mode:
+                self._cancel_text_input()
+            del self._sessions[char_code]
+            self._activate_session(max(self._sessions.values(), key=lambda s: s.last_used))
+        else:
+            del self._sessions[char_code]
+        self._refresh_tabs()
+    
+    def _set_session_modified(self, modified: bool) -> None:
+        """
+        表示中のグリフの未保存フラグを更新
+        [MOD] 2026-10-19: False（プロジェクトへ反映）なら現在の履歴位置を保存した状態として記録
+        """
+        session = self._sessions.get(self.char_code)
+        if session is not None and not modified:
+            session.history.mark_saved()
+        if session is not None and session.modified != modified:
+            session.modified = modified
+            self._refresh_tabs()
+    
+    def _refresh_tabs(self) -> None:
+        """グリフタブを作り直す"""
+        if not hasattr(self, 'tab_frame'):
+            return
+        for child in self.tab_frame.winfo_children():
+            child.destroy()
+        for code, session in self._sessions.items():
+            try:
+                label = chr(code)
+            except ValueError:
+                label = ''
+            label = f'{label} U+{code:04X}' + (' *' if session.modified else '')
+            active = code == self.char_code
+            tab = tk.Frame(self.tab_frame, bg=Config.COLOR_ACTIVE if active else Config.COLOR_BG,
+                           relief='sunken' if active else 'raised', bd=1)
+            tab.pack(side='left', padx=1)
+            tk.Button(tab, text=label, relief='flat', bd=0,
+                      bg=Config.COLOR_ACTIVE if active else Config.COLOR_BG,
+                      command=lambda c=code: self.open_glyph(c)).pack(side='left')
+            tk.Button(tab, text='×', relief='flat', bd=0, width=2,
+                      bg=Config.COLOR_ACTIVE if active else Config.COLOR_BG,
+                      command=lambda c=code: self._close_session(c)).pack(side='left')
+    
+    def _on_close_window(self) -> None:
+        """ウィンドウを閉じる（未保存のグリフがあれば確認）"""
+        modified = [s.char_code for s in self._sessions.values() if s.modified]
+        if modified:
+            codes = ', '.join(f'U+{c:04X}' for c in modified[:5])
+            if len(modified) > 5:
+                codes += ' ...'
+            if not messagebox.askyesno('確認', f'未保存の変更があります（{codes}）。\n破棄して閉じますか？'):
+                return
+        self.destroy()
 
     # ===== [BLOCK5.7-END] =====
 
@@ -3476,6 +6344,8 @@ class FontEditorApp(tk.Tk):
         file_menu.add_command(label='フォントを開く...', command=self._open_font)
         file_menu.add_command(label='プロジェクトを保存...', command=self._save_project_dialog)
         file_menu.add_command(label='プロジェクトを開く...', command=self._open_project_dialog)
+        file_menu.add_command(label='フォルダ形式で書き出し... (glyphs/*.png)', command=self._export_project_folder)
+        file_menu.add_command(label='バックアップから復元...', command=self._restore_backup_dialog)
         file_menu.add_separator()
         file_menu.add_command(label='バックグラウンド読み込み停止', command=self._stop_bg_loading)
         file_menu.add_separator()
@@ -3492,6 +6362,8 @@ class FontEditorApp(tk.Tk):
         menubar.add_cascade(label='エクスポート', menu=export_menu)
         export_menu.add_command(label='BDF形式で保存...', command=self._export_bdf)
         export_menu.add_command(label='TTF形式で保存... (高品質アウトライン)', command=self._export_ttf)
+        export_menu.add_command(label='OTF形式で保存... (CFFアウトライン)', command=self._export_otf)  # [ADD] 2026-10-19
+        export_menu.add_command(label='サブセット書き出し... (TTF/WOFF/WOFF2)', command=self._export_subset_dialog)
         export_menu.add_separator()
         export_menu.add_command(label='PNG一括書き出し...', command=self._export_png_batch)
         
@@ -3682,6 +6554,14 @@ class FontEditorApp(tk.Tk):
             self.grid_view.refresh()
             self._update_status()
         
+        # [MOD] 2026-10-19: 開いているエディタがあればウィンドウを使い回してグリフを切り替える
+        self._open_editors = [e for e in self._open_editors if e.winfo_exists()]
+        if Config.EDITOR_REUSE_WINDOW and self._open_editors:
+            editor = self._open_editors[-1]
+            if editor.project is self.project:
+                editor.open_glyph(char_code)
+                return
+        
         editor = GlyphEditor(self, self.project, char_code, on_save)
         self._open_editors.append(editor)
     
@@ -3726,11 +6606,26 @@ class FontEditorApp(tk.Tk):
         TextPreviewDialog(self, self.project)
     
     def _export_bdf(self) -> None:
-        """BDF書き出し"""
+        """
+        BDF書き出し
+        [MOD] 2026-10-19: ピクセルサイズ（複数可）を指定し、サイズ毎のファイルを書き出す
+        """
         if not self.project.glyphs:
             messagebox.showwarning('警告', 'フォントが読み込まれていません')
             return
         
+        text = simpledialog.askstring(
+            'BDF書き出し', 'ピクセルサイズ（カンマ区切りで複数可）:',
+            initialvalue=', '.join(str(size) for size in Config.BDF_PIXEL_SIZES), parent=self
+        )
+        if not text:
+            return
+        try:
+            sizes = FontExporter.parse_sizes(text)
+        except ValueError as e:
+            messagebox.showwarning('警告', f'ピクセルサイズが正しくありません:\n{e}')
+            return
+        
         path = filedialog.asksaveasfilename(
             title='BDF保存',
             defaultextension='.bdf',
@@ -3738,28 +6633,117 @@ class FontEditorApp(tk.Tk):
         )
         
         if path:
-            if FontExporter.export_bdf(self.project, path):
-                messagebox.showinfo('書き出し完了', f'BDF書き出し完了:\n{path}')
+            self.config(cursor='watch')
+            self.update_idletasks()
+            try:
+                paths = FontExporter.export_bdf(self.project, path, sizes)
+            finally:
+                self.config(cursor='')
+            if paths:
+                messagebox.showinfo('書き出し完了', 'BDF書き出し完了:\n' + '\n'.join(paths))
+    
+    def _export_ttf(self) -> None:
+        """
+        TTF書き出し
+        [MOD] 2026-10-19: 変換の進捗（毎秒の変換数）を表示し、キャンセルできるようにした
+        """
+        if not self.project.glyphs:
+            messagebox.showwarning('警告', 'フォントが読み込まれていません')
+            return
+        
+        if not self.project.original_ttf_path:
+            messagebox.showwarning('警告', '元のTTFファイルが必要です')
+            return
+        
+        path = filedialog.asksaveasfilename(
+            title='TTF保存',
+            defaultextension='.ttf',
+            filetypes=[('TrueType Font', '*.ttf'), ('All Files', '*.*')]
+        )
+        
+        if not path:
+            return
+        
+        progress_win, progress_callback, cancel_event = self._export_progress('TTF書き出し中...')
+        try:
+            success = TTFExporter.export_ttf(self.project, path, progress_callback, cancel_event)
+        finally:
+            progress_win.destroy()
+        
+        if success:
+            messagebox.showinfo('書き出し完了', f'TTF書き出し完了:\n{path}')
+        elif cancel_event.is_set():
+            messagebox.showinfo('書き出し中止', 'TTF書き出しを中止しました')
     
-    def _export_ttf(self) -> None:
-        """TTF書き出し"""
+    def _export_otf(self) -> None:
+        """OTF（CFFアウトライン）書き出し (2026-10-19: 新規追加)"""
         if not self.project.glyphs:
             messagebox.showwarning('警告', 'フォントが読み込まれていません')
             return
         
-        if not self.project.original_ttf_path:
-            messagebox.showwarning('警告', '元のTTFファイルが必要です')
-            return
-        
         path = filedialog.asksaveasfilename(
-            title='TTF保存',
-            defaultextension='.ttf',
-            filetypes=[('TrueType Font', '*.ttf'), ('All Files', '*.*')]
+            title='OTF保存',
+            defaultextension='.otf',
+            filetypes=[('OpenType Font (CFF)', '*.otf'), ('All Files', '*.*')]
         )
         
-        if path:
-            if TTFExporter.export_ttf(self.project, path):
-                messagebox.showinfo('書き出し完了', f'TTF書き出し完了:\n{path}')
+        if not path:
+            return
+        
+        progress_win, progress_callback, cancel_event = self._export_progress('OTF書き出し中...')
+        try:
+            success = TTFExporter.export_otf(self.project, path, progress_callback, cancel_event)
+        finally:
+            progress_win.destroy()
+        
+        if success:
+            messagebox.showinfo('書き出し完了', f'OTF書き出し完了:\n{path}')
+        elif cancel_event.is_set():
+            messagebox.showinfo('書き出し中止', 'OTF書き出しを中止しました')
+    
+    def _export_progress(self, title: str) -> Tuple[tk.Toplevel, Callable[[int, int, float], None], threading.Event]:
+        """
+        アウトライン変換の進捗ウィンドウ（キャンセルボタン付き） (2026-10-19: _export_ttf から分離)
+        Returns: (ウィンドウ, TTFExporter に渡す progress_callback, cancel_event)
+        """
+        # プログレスウィンドウ作成
+        progress_win = tk.Toplevel(self)
+        progress_win.title(title)
+        progress_win.geometry('500x170')
+        progress_win.transient(self)
+        progress_win.grab_set()
+        
+        tk.Label(
+            progress_win,
+            text='グリフをアウトラインに変換しています...',
+            font=('Arial', 12)
+        ).pack(pady=10)
+        
+        progress_var = tk.IntVar(value=0)
+        progress_bar = ttk.Progressbar(progress_win, variable=progress_var, length=400)
+        progress_bar.pack(pady=5)
+        
+        progress_label = tk.Label(progress_win, text='準備中...', font=('Arial', 10))
+        progress_label.pack()
+        
+        cancel_event = threading.Event()
+        
+        def cancel() -> None:
+            cancel_event.set()
+            progress_label.config(text='中止しています...')
+        
+        tk.Button(progress_win, text='キャンセル', command=cancel, width=10).pack(pady=8)
+        progress_win.protocol('WM_DELETE_WINDOW', cancel)
+        
+        def progress_callback(current: int, total: int, rate: float) -> None:
+            """プログレス更新"""
+            if not cancel_event.is_set():
+                progress_bar.config(maximum=max(1, total))
+                progress_var.set(current)
+                progress_label.config(text=f'{current} / {total} 文字（{rate:.1f} 文字/秒）')
+            progress_win.update()
+        
+        return progress_win, progress_callback, cancel_event
     
     def _export_png_batch(self) -> None:
         """PNG一括書き出し"""
@@ -4261,6 +7245,198 @@ class FileUtils:
             if parent:
                 messagebox.showerror('エラー', f'エクスポートエラー:\n{e}', parent=parent)
 
+
+class FontExporter:
+    """
+    ビットマップ形式の書き出し（BDF・PNG一括） (2026-10-19: 新規追加)
+    グリフはスレッドで並列に展開・縮小し、結果を文字コード順にファイルへ書き流す。
+    未復号のグリフは格納PNGから直接展開し、展開した画像をグリフに保持しない（全グリフを読み込んだままにしない）
+    """
+    
+    _UNSAFE_FILENAME = set('\\/:*?"<>|')  # ファイル名に使えない文字
+    
+    @staticmethod
+    def _glyph_image(glyph: GlyphData) -> Optional[Image.Image]:
+        """グリフ画像（未復号なら格納PNGから展開するだけで、グリフには保持しない）"""
+        blob = glyph.stored_blob()
+        if blob:
+            return FontProject._decode_glyph(blob)
+        return glyph.bitmap
+    
+    @staticmethod
+    def _run_ordered(func: Callable[[Tuple[int, GlyphData]], Any],
+                     items: List[Tuple[int, GlyphData]]) -> Any:
+        """items を並列に処理し、結果を items の順に返すジェネレーター（先行する件数を抑える）"""
+        workers = max(1, Config.PROJECT_IO_WORKERS)
+        chunk = workers * 64
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='glyph-export') as pool:
+            for start in range(0, len(items), chunk):
+                yield from pool.map(func, items[start:start + chunk])
+    
+    @staticmethod
+    def downsample(image: Image.Image, sizes: List[int]) -> List[Image.Image]:
+        """
+        sizes の各サイズの正方形へ面積平均で縮小し、Config.TRACE_THRESHOLD で2値化した1bit画像（1=インク）のリスト
+        （TTFの埋め込みビットマップでも使う）
+        """
+        lut = [255 if v < Config.TRACE_THRESHOLD else 0 for v in range(256)]
+        # 最大サイズの4倍程度まで整数倍で縮小してから各サイズへ（面積平均なので結果はほぼ同じで、全画素を読むのは1回）
+        factor = max(1, min(image.size) // (max(sizes) * 4))
+        base = image.reduce(factor) if factor > 1 else image
+        return [base.resize((size, size), Image.BOX).point(lut, '1') for size in sizes]
+    
+    @staticmethod
+    def parse_sizes(text: str) -> List[int]:
+        """'16, 24 32' のようなピクセルサイズの指定を解釈する（不正な値は ValueError）"""
+        sizes = sorted({int(value) for value in re.split(r'[\s,]+', text.strip()) if value})
+        if not sizes or sizes[0] < 4 or sizes[-1] > 512:
+            raise ValueError('ピクセルサイズは 4～512 で指定してください')
+        return sizes
+    
+    @staticmethod
+    def export_bdf(project: FontProject, path: str, sizes: Optional[List[int]] = None) -> List[str]:
+        """
+        BDF形式で書き出し、書き出したファイルのリストを返す（失敗したら空）
+        sizes（既定は Config.BDF_PIXEL_SIZES）のピクセルサイズ毎に1ファイル。
+        複数なら '<名前>-<サイズ>.bdf' とする。
+        各グリフは面積平均で縮小して Config.TRACE_THRESHOLD で2値化し、インクの外接矩形を BBX にする
+        """
+        sizes = sorted(set(sizes or Config.BDF_PIXEL_SIZES))
+        with project._lock:
+            items = sorted((code, glyph) for code, glyph in project.glyphs.items() if not glyph.is_empty)
+        if not items:
+            messagebox.showwarning('警告', '書き出すグリフがありません')
+            return []
+        
+        root, ext = os.path.splitext(path)
+        paths = [path] if len(sizes) == 1 else [f'{root}-{size}{ext or ".bdf"}' for size in sizes]
+        
+        def render(item: Tuple[int, GlyphData]) -> List[str]:
+            code, glyph = item
+            image = FontExporter._glyph_image(glyph)
+            if image is None:
+                return [FontExporter._bdf_char(code, None, size) for size in sizes]
+            return [
+                FontExporter._bdf_char(code, small, size)
+                for size, small in zip(sizes, FontExporter.downsample(image, sizes))
+            ]
+        
+        files: List[Any] = []
+        try:
+            for size, out in zip(sizes, paths):
+                f = open(out + '.tmp', 'w', encoding='ascii', newline='\n')
+                files.append(f)
+                f.write(FontExporter._bdf_header(size, len(items)))
+            for records in FontExporter._run_ordered(render, items):
+                for f, record in zip(files, records):
+                    f.write(record)
+            for f in files:
+                f.write('ENDFONT\n')
+                f.close()
+            for out in paths:
+                os.replace(out + '.tmp', out)
+            print(f'BDF書き出し完了: {len(items)} 文字 × {len(sizes)} サイズ')
+            return paths
+        except Exception as e:
+            messagebox.showerror('書き出しエラー', f'BDF書き出し失敗:\n{e}')
+            import traceback
+            traceback.print_exc()
+            for f in files:
+                f.close()
+            for out in paths:
+                if os.path.exists(out + '.tmp'):
+                    os.remove(out + '.tmp')
+            return []
+    
+    @staticmethod
+    def _bdf_header(size: int, count: int) -> str:
+        """BDFのヘッダー（FONTBOUNDINGBOX は全角の升目。各グリフの BBX はその内側）"""
+        descent = round(size * Config.DESCENT_RATIO)
+        spacing = 'P' if Config.BDF_PROPORTIONAL else 'C'
+        return (
+            'STARTFONT 2.1\n'
+            f'FONT -FontEditor-CustomFont-Medium-R-Normal--{size}-{size * 10}-75-75-{spacing}-{size * 10}-ISO10646-1\n'
+            f'SIZE {size} 75 75\n'
+            f'FONTBOUNDINGBOX {size} {size} 0 {-descent}\n'
+            'STARTPROPERTIES 8\n'
+            f'PIXEL_SIZE {size}\n'
+            f'POINT_SIZE {size * 10}\n'
+            'RESOLUTION_X 75\n'
+            'RESOLUTION_Y 75\n'
+            f'FONT_ASCENT {size - descent}\n'
+            f'FONT_DESCENT {descent}\n'
+            'CHARSET_REGISTRY "ISO10646"\n'
+            'CHARSET_ENCODING "1"\n'
+            'ENDPROPERTIES\n'
+            f'CHARS {count}\n'
+        )
+    
+    @staticmethod
+    def _bdf_char(code: int, image: Optional[Image.Image], size: int) -> str:
+        """1文字分の STARTCHAR～ENDCHAR（image は size 角の1bit画像、1=インク）"""
+        descent = round(size * Config.DESCENT_RATIO)
+        bbox = image.getbbox() if image is not None else None
+        if bbox is None:
+            width = size // 2 if Config.BDF_PROPORTIONAL else size
+            return (
+                f'STARTCHAR uni{code:04X}\nENCODING {code}\n'
+                f'SWIDTH {width * 1000 // size} 0\nDWIDTH {width} 0\nBBX 0 0 0 0\nBITMAP\nENDCHAR\n'
+            )
+        x0, y0, x1, y1 = bbox
+        width = min(size, x1 + 1) if Config.BDF_PROPORTIONAL else size
+        # 1bit画像の行はバイト境界まで0で詰めてあるので、そのまま16進の行になる
+        data = image.crop(bbox).tobytes().hex().upper()
+        step = (x1 - x0 + 7) // 8 * 2
+        rows = '\n'.join(data[i:i + step] for i in range(0, len(data), step))
+        return (
+            f'STARTCHAR uni{code:04X}\nENCODING {code}\n'
+            f'SWIDTH {width * 1000 // size} 0\nDWIDTH {width} 0\n'
+            f'BBX {x1 - x0} {y1 - y0} {x0} {size - y1 - descent}\nBITMAP\n{rows}\nENDCHAR\n'
+        )
+    
+    @staticmethod
+    def export_png_batch(project: FontProject, folder: str, size: Optional[int] = None) -> int:
+        """
+        全グリフを 'U+XXXX<文字>.png' として書き出し、書き出した数を返す
+        size（既定は Config.DEFAULT_PNG_EXPORT_SIZE）と同じ大きさで格納されているグリフは、格納PNGをそのまま書く
+        """
+        size = size or Config.DEFAULT_PNG_EXPORT_SIZE
+        with project._lock:
+            items = sorted((code, glyph) for code, glyph in project.glyphs.items() if not glyph.is_empty)
+        
+        def write(item: Tuple[int, GlyphData]) -> bool:
+            code, glyph = item
+            blob = glyph.stored_blob()
+            if not blob or Image.open(io.BytesIO(blob)).size != (size, size):
+                image = FontExporter._glyph_image(glyph)
+                if image is None:
+                    return False
+                if image.size != (size, size):
+                    image = image.resize((size, size), Image.LANCZOS)
+                blob = FontProject._encode_glyph(image)
+            with open(os.path.join(folder, FontExporter._png_name(code)), 'wb') as f:
+                f.write(blob)
+            return True
+        
+        count = 0
+        try:
+            for written in FontExporter._run_ordered(write, items):
+                count += written
+        except Exception as e:
+            messagebox.showerror('書き出しエラー', f'PNG書き出し失敗:\n{e}')
+        return count
+    
+    @staticmethod
+    def _png_name(code: int) -> str:
+        """PNGのファイル名（ファイル名に使えない文字・空白・制御文字は付けない）"""
+        try:
+            char = chr(code) if code < 0x10000 else ''
+        except ValueError:
+            char = ''
+        if not char.isprintable() or char.isspace() or char in FontExporter._UNSAFE_FILENAME:
+            char = ''
+        return f'U+{code:04X}{char}.png'
+
 # ===== [BLOCK7-END] =====
 
 
@@ -4275,23 +7451,341 @@ class FileUtils:
 
 # ===== [BLOCK8-BEGIN] TTF高品質書き出し (2025-10-11: 型ヒント追加、定数使用、エラーハンドリング改善) =====
 
+class BitmapTracer:
+    """
+    ビットマップ → アウトラインの内蔵トレーサー（potrace方式） (2026-10-19: 新規追加)
+
+    1. 画素境界をたどって輪郭を得る（インクを右手に見る向き＝外側の輪郭が時計回り）
+    2. 面積が turdsize 以下の輪郭を捨て、境界辺の中点列を折れ線に近似（階段状のギザギザを除く）
+    3. 各頂点を alphamax で角か滑らかかに分け、滑らかな頂点は3次ベジエにする（potrace の smooth と同じ式）
+    4. 同じ向きに曲がる連続した曲線を、誤差 opttolerance 以内なら1本にまとめる
+    境界の抽出に numpy を使う（無い場合は potrace を使う）
+    """
+
+    # 方向: 0=東, 1=南, 2=西, 3=北（画像座標、yは下向き）
+    _DX = (1, 0, -1, 0)
+    _DY = (0, 1, 0, -1)
+
+    def __init__(self, threshold: Optional[int] = None, turdsize: Optional[int] = None,
+                 alphamax: Optional[float] = None, opttolerance: Optional[float] = None,
+                 poly_tolerance: Optional[float] = None) -> None:
+        self.threshold = Config.TRACE_THRESHOLD if threshold is None else threshold
+        self.turdsize = Config.TRACE_TURDSIZE if turdsize is None else turdsize
+        self.alphamax = Config.TRACE_ALPHAMAX if alphamax is None else alphamax
+        self.opttolerance = Config.TRACE_OPTTOLERANCE if opttolerance is None else opttolerance
+        self.poly_tolerance = Config.TRACE_POLY_TOLERANCE if poly_tolerance is None else poly_tolerance
+
+    @staticmethod
+    def available() -> bool:
+        return np is not None
+
+    def trace(self, bitmap: Image.Image) -> List[List[Tuple[Any, ...]]]:
+        """
+        輪郭のリストを返す（画像座標）
+        各輪郭は ('corner', 頂点, 終点) / ('curve', 制御点1, 制御点2, 終点) の並びで、前の終点から続く
+        """
+        contours = []
+        for corners in self._boundary_paths(bitmap):
+            if abs(self._area(corners)) <= self.turdsize:
+                continue
+            poly = self._simplify(self._edge_midpoints(corners))
+            if len(poly) < 3:
+                continue
+            segments = self._smooth(poly)
+            if self.opttolerance > 0:
+                segments = self._merge_curves(segments)
+            contours.append(segments)
+        return contours
+
+    @staticmethod
+    def draw(contours: List[List[Tuple[Any, ...]]], pen: Any, height: int, scale: float = 1.0) -> None:
+        """輪郭をペンに描く（y軸を反転し、scale倍してフォント座標へ）"""
+        def pt(p: Any) -> Tuple[float, float]:
+            return (float(p[0]) * scale, (height - float(p[1])) * scale)
+
+        for segments in contours:
+            pen.moveTo(pt(segments[-1][-1]))
+            for seg in segments:
+                if seg[0] == 'corner':
+                    pen.lineTo(pt(seg[1]))
+                    pen.lineTo(pt(seg[2]))
+                else:
+                    pen.curveTo(pt(seg[1]), pt(seg[2]), pt(seg[3]))
+            pen.closePath()
+
+    # ----- 1. 境界の追跡 -----
+
+    def _boundary_paths(self, bitmap: Image.Image) -> List[List[Tuple[int, int]]]:
+        """画素境界の閉路を角の頂点列 [(x, y), ...] で返す"""
+        img = bitmap if bitmap.mode == 'L' else bitmap.convert('L')
+        ink = np.asarray(img) < self.threshold
+        h, w = ink.shape
+        pad = np.zeros((h + 2, w + 2), dtype=bool)
+        pad[1:-1, 1:-1] = ink
+        stride = w + 3  # 頂点格子 (h+3) x (w+3)
+        out = np.zeros((h + 3) * stride, dtype=np.uint8)  # 頂点から出る辺（方向ごとのビット）
+
+        # 横の辺: 上がインクなら東向き、下がインクなら西向き
+        hdiff = pad[:-1, :] != pad[1:, :]
+        ys, xs = np.nonzero(hdiff & pad[:-1, :])
+        out[(ys + 1) * stride + xs] |= 1
+        ys, xs = np.nonzero(hdiff & pad[1:, :])
+        out[(ys + 1) * stride + xs + 1] |= 4
+        # 縦の辺: 右がインクなら南向き、左がインクなら北向き
+        vdiff = pad[:, :-1] != pad[:, 1:]
+        ys, xs = np.nonzero(vdiff & pad[:, 1:])
+        out[ys * stride + xs + 1] |= 2
+        ys, xs = np.nonzero(vdiff & pad[:, :-1])
+        out[(ys + 1) * stride + xs + 1] |= 8
+
+        starts = np.flatnonzero(out).tolist()
+        bits = bytearray(out.tobytes())
+        step = (1, stride, -1, -stride)
+        paths = []
+        for start in starts:
+            while bits[start]:
+                b = bits[start]
+                first = (b & -b).bit_length() - 1
+                v, d = start, first
+                corners = [start]
+                bits[v] &= ~(1 << d)
+                v += step[d]
+                while True:
+                    b = bits[v]
+                    # 斜めに接する画素の頂点では右折を優先（インク同士をつなぐ）
+                    for nd in ((d + 1) & 3, d, (d + 3) & 3):
+                        if b & (1 << nd) or (v == start and nd == first):
+                            break
+                    else:
+                        break
+                    if v == start and nd == first:
+                        break
+                    if nd != d:
+                        corners.append(v)
+                    bits[v] &= ~(1 << nd)
+                    d = nd
+                    v += step[nd]
+                if d == first:
+                    corners.pop(0)  # 始点は直線の途中
+                # 頂点番号 → 元画像の座標（インクを左手に見てたどったので逆順にする）
+                paths.append([(c % stride - 1, c // stride - 1) for c in reversed(corners)])
+        return paths
+
+    @staticmethod
+    def _area(corners: List[Tuple[int, int]]) -> float:
+        """頂点列の符号付き面積"""
+        area = 0
+        for (x0, y0), (x1, y1) in zip(corners, corners[1:] + corners[:1]):
+            area += x0 * y1 - x1 * y0
+        return area / 2
+
+    @staticmethod
+    def _edge_midpoints(corners: List[Tuple[int, int]]) -> Any:
+        """角の頂点列から、境界の単位辺の中点列を作る（階段の段差は中点では直線に並ぶ）"""
+        pts = np.asarray(corners, dtype=np.float64)
+        nxt = np.roll(pts, -1, axis=0)
+        delta = nxt - pts
+        lengths = np.abs(delta).sum(axis=1).astype(np.int64)
+        unit = delta / np.maximum(lengths, 1)[:, None]
+        idx = np.repeat(np.arange(len(pts)), lengths)
+        offset = np.arange(len(idx)) - np.repeat(np.cumsum(lengths) - lengths, lengths) + 0.5
+        return pts[idx] + unit[idx] * offset[:, None]
+
+    # ----- 2. 折れ線近似 -----
+
+    def _simplify(self, pts: Any) -> Any:
+        """閉じた点列を Douglas-Peucker で折れ線に近似"""
+        n = len(pts)
+        if n < 4:
+            return pts
+        far = int(np.argmax(((pts - pts[0]) ** 2).sum(axis=1)))
+        keep = np.zeros(n, dtype=bool)
+        keep[0] = keep[far] = True
+        tol2 = self.poly_tolerance ** 2
+        stack = [(0, far), (far, n)]
+        while stack:
+            i, j = stack.pop()
+            if j - i < 2:
+                continue
+            a, b = pts[i], pts[j % n]
+            seg = pts[i + 1:j]
+            ab = b - a
+            denom = float(ab @ ab)
+            if denom > 0:
+                t = np.clip(((seg - a) @ ab) / denom, 0.0, 1.0)
+                diff = seg - (a + t[:, None] * ab)
+            else:
+                diff = seg - a
+            dist2 = (diff ** 2).sum(axis=1)
+            k = int(np.argmax(dist2))
+            if dist2[k] > tol2:
+                m = i + 1 + k
+                keep[m] = True
+                stack.append((i, m))
+                stack.append((m, j))
+        return pts[keep]
+
+    # ----- 3. 角・曲線の判定 -----
+
+    def _smooth(self, v: Any) -> List[Tuple[Any, ...]]:
+        """potrace の smooth: 頂点 j の前後の辺の中点を、角なら折れ線、そうでなければベジエで結ぶ"""
+        m = len(v)
+        segments = []
+        for i in range(m):
+            j, k = (i + 1) % m, (i + 2) % m
+            p4 = (v[k] + v[j]) / 2
+            # ddenom: 弦 i→k に直交する無限大ノルム方向での長さ
+            ry, rx = np.sign(v[k][0] - v[i][0]), -np.sign(v[k][1] - v[i][1])
+            denom = ry * (v[k][0] - v[i][0]) - rx * (v[k][1] - v[i][1])
+            if denom != 0:
+                # dpara: 頂点 j の弦 i→k からの離れ具合
+                dd = abs(((v[j][0] - v[i][0]) * (v[k][1] - v[i][1])
+                          - (v[k][0] - v[i][0]) * (v[j][1] - v[i][1])) / denom)
+                alpha = (1 - 1.0 / dd if dd > 1 else 0.0) / 0.75
+            else:
+                alpha = 4.0 / 3.0
+            if alpha >= self.alphamax:
+                segments.append(('corner', v[j], p4))
+            else:
+                alpha = min(max(alpha, 0.55), 1.0)
+                p2 = v[i] + (0.5 + 0.5 * alpha) * (v[j] - v[i])
+                p3 = v[k] + (0.5 + 0.5 * alpha) * (v[j] - v[k])
+                segments.append(('curve', p2, p3, p4))
+        return segments
+
+    # ----- 4. 曲線の結合 -----
+
+    def _merge_curves(self, segments: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+        """同じ向きに曲がる連続した曲線を、誤差 opttolerance 以内で1本の3次ベジエにまとめる"""
+        n = len(segments)
+        if n < 2:
+            return segments
+        merged: List[Tuple[Any, ...]] = []
+        i = 0
+        while i < n:
+            seg = segments[i]
+            if seg[0] != 'curve':
+                merged.append(seg)
+                i += 1
+                continue
+            start = segments[i - 1][-1]
+            best, j = seg, i + 1
+            while j < n and segments[j][0] == 'curve':
+                candidate = self._fit_run(start, segments[i:j + 1])
+                if candidate is None:
+                    break
+                best, j = candidate, j + 1
+            merged.append(best)
+            i = j
+        return merged
+
+    def _fit_run(self, start: Any, run: List[Tuple[Any, ...]]) -> Optional[Tuple[Any, ...]]:
+        """曲線の並びを端の接線を保ったまま1本で近似（向きが揃わない・誤差超過なら None）"""
+        # 各曲線の標本点
+        t = np.array([0.25, 0.5, 0.75, 1.0])
+        mt = 1 - t
+        samples, p0 = [], start
+        turn, sign = 0.0, 0.0
+        prev_dir = None
+        for _kind, c1, c2, p3 in run:
+            samples.append((mt ** 3)[:, None] * p0 + (3 * mt * mt * t)[:, None] * c1
+                           + (3 * mt * t * t)[:, None] * c2 + (t ** 3)[:, None] * p3)
+            for a, b in ((p0, c1), (c2, p3)):
+                direction = b - a
+                if prev_dir is not None:
+                    cross = prev_dir[0] * direction[1] - prev_dir[1] * direction[0]
+                    # 継ぎ目の接線はほぼ平行なので、微小な外積は向きの判定に使わない
+                    if abs(cross) > 1e-3 * np.linalg.norm(prev_dir) * np.linalg.norm(direction):
+                        if cross * sign < 0:
+                            return None  # 変曲点をまたぐ
+                        sign = sign or cross
+                    turn += abs(np.arctan2(cross, prev_dir @ direction))
+                prev_dir = direction
+            p0 = p3
+        if turn > np.pi * 0.6:
+            return None
+        pts = np.vstack([start[None, :]] + samples)
+        end = run[-1][3]
+        t0 = run[0][1] - start
+        t1 = run[-1][2] - end
+        n0, n1 = np.linalg.norm(t0), np.linalg.norm(t1)
+        if n0 == 0 or n1 == 0:
+            return None
+        t0, t1 = t0 / n0, t1 / n1
+        # 弦長で媒介変数を割り当て、接線方向の長さを最小二乗で決める (Schneider)
+        chord = np.concatenate([[0.0], np.cumsum(np.linalg.norm(np.diff(pts, axis=0), axis=1))])
+        if chord[-1] == 0:
+            return None
+        u = chord / chord[-1]
+        mu = 1 - u
+        b0, b1, b2, b3 = mu ** 3, 3 * mu * mu * u, 3 * mu * u * u, u ** 3
+        a0 = b1[:, None] * t0
+        a1 = b2[:, None] * t1
+        rest = pts - (b0 + b1)[:, None] * start - (b2 + b3)[:, None] * end
+        m = np.array([[np.sum(a0 * a0), np.sum(a0 * a1)], [np.sum(a0 * a1), np.sum(a1 * a1)]])
+        rhs = np.array([np.sum(a0 * rest), np.sum(a1 * rest)])
+        if abs(np.linalg.det(m)) < 1e-12:
+            return None
+        for _ in range(4):
+            l0, l1 = np.linalg.solve(m, rhs)
+            if l0 <= 0 or l1 <= 0:
+                return None
+            c1, c2 = start + l0 * t0, end + l1 * t1
+            fitted = b0[:, None] * start + b1[:, None] * c1 + b2[:, None] * c2 + b3[:, None] * end
+            error = fitted - pts
+            if np.max(np.linalg.norm(error, axis=1)) <= self.opttolerance:
+                return ('curve', c1, c2, end)
+            # Newton法で各標本点の媒介変数を曲線上の最近点へ寄せて解き直す
+            d1 = (3 * mu * mu)[:, None] * (c1 - start) + (6 * mu * u)[:, None] * (c2 - c1) + (3 * u * u)[:, None] * (end - c2)
+            d2 = (6 * mu)[:, None] * (c2 - 2 * c1 + start) + (6 * u)[:, None] * (end - 2 * c2 + c1)
+            denom_u = (d1 * d1).sum(axis=1) + (error * d2).sum(axis=1)
+            u = np.clip(u - np.where(denom_u != 0, (error * d1).sum(axis=1) / np.where(denom_u != 0, denom_u, 1), 0), 0, 1)
+            mu = 1 - u
+            b0, b1, b2, b3 = mu ** 3, 3 * mu * mu * u, 3 * mu * u * u, u ** 3
+            a0 = b1[:, None] * t0
+            a1 = b2[:, None] * t1
+            rest = pts - (b0 + b1)[:, None] * start - (b2 + b3)[:, None] * end
+            m = np.array([[np.sum(a0 * a0), np.sum(a0 * a1)], [np.sum(a0 * a1), np.sum(a1 * a1)]])
+            rhs = np.array([np.sum(a0 * rest), np.sum(a1 * rest)])
+            if abs(np.linalg.det(m)) < 1e-12:
+                return None
+        return None
+
+
 class TTFExporter:
     """TTF形式書き出し（アウトライン変換版）"""
     
+    # [ADD] 2026-10-19: potrace の入出力（PBMをstdinへ渡し、SVGをstdoutから読む）
+    _PBM_INVERT = bytes(255 - i for i in range(256))  # PILの1bit画像（1=白）→ PBM（1=黒）
+    _SVG_TOKEN = re.compile(r'([A-Za-z])|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)')
+    _SVG_ARGC = {'M': 2, 'L': 2, 'H': 1, 'V': 1, 'C': 6, 'S': 4, 'Q': 4, 'T': 2, 'Z': 0}
+    _SVG_TRANSFORM = re.compile(r'(\w+)\s*\(([^)]*)\)')
+    
+    @staticmethod
+    def _trace_backend() -> str:
+        """実際に使うアウトライン変換方式 (2026-10-19: 新規追加)"""
+        if Config.TRACE_BACKEND == 'native' and BitmapTracer.available():
+            return 'native'
+        return 'potrace'
+    
     @staticmethod
     def check_dependencies() -> Tuple[bool, str]:
-        """必要な依存関係をチェック"""
+        """
+        必要な依存関係をチェック
+        [MOD] 2026-10-19: potrace は potrace 方式を使う時だけ必要
+        """
         errors = []
         
         # potraceチェック
-        try:
-            result = subprocess.run(['potrace', '--version'], capture_output=True, text=True, timeout=5)
-            if result.returncode != 0:
-                errors.append('potrace がインストールされていません')
-        except FileNotFoundError:
-            errors.append('potrace がインストールされていません\n\nインストール方法:\n- Mac: brew install potrace\n- Linux: apt-get install potrace\n- Windows: http://potrace.sourceforge.net/')
-        except subprocess.TimeoutExpired:
-            errors.append('potrace の起動がタイムアウトしました')
+        if TTFExporter._trace_backend() == 'potrace':
+            try:
+                result = subprocess.run(['potrace', '--version'], capture_output=True, text=True, timeout=5)
+                if result.returncode != 0:
+                    errors.append('potrace がインストールされていません')
+            except FileNotFoundError:
+                errors.append('potrace がインストールされていません\n\nインストール方法:\n- Mac: brew install potrace\n- Linux: apt-get install potrace\n- Windows: http://potrace.sourceforge.net/\n\n（numpy があれば内蔵トレーサーを使えます: pip install numpy）')
+            except subprocess.TimeoutExpired:
+                errors.append('potrace の起動がタイムアウトしました')
         
         # fontToolsチェック
         try:
@@ -4308,9 +7802,17 @@ class TTFExporter:
     def export_ttf(
         project: FontProject, 
         output_path: str, 
-        progress_callback: Optional[Callable[[int, int], None]] = None
+        progress_callback: Optional[Callable[[int, int, float], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        codes: Optional[Set[int]] = None
     ) -> bool:
-        """TTF形式で書き出し（ハイブリッドマージ方式） (2025-10-11: 型ヒント追加、定数使用)"""
+        """
+        TTF形式で書き出し（ハイブリッドマージ方式） (2025-10-11: 型ヒント追加、定数使用)
+        [MOD] 2026-10-19: アウトライン変換をプロセスプールで並列化。
+        progress_callback(変換済み数, 変換対象数, 毎秒の変換数)、cancel_event がセットされたら中止して False
+        [MOD] 2026-10-19: Config.TTF_EXPORT_MODE='patch' なら元のTTFへの差し替えで書き出す（TrueTypeでなければ作り直す）
+        [MOD] 2026-10-19: codes を渡すと、その文字のグリフだけを変換・収録する（output_path はファイルオブジェクトでもよい）
+        """
         
         # 依存関係チェック
         deps_ok, error_msg = TTFExporter.check_dependencies()
@@ -4318,9 +7820,49 @@ class TTFExporter:
             messagebox.showerror('依存関係エラー', error_msg)
             return False
         
+        if Config.TTF_EXPORT_MODE == 'patch':
+            patched = TTFExporter._export_patched(project, output_path, progress_callback, cancel_event, codes)
+            if patched is not None:
+                return patched
+        
+        return TTFExporter._export_rebuilt(project, output_path, progress_callback, cancel_event, codes, 'glyf')
+    
+    @staticmethod
+    def export_otf(
+        project: FontProject,
+        output_path: str,
+        progress_callback: Optional[Callable[[int, int, float], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        codes: Optional[Set[int]] = None
+    ) -> bool:
+        """
+        CFFアウトラインのOpenType (OTF) で書き出し (2026-10-19: 新規追加)
+        変換した3次曲線を2次曲線にせずそのまま CharString にする。変換・キャッシュは TTF と共通（キャッシュは形式ごと）。
+        元のフォントへの差し替えはせず、常に作り直す（引数は export_ttf と同じ）
+        """
+        deps_ok, error_msg = TTFExporter.check_dependencies()
+        if not deps_ok:
+            messagebox.showerror('依存関係エラー', error_msg)
+            return False
+        
+        return TTFExporter._export_rebuilt(project, output_path, progress_callback, cancel_event, codes, 'cff')
+    
+    @staticmethod
+    def _export_rebuilt(
+        project: FontProject,
+        output_path: str,
+        progress_callback: Optional[Callable[[int, int, float], None]],
+        cancel_event: Optional[threading.Event],
+        codes: Optional[Set[int]],
+        target: str
+    ) -> bool:
+        """
+        フォントを作り直して書き出す（target='glyf' で TTF、'cff' で OTF） (2026-10-19: export_ttf から分離)
+        未編集で元のフォントにあるグリフは流用する（形式が違えば元のアウトラインを描き直す）
+        """
+        label = 'TTF' if target == 'glyf' else 'OTF'
         try:
             from fontTools.fontBuilder import FontBuilder  # type: ignore
-            from fontTools.pens.ttGlyphPen import TTGlyphPen  # type: ignore
             from fontTools.ttLib import TTFont  # type: ignore
             
             # 元のTTFを読み込み（存在する場合）
@@ -4336,6 +7878,10 @@ class TTFExporter:
             edited_glyphs = project.get_edited_glyphs()
             with project._lock:  # (2025-10-11: スレッドセーフ化)
                 all_valid_glyphs = [(code, glyph) for code, glyph in project.glyphs.items() if not glyph.is_empty]
+            # [ADD] 2026-10-19: サブセット書き出し
+            if codes is not None:
+                edited_glyphs = [(code, glyph) for code, glyph in edited_glyphs if code in codes]
+                all_valid_glyphs = [(code, glyph) for code, glyph in all_valid_glyphs if code in codes]
             
             if not all_valid_glyphs:
                 messagebox.showwarning('警告', '書き出すグリフがありません')
@@ -4347,7 +7893,7 @@ class TTFExporter:
             print(f'全グリフ: {total}, 編集済み: {edited_count}')
             
             # フォントビルダー作成
-            fb = FontBuilder(Config.CANVAS_SIZE, isTTF=True)
+            fb = FontBuilder(Config.CANVAS_SIZE, isTTF=target == 'glyf')
             fb.setupGlyphOrder(['.notdef'] + [f'uni{code:04X}' for code, _ in all_valid_glyphs])
             
             # フォント情報設定
@@ -4357,7 +7903,7 @@ class TTFExporter:
             # (2025-10-11: 定数使用)
             ascent = int(Config.CANVAS_SIZE * Config.ASCENT_RATIO)
             descent = int(Config.CANVAS_SIZE * Config.DESCENT_RATIO)
-            fb.setupHhea(ascent=ascent, descent=descent)
+            fb.setupHorizontalHeader(ascent=ascent, descent=descent)  # [MOD] 2026-10-19: setupHhea は存在しないため修正
             
             # フォント名設定
             fb.setupNameTable({
@@ -4365,92 +7911,688 @@ class TTFExporter:
                 'styleName': 'Regular',
             })
             
-            # OS/2テーブル
-            fb.setupOS2()
-            
             # グリフ処理
             glyphs: Dict[str, Any] = {}
             metrics: Dict[str, Tuple[int, int]] = {}
             
             # .notdef グリフ
-            glyphs['.notdef'] = TTFExporter._create_notdef_glyph()
+            glyphs['.notdef'] = TTFExporter._create_notdef_glyph(target)
             metrics['.notdef'] = (Config.CANVAS_SIZE, 0)
             
             # 編集済み文字コードのセット
             edited_codes = {code for code, _ in edited_glyphs}
+            # [MOD] 2026-10-19: glyf・CFF どちらの元フォントでも引けるようにグリフセットで判定する
+            original_glyphs = original_font.getGlyphSet() if original_font else {}
             
-            for idx, (code, glyph) in enumerate(all_valid_glyphs):
+            # 編集済み、または元のTTFにないグリフをアウトライン変換の対象にする
+            trace_jobs: List[Tuple[int, GlyphData]] = []
+            for code, glyph in all_valid_glyphs:
+                glyph_name = f'uni{code:04X}'
+                if code not in edited_codes and glyph_name in original_glyphs:
+                    continue
+                trace_jobs.append((code, glyph))
+            
+            # [MOD] 2026-10-19: 変換はワーカープロセスで並列に行い、結果を文字コード順に組み立てる
+            outlines = TTFExporter._trace_glyphs(project, trace_jobs, progress_callback, cancel_event, target)
+            if outlines is None:
+                print(f'{label}書き出しを中止しました')
+                return False
+            
+            for code, glyph in all_valid_glyphs:
                 glyph_name = f'uni{code:04X}'
                 
-                # プログレス更新
-                if progress_callback:
-                    progress_callback(idx + 1, total)
-                
-                # 編集済みかどうかで処理を分岐
-                if code in edited_codes:
-                    # 編集済み：ビットマップからアウトライン変換
-                    print(f'  変換: {glyph_name} (編集済み)')
-                    outline = TTFExporter._bitmap_to_outline(glyph.bitmap)
-                    
-                    if outline:
-                        glyphs[glyph_name] = outline
-                        metrics[glyph_name] = (Config.CANVAS_SIZE, 0)
-                        
+                if code in outlines:
+                    # 編集済み、または元のTTFにない：ビットマップから変換したアウトライン
+                    # [MOD] 2026-10-19: 変換できなかった（インクの無い）グリフは空のグリフにする（グリフ順にあるため省けない）
+                    outline = outlines[code]
+                    glyphs[glyph_name] = outline if outline is not None else TTFExporter._empty_outline(target)
+                    metrics[glyph_name] = (Config.CANVAS_SIZE, 0)
                 else:
-                    # 未編集：元のTTFから取得を試みる
-                    if original_font and glyph_name in original_font['glyf']:
-                        print(f'  流用: {glyph_name} (元データ)')
-                        # 元のグリフデータを取得
-                        original_glyph = original_font['glyf'][glyph_name]
-                        glyphs[glyph_name] = original_glyph
-                        
-                        # メトリクス情報も取得
-                        if glyph_name in original_font['hmtx'].metrics:
-                            metrics[glyph_name] = original_font['hmtx'].metrics[glyph_name]
-                        else:
-                            metrics[glyph_name] = (Config.CANVAS_SIZE, 0)
+                    # 未編集：元のグリフデータを流用
+                    # メトリクス情報も取得
+                    if glyph_name in original_font['hmtx'].metrics:
+                        metrics[glyph_name] = original_font['hmtx'].metrics[glyph_name]
                     else:
-                        # 元のTTFにない場合はアウトライン変換
-                        print(f'  変換: {glyph_name} (元データなし)')
-                        outline = TTFExporter._bitmap_to_outline(glyph.bitmap)
-                        
-                        if outline:
-                            glyphs[glyph_name] = outline
-                            metrics[glyph_name] = (Config.CANVAS_SIZE, 0)
+                        metrics[glyph_name] = (Config.CANVAS_SIZE, 0)
+                    glyphs[glyph_name] = TTFExporter._original_outline(
+                        original_font, original_glyphs, glyph_name, metrics[glyph_name][0], target
+                    )
             
             # グリフとメトリクスを設定
-            fb.setupGlyf(glyphs)
+            if target == 'glyf':
+                fb.setupGlyf(glyphs)
+            else:
+                fb.setupCFF('CustomFont-Regular', {'FullName': 'CustomFont Regular'}, glyphs, {})
             fb.setupHorizontalMetrics(metrics)
             
             # cmapテーブル（文字コード→グリフマッピング）
             cmap = {code: f'uni{code:04X}' for code, _ in all_valid_glyphs}
             fb.setupCharacterMap(cmap)
             
+            # OS/2テーブル（[MOD] 2026-10-19: hmtx・cmap の設定後でないと作れないため移動）
+            fb.setupOS2()
+            
+            # [ADD] 2026-10-19: 埋め込みビットマップ（変換したアウトラインと同じく、キャンバス下端をベースラインに置く）
+            strike_glyphs = [(f'uni{code:04X}', glyph) for code, glyph in all_valid_glyphs]
+            if not TTFExporter._add_bitmap_strikes(fb.font, strike_glyphs, 0.0, cancel_event):
+                print(f'{label}書き出しを中止しました')
+                return False
+            
             # 保存
             fb.save(output_path)
             
-            print(f'\nTTF書き出し完了')
+            print(f'\n{label}書き出し完了')
             print(f'  全グリフ: {total}')
-            print(f'  変換済み: {edited_count}')
-            print(f'  流用: {total - edited_count}')
+            print(f'  編集済み: {edited_count}')
+            print(f'  変換済み: {len(outlines)}')
+            print(f'  流用: {total - len(outlines)}')
+            
+            return True
+            
+        except ImportError as e:
+            messagebox.showerror('書き出しエラー', f'必要なライブラリが見つかりません:\n{e}')
+            return False
+        except Exception as e:
+            messagebox.showerror('書き出しエラー', f'{label}書き出し失敗:\n{e}')
+            import traceback
+            traceback.print_exc()
+            return False
+    
+    @staticmethod
+    def _original_outline(original_font: Any, original_glyphs: Any, glyph_name: str, width: int, target: str) -> Any:
+        """
+        元のフォントのグリフを target の形式で返す (2026-10-19: 新規追加)
+        同じ形式（glyf → glyf）ならそのまま流用し、違えば元のアウトラインを描き直す
+        """
+        if target == 'glyf' and 'glyf' in original_font:
+            return original_font['glyf'][glyph_name]
+        if target == 'glyf':
+            from fontTools.pens.cu2quPen import Cu2QuPen  # type: ignore
+            from fontTools.pens.ttGlyphPen import TTGlyphPen  # type: ignore
+            
+            pen = TTGlyphPen(None)
+            # CFF は反時計回り、glyf は時計回りが外側
+            original_glyphs[glyph_name].draw(Cu2QuPen(pen, Config.OUTLINE_CU2QU_MAX_ERR, reverse_direction=True))
+            return pen.glyph()
+        
+        from fontTools.pens.reverseContourPen import ReverseContourPen  # type: ignore
+        from fontTools.pens.t2CharStringPen import T2CharStringPen  # type: ignore
+        
+        pen = T2CharStringPen(width, None)
+        if 'CFF ' in original_font:
+            original_glyphs[glyph_name].draw(pen)
+        else:
+            original_glyphs[glyph_name].draw(ReverseContourPen(pen))
+        return pen.getCharString()
+    
+    @staticmethod
+    def _empty_outline(target: str) -> Any:
+        """輪郭の無いグリフ (2026-10-19: 新規追加)"""
+        if target == 'glyf':
+            from fontTools.pens.ttGlyphPen import TTGlyphPen  # type: ignore
+            return TTGlyphPen(None).glyph()
+        from fontTools.pens.t2CharStringPen import T2CharStringPen  # type: ignore
+        return T2CharStringPen(Config.CANVAS_SIZE, None).getCharString()
+    
+    # [ADD] 2026-10-19: サブセット書き出しの形式（拡張子 → TTFont.flavor）
+    SUBSET_FORMATS = {'ttf': None, 'woff': 'woff', 'woff2': 'woff2'}
+    _CODEPOINT = re.compile(r'U\+([0-9A-Fa-f]{1,6})(?:\s*(?:-|\.\.)\s*(?:U\+)?([0-9A-Fa-f]{1,6}))?')
+    
+    @staticmethod
+    def parse_codepoints(text: str) -> Set[int]:
+        """
+        文章（コーパス）またはコードポイント一覧から文字コードの集合を作る (2026-10-19: 新規追加)
+        'U+4E00' / 'U+3040-309F' / 'U+3040..U+309F' はコードポイント（範囲）、それ以外は書かれている文字そのもの（制御文字は除く）
+        """
+        codes: Set[int] = set()
+        for m in TTFExporter._CODEPOINT.finditer(text):
+            first = int(m.group(1), 16)
+            last = int(m.group(2), 16) if m.group(2) else first
+            codes.update(range(first, min(last, 0x10FFFF) + 1))
+        for ch in TTFExporter._CODEPOINT.sub('', text):
+            code = ord(ch)
+            if code >= 0x20 and not 0x7F <= code < 0xA0:
+                codes.add(code)
+        return codes
+    
+    @staticmethod
+    def woff2_available() -> bool:
+        """WOFF2 の圧縮に使う brotli があるか (2026-10-19: 新規追加)"""
+        try:
+            import brotli  # type: ignore  # noqa: F401
+        except ImportError:
+            return False
+        return True
+    
+    @staticmethod
+    def export_subset(
+        project: FontProject,
+        output_path: str,
+        codes: Set[int],
+        formats: Tuple[str, ...] = ('ttf',),
+        progress_callback: Optional[Callable[[int, int, float], None]] = None,
+        cancel_event: Optional[threading.Event] = None
+    ) -> Optional[Dict[str, Tuple[str, int]]]:
+        """
+        指定した文字だけを収録したフォントを TTF / WOFF / WOFF2 で書き出す (2026-10-19: 新規追加)
+        変換するのは指定した文字のグリフだけ（アウトラインキャッシュも使う）。組み立てたTTFをメモリ上でサブセット化し、
+        形式毎に「出力先の拡張子を差し替えたパス」へ保存する。WOFF2 は brotli が無ければ書かない
+
+        Returns:
+            形式 → (パス, バイト数)。失敗・中止は None
+        """
+        try:
+            from fontTools import subset  # type: ignore
+            from fontTools.ttLib import TTFont  # type: ignore
+        except ImportError as e:
+            messagebox.showerror('書き出しエラー', f'必要なライブラリが見つかりません:\n{e}')
+            return None
+        
+        buffer = io.BytesIO()
+        if not TTFExporter.export_ttf(project, buffer, progress_callback, cancel_event, codes=codes):
+            return None
+        
+        try:
+            buffer.seek(0)
+            font = TTFont(buffer)
+            options = subset.Options()
+            options.layout_features = ['*']  # 字形置換・カーニング等は残す
+            options.name_IDs = ['*']
+            options.name_languages = ['*']
+            options.notdef_outline = True
+            # [ADD] 2026-10-19: 埋め込みビットマップは既定では落とされるので残す
+            options.drop_tables = [tag for tag in options.drop_tables if tag not in ('EBDT', 'EBLC', 'EBSC')]
+            subsetter = subset.Subsetter(options)
+            subsetter.populate(unicodes=codes)
+            subsetter.subset(font)
+            
+            base = os.path.splitext(output_path)[0]
+            sizes: Dict[str, Tuple[str, int]] = {}
+            for fmt in formats:
+                if fmt == 'woff2' and not TTFExporter.woff2_available():
+                    print('brotli が無いため WOFF2 は書き出しません（pip install brotli）')
+                    continue
+                font.flavor = TTFExporter.SUBSET_FORMATS[fmt]
+                path = f'{base}.{fmt}'
+                font.save(path)
+                sizes[fmt] = (path, os.path.getsize(path))
+                print(f'  {fmt.upper()}: {path} ({sizes[fmt][1]:,} バイト)')
+            return sizes
+        except Exception as e:
+            messagebox.showerror('書き出しエラー', f'サブセット書き出し失敗:\n{e}')
+            import traceback
+            traceback.print_exc()
+            return None
+    
+    @staticmethod
+    def _export_patched(
+        project: FontProject,
+        output_path: str,
+        progress_callback: Optional[Callable[[int, int, float], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        codes: Optional[Set[int]] = None
+    ) -> Optional[bool]:
+        """
+        元のTTFの編集・追加したグリフだけを差し替えて書き出す (2026-10-19: 新規追加)
+        元のフォントは遅延読み込みで開き、変換するのは「編集済み」と「元のcmapに無い」グリフだけ。
+        他のグリフ・テーブル・名前・メトリクスは元のまま（bbox等の再計算も差し替えた分だけで行う）
+        codes を渡すと差し替えもその文字に限る（不要なグリフは呼び出し側のサブセット化で除く）
+
+        Returns:
+            成否。元のフォントを差し替えに使えない（TrueTypeでない・読めない）場合は None（作り直しで書き出す）
+        """
+        try:
+            from fontTools.ttLib import TTFont  # type: ignore
+            from fontTools.ttLib.tables._g_l_y_f import Glyph  # type: ignore
+            from fontTools.ttLib.tables._c_m_a_p import CmapSubtable  # type: ignore
+        except ImportError as e:
+            messagebox.showerror('書き出しエラー', f'必要なライブラリが見つかりません:\n{e}')
+            return False
+        
+        path = project.original_ttf_path
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            font = TTFont(path, lazy=True, recalcBBoxes=False)
+            if 'glyf' not in font or 'cmap' not in font:
+                font.close()
+                return None
+            cmap = font.getBestCmap() or {}
+        except Exception as e:
+            print(f'元のTTF読み込み失敗（作り直しで書き出します）: {e}')
+            return None
+        
+        try:
+            # 差し替えるのは編集済み（空白にしたものを含む）と、元のフォントに無い文字
+            with project._lock:
+                targets = [(code, glyph) for code, glyph in sorted(project.glyphs.items())
+                           if (codes is None or code in codes)
+                           and (getattr(glyph, 'is_edited', False) or (code not in cmap and not glyph.is_empty))]
+            if not targets and codes is None:
+                messagebox.showwarning('警告', '編集・追加したグリフがありません')
+                return False
+            
+            outlines = TTFExporter._trace_glyphs(
+                project, [(code, glyph) for code, glyph in targets if not glyph.is_empty],
+                progress_callback, cancel_event)
+            if outlines is None:
+                print('TTF書き出しを中止しました')
+                return False
+            
+            glyph_order = list(font.getGlyphOrder())
+            names = set(glyph_order)
+            shared = {}  # グリフ名 → それを使う文字の数
+            for name in cmap.values():
+                shared[name] = shared.get(name, 0) + 1
+            
+            units_per_em = font['head'].unitsPerEm
+            scale = units_per_em / Config.CANVAS_SIZE
+            baseline = Config.CANVAS_SIZE * Config.DESCENT_RATIO  # キャンバス下端からベースラインまで
+            glyf = font['glyf']
+            hmtx = font['hmtx']
+            new_cmap: Dict[int, str] = {}
+            replaced = added = 0
+            
+            for code, _glyph in targets:
+                outline = outlines.get(code)
+                if outline is None:
+                    outline = Glyph()  # 空白
+                    outline.numberOfContours = 0
+                else:
+                    # キャンバス座標 → 元のフォントの em 座標（キャンバス全体を em、下から DESCENT_RATIO をベースラインとする）
+                    outline.coordinates.translate((0, -baseline))
+                    outline.coordinates.scale((scale, scale))
+                    outline.coordinates.toInt()
+                    outline.recalcBounds(glyf)
+                
+                name = cmap.get(code)
+                if name is not None and shared.get(name, 0) > 1:
+                    name = None  # 他の文字と共有しているグリフは書き換えず、この文字用に新しく作る
+                if name is None:
+                    base = f'uni{code:04X}' if code <= 0xFFFF else f'u{code:05X}'
+                    name, n = base, 1
+                    while name in names:
+                        name, n = f'{base}.{n}', n + 1
+                    names.add(name)
+                    glyph_order.append(name)
+                    new_cmap[code] = name
+                    advance = units_per_em
+                    added += 1
+                else:
+                    advance = hmtx[name][0]
+                    replaced += 1
+                glyf.glyphs[name] = outline
+                hmtx[name] = (advance, getattr(outline, 'xMin', 0))
+                if 'gvar' in font:
+                    font['gvar'].variations.pop(name, None)  # 形が変わったので変化量は使えない
+            
+            if new_cmap:
+                font.setGlyphOrder(glyph_order)
+                glyf.glyphOrder = glyph_order
+                if 'vmtx' in font:
+                    for name in new_cmap.values():
+                        font['vmtx'][name] = (units_per_em, 0)
+                # グリフ毎の表はグリフ数が変わると作り直しが要るので落とす（無くても表示できる）
+                for tag in ('hdmx', 'LTSH', 'VDMX'):
+                    if tag in font:
+                        del font[tag]
+                TTFExporter._extend_cmap(font, new_cmap, CmapSubtable)
+            
+            # 再計算を止めているので、差し替えたグリフの分だけ最大値・bboxを広げる
+            head, hhea, maxp = font['head'], font['hhea'], font['maxp']
+            for code, _glyph in targets:
+                outline = outlines.get(code)
+                if outline is None:
+                    continue
+                head.xMin, head.yMin = min(head.xMin, outline.xMin), min(head.yMin, outline.yMin)
+                head.xMax, head.yMax = max(head.xMax, outline.xMax), max(head.yMax, outline.yMax)
+                maxp.maxPoints = max(maxp.maxPoints, len(outline.coordinates))
+                maxp.maxContours = max(maxp.maxContours, outline.numberOfContours)
+            hhea.advanceWidthMax = max(hhea.advanceWidthMax, max(metric[0] for metric in hmtx.metrics.values()))
+            
+            # [ADD] 2026-10-19: 元の埋め込みビットマップは差し替えたグリフの古い形を表示してしまうので除き、
+            # 設定があればプロジェクトの全グリフから作り直す
+            if targets:
+                for tag in ('EBDT', 'EBLC', 'EBSC'):
+                    if tag in font:
+                        del font[tag]
+                        print(f'元の {tag} を除きました')
+            final_cmap = font.getBestCmap() or {}
+            with project._lock:
+                strike_glyphs = [(final_cmap[code], glyph) for code, glyph in sorted(project.glyphs.items())
+                                 if code in final_cmap and (codes is None or code in codes) and not glyph.is_empty]
+            if not TTFExporter._add_bitmap_strikes(font, strike_glyphs, Config.DESCENT_RATIO, cancel_event):
+                print('TTF書き出しを中止しました')
+                return False
+            
+            # [ADD] 2026-10-19: 中身を書き換えたので元の電子署名は無効（残すと署名の検証で弾かれる）
+            if 'DSIG' in font:
+                del font['DSIG']
+            
+            # [ADD] 2026-10-19: 元のフォント自体へ上書きする時は、遅延読み込み中のファイルを壊さないよう
+            # 一時ファイルに書いてから閉じて置き換える
+            overwrite = isinstance(output_path, str) and os.path.abspath(output_path) == os.path.abspath(path)
+            if overwrite:
+                try:
+                    font.save(output_path + '.tmp')
+                    font.close()
+                    os.replace(output_path + '.tmp', output_path)
+                except Exception:
+                    if os.path.exists(output_path + '.tmp'):
+                        os.remove(output_path + '.tmp')
+                    raise
+            else:
+                font.save(output_path)
             
+            print('\nTTF書き出し完了（元のフォントへ差し替え）')
+            print(f'  差し替え: {replaced}')
+            print(f'  追加: {added}')
             return True
-            
-        except ImportError as e:
-            messagebox.showerror('書き出しエラー', f'必要なライブラリが見つかりません:\n{e}')
-            return False
+        
         except Exception as e:
             messagebox.showerror('書き出しエラー', f'TTF書き出し失敗:\n{e}')
             import traceback
             traceback.print_exc()
             return False
+        finally:
+            font.close()
+    
+    @staticmethod
+    def _add_bitmap_strikes(
+        font: Any,
+        glyphs: List[Tuple[str, GlyphData]],
+        baseline_ratio: float,
+        cancel_event: Optional[threading.Event] = None
+    ) -> bool:
+        """
+        Config.TTF_BITMAP_STRIKES の各 ppem の埋め込みビットマップ（EBDT/EBLC）を font に加える。中止されたら False (2026-10-19: 新規追加)
+        glyphs は (グリフ名, グリフ)。画像は FontExporter.downsample で全サイズを一度に縮小・2値化し、
+        インクの外接矩形だけをバイト境界の行（画像形式1・小さいメトリクス）で持つ。インクの無いグリフは入れない。
+        キャンバス全体を em とし、下端から baseline_ratio の位置をベースラインに置く（アウトラインの配置に合わせる）
+        """
+        sizes = sorted({size for size in Config.TTF_BITMAP_STRIKES if 4 <= size <= 127})
+        if not sizes or not glyphs:
+            return True
+        
+        from fontTools.ttLib import newTable  # type: ignore
+        from fontTools.ttLib.tables.BitmapGlyphMetrics import SmallGlyphMetrics  # type: ignore
+        from fontTools.ttLib.tables.E_B_D_T_ import ebdt_bitmap_format_1  # type: ignore
+        from fontTools.ttLib.tables.E_B_L_C_ import SbitLineMetrics, Strike, eblc_index_sub_table_1  # type: ignore
+        
+        units_per_em = font['head'].unitsPerEm
+        hmtx = font['hmtx']
+        # インデックス（形式1）はグリフID順に並べ、データも同じ順で連続させる
+        unique = {name: glyph for name, glyph in reversed(glyphs)}
+        ordered = sorted(unique.items(), key=lambda item: font.getGlyphID(item[0]))
+        strikes: List[Dict[str, Any]] = [{} for _ in sizes]
+        
+        def render(item: Tuple[str, GlyphData]) -> Tuple[str, Optional[List[Image.Image]]]:
+            name, glyph = item
+            image = FontExporter._glyph_image(glyph)
+            return name, None if image is None else FontExporter.downsample(image, sizes)
+        
+        for name, images in FontExporter._run_ordered(render, ordered):
+            if cancel_event is not None and cancel_event.is_set():
+                return False
+            if images is None:
+                continue
+            advance = hmtx[name][0]
+            for ppem, image, bitmaps in zip(sizes, images, strikes):
+                bbox = image.getbbox()
+                if bbox is None:
+                    continue
+                x0, y0, x1, y1 = bbox
+                metrics = SmallGlyphMetrics()
+                metrics.width, metrics.height = x1 - x0, y1 - y0
+                metrics.BearingX = x0
+                metrics.BearingY = ppem - y0 - round(ppem * baseline_ratio)
+                metrics.Advance = min(255, round(advance * ppem / units_per_em))
+                bitmap = ebdt_bitmap_format_1(None, None)
+                del bitmap.data  # 未解析のデータは無い（属性が無ければ AttributeError にする）
+                bitmap.metrics = metrics
+                bitmap.imageData = image.crop(bbox).tobytes()  # 1bit画像の行はバイト境界で詰めてある
+                bitmaps[name] = bitmap
+        
+        for tag in ('EBDT', 'EBLC', 'EBSC'):
+            if tag in font:
+                del font[tag]
+        if not any(strikes):
+            return True
+        
+        eblc, ebdt = newTable('EBLC'), newTable('EBDT')
+        eblc.version = ebdt.version = 2.0
+        eblc.strikes, ebdt.strikeData = [], []
+        ascent, descent = font['hhea'].ascent, font['hhea'].descent
+        for ppem, bitmaps in zip(sizes, strikes):
+            if not bitmaps:
+                continue
+            index = eblc_index_sub_table_1(None, None)
+            index.indexFormat = index.imageFormat = 1
+            index.names = list(bitmaps)
+            strike = Strike()
+            strike.indexSubTables.append(index)
+            
+            all_metrics = [bitmap.metrics for bitmap in bitmaps.values()]
+            line = SbitLineMetrics()
+            line.ascender = round(ascent * ppem / units_per_em)
+            line.descender = -round(abs(descent) * ppem / units_per_em)
+            line.widthMax = max(m.width for m in all_metrics)
+            line.caretSlopeNumerator, line.caretSlopeDenominator, line.caretOffset = 1, 0, 0
+            line.minOriginSB = min(m.BearingX for m in all_metrics)
+            line.minAdvanceSB = max(-128, min(m.Advance - m.BearingX - m.width for m in all_metrics))
+            line.maxBeforeBL = max(m.BearingY for m in all_metrics)
+            line.minAfterBL = min(m.BearingY - m.height for m in all_metrics)
+            line.pad1 = line.pad2 = 0
+            size = strike.bitmapSizeTable
+            size.hori, size.vert = line, line
+            size.colorRef = 0
+            size.ppemX = size.ppemY = ppem
+            size.bitDepth = 1
+            size.flags = 1  # 横書きのメトリクス
+            
+            eblc.strikes.append(strike)
+            ebdt.strikeData.append(bitmaps)
+        font['EBDT'], font['EBLC'] = ebdt, eblc
+        print(f'埋め込みビットマップ: {", ".join(f"{ppem}ppem" for ppem in sizes)}（{len(ordered)} グリフ）')
+        return True
+    
+    @staticmethod
+    def _extend_cmap(font: Any, new_cmap: Dict[int, str], subtable_class: Any) -> None:
+        """Unicode の cmap サブテーブルへ文字を追加（BMP外の文字があり format 12 が無ければ作る） (2026-10-19: 新規追加)"""
+        tables = [table for table in font['cmap'].tables if table.isUnicode()]
+        for table in tables:
+            for code, name in new_cmap.items():
+                if code <= 0xFFFF or table.format in (12, 13):
+                    table.cmap[code] = name
+        if any(code > 0xFFFF for code in new_cmap) and not any(table.format == 12 for table in tables):
+            table = subtable_class.newSubtable(12)
+            table.platformID, table.platEncID, table.language = 3, 10, 0
+            table.cmap = dict(font.getBestCmap() or {})
+            table.cmap.update(new_cmap)
+            font['cmap'].tables.append(table)
+    
+    @staticmethod
+    def _trace_workers(job_count: int) -> int:
+        """変換に使うプロセス数 (2026-10-19: 新規追加)"""
+        workers = Config.EXPORT_WORKERS or os.cpu_count() or 1
+        # 数グリフだけならプロセス起動の方が高くつく
+        return max(1, min(workers, job_count // 4))
+    
+    @staticmethod
+    def _pack_bitmap(bitmap: Image.Image) -> Tuple[int, int, bytes]:
+        """ワーカーへ送るため 1bit/画素 に詰める（インク=0） (2026-10-19: 新規追加)"""
+        threshold = Config.TRACE_THRESHOLD
+        packed = bitmap.convert('L').point(lambda v: 255 if v >= threshold else 0, '1')
+        return packed.width, packed.height, packed.tobytes()
+    
+    @staticmethod
+    def _trace_packed(job: Tuple[int, int, int, bytes, str, str]) -> Tuple[int, Optional[bytes], List[int]]:
+        """
+        ワーカー側の変換 (2026-10-19: 新規追加)
+        (文字コード, 幅, 高さ, 1bitビットマップ, 方式) を受け取り、glyf 形式にコンパイルしたバイト列を返す
+        [MOD] 2026-10-19: 最適化前後の統計（_optimize_outline 参照）も返す
+        [MOD] 2026-10-19: 最後に出力形式を受け取り、'cff' なら CharString のバイトコードを返す
+        """
+        code, width, height, packed, backend, target = job
+        stats = [0, 0, 0, 0]
+        if backend == 'native':
+            bitmap = Image.frombytes('1', (width, height), packed).convert('L')
+            outline = TTFExporter._trace_native(bitmap, stats, target)
+        else:
+            outline = TTFExporter._run_potrace((width, height, packed), stats, target)
+        if outline is None:
+            return code, None, stats
+        return code, TTFExporter._compile_outline(outline, target), stats
+    
+    @staticmethod
+    def _compile_outline(outline: Any, target: str) -> bytes:
+        """グリフ（glyf: Glyph / cff: T2CharString）をバイト列にする (2026-10-19: 新規追加)"""
+        if target == 'glyf':
+            return outline.compile(None)
+        outline.compile()
+        return outline.bytecode
+    
+    @staticmethod
+    def _trace_glyphs(
+        project: FontProject,
+        jobs: List[Tuple[int, GlyphData]],
+        progress_callback: Optional[Callable[[int, int, float], None]] = None,
+        cancel_event: Optional[threading.Event] = None,
+        target: str = 'glyf'
+    ) -> Optional[Dict[int, Optional[Any]]]:
+        """
+        グリフをまとめてアウトライン変換し、文字コード→グリフ（失敗は None）を返す。中止されたら None (2026-10-19: 新規追加)
+        ビットマップは必要な分だけ詰めて送り、送信中の件数をプロセス数の数倍に抑える
+        [MOD] 2026-10-19: potrace 方式は変換が別プロセスなので、スレッドで同時に走らせる potrace の数を抑えるだけにする
+        [MOD] 2026-10-19: アウトラインキャッシュにある結果は変換しない（保存後に変わっていないグリフは画像も展開しない）
+        [MOD] 2026-10-19: 変換したグリフの最適化前後の点数・サイズを集計して表示する
+        [MOD] 2026-10-19: target='cff' なら CharString（T2CharString）を返す。キャッシュは形式ごとに分ける
+        """
+        from fontTools.misc.psCharStrings import T2CharString  # type: ignore
+        from fontTools.ttLib.tables._g_l_y_f import Glyph  # type: ignore
+        
+        total = len(jobs)
+        backend = TTFExporter._trace_backend()
+        results: Dict[int, Optional[Any]] = {}
+        started = time.perf_counter()
+        cache = project.outline_cache(target)
+        cache.begin()
+        keys: Dict[int, Tuple[bytes, bytes]] = {}  # 変換中の文字コード → (変換キー, 元画像キー)
+        totals = [0, 0, 0, 0]  # 最適化前の点数, 後の点数, 前のglyfバイト数, 後のglyfバイト数
+        stored = project.stored_digests(code for code, _ in jobs)
+        
+        def report() -> None:
+            if progress_callback:
+                elapsed = time.perf_counter() - started
+                progress_callback(len(results), total, len(results) / elapsed if elapsed > 0 else 0.0)
+        
+        def store(code: int, data: Optional[bytes]) -> None:
+            if data is None:
+                results[code] = None
+                return
+            if target == 'cff':
+                results[code] = T2CharString(bytecode=data)
+                return
+            glyph = Glyph(data)
+            glyph.expand(None)
+            results[code] = glyph
+        
+        def prepare(code: int, glyph: GlyphData) -> Optional[Tuple[int, int, int, bytes, str, str]]:
+            """キャッシュに無いグリフだけ、ワーカーへ送る内容を返す"""
+            source_key = cache.source_key(stored.get(code))
+            bitmap = FontExporter._glyph_image(glyph)  # [MOD] 2026-10-19: 展開した画像をグリフに残さない
+            if bitmap is None:
+                results[code] = None
+                return None
+            packed = TTFExporter._pack_bitmap(bitmap)
+            trace_key = cache.trace_key(packed)
+            hit, data = cache.lookup(code, trace_key=trace_key)
+            if hit:
+                if source_key != GlyphContainer.NO_DIGEST:
+                    cache.store(code, trace_key, source_key, data)  # 次回は画像を展開せずに済むように
+                store(code, data)
+                return None
+            keys[code] = (trace_key, source_key)
+            return (code, *packed, backend, target)
+        
+        def finish(code: int, data: Optional[bytes], stats: List[int]) -> None:
+            cache.store(code, *keys.pop(code), data)
+            store(code, data)
+            for i, value in enumerate(stats):
+                totals[i] += value
+        
+        try:
+            # 保存後に変わっていないグリフは格納PNGの内容ハッシュで照合する
+            remaining = []
+            for code, glyph in jobs:
+                hit, data = cache.lookup(code, source_key=cache.source_key(stored.get(code)))
+                if hit:
+                    store(code, data)
+                else:
+                    remaining.append((code, glyph))
+            report()
+            
+            pending = iter(remaining)
+            workers = TTFExporter._trace_workers(len(remaining))
+            if workers > 1:
+                executor = ThreadPoolExecutor if backend == 'potrace' else ProcessPoolExecutor
+                try:
+                    with executor(max_workers=workers) as pool:
+                        in_flight: Set[Any] = set()
+                        while True:
+                            if cancel_event is not None and cancel_event.is_set():
+                                pool.shutdown(wait=True, cancel_futures=True)
+                                return None
+                            for code, glyph in pending:
+                                job = prepare(code, glyph)
+                                if job is not None:
+                                    in_flight.add(pool.submit(TTFExporter._trace_packed, job))
+                                if len(in_flight) >= workers * 4:
+                                    break
+                            if not in_flight:
+                                break
+                            # UIが応答できるよう一定間隔で進捗を返す
+                            done, in_flight = wait(in_flight, timeout=0.1, return_when=FIRST_COMPLETED)
+                            for future in done:
+                                finish(*future.result())
+                            report()
+                    report()
+                    return results
+                except (BrokenProcessPool, OSError) as e:
+                    # プロセスを起動できない環境では、残りをこのプロセスで変換する
+                    print(f'並列変換に失敗したため逐次変換します: {e}')
+                    keys.clear()
+                    pending = iter([(code, glyph) for code, glyph in remaining if code not in results])
+            
+            for code, glyph in pending:
+                if cancel_event is not None and cancel_event.is_set():
+                    return None
+                job = prepare(code, glyph)
+                if job is not None:
+                    finish(*TTFExporter._trace_packed(job))
+                report()
+            return results
+        finally:
+            # 中止・失敗した場合も、変換できた分は次回に使う
+            cache.save()
+            if totals[0]:
+                before_points, after_points, before_bytes, after_bytes = totals
+                print(
+                    f'アウトライン最適化: 点数 {before_points} → {after_points} '
+                    f'({after_points / before_points:.0%}), {target} {before_bytes} → {after_bytes} バイト '
+                    f'({after_bytes / max(before_bytes, 1):.0%})'
+                )
     
     @staticmethod
-    def _create_notdef_glyph() -> Any:
-        """".notdef" グリフを作成（空の四角） (2025-10-11: 定数使用)"""
+    def _create_notdef_glyph(target: str = 'glyf') -> Any:
+        """
+        ".notdef" グリフを作成（空の四角） (2025-10-11: 定数使用)
+        [MOD] 2026-10-19: target='cff' なら CharString で作る
+        """
+        from fontTools.pens.t2CharStringPen import T2CharStringPen  # type: ignore
         from fontTools.pens.ttGlyphPen import TTGlyphPen  # type: ignore
         
-        pen = TTGlyphPen(None)
+        pen = TTGlyphPen(None) if target == 'glyf' else T2CharStringPen(Config.CANVAS_SIZE, None)
         
         # 外枠 (2025-10-11: 定数使用)
         size = Config.CANVAS_SIZE
@@ -4470,167 +8612,385 @@ class TTFExporter:
         pen.lineTo((size - inner_margin, inner_margin))
         pen.closePath()
         
-        return pen.glyph()
-    
-    @staticmethod
-    @contextmanager
-    def _temp_files() -> Any:
-        """一時ファイル管理用コンテキストマネージャ (2025-10-11: 安全な一時ファイル管理)"""
-        bitmap_path = None
-        svg_path = None
-        try:
-            with tempfile.NamedTemporaryFile(suffix='.bmp', delete=False) as tmp_bmp:
-                bitmap_path = tmp_bmp.name
-            with tempfile.NamedTemporaryFile(suffix='.svg', delete=False) as tmp_svg:
-                svg_path = tmp_svg.name
-            yield bitmap_path, svg_path
-        finally:
-            if bitmap_path and os.path.exists(bitmap_path):
-                try:
-                    os.unlink(bitmap_path)
-                except OSError:
-                    pass
-            if svg_path and os.path.exists(svg_path):
-                try:
-                    os.unlink(svg_path)
-                except OSError:
-                    pass
+        return pen.glyph() if target == 'glyf' else pen.getCharString()
     
     @staticmethod
     def _bitmap_to_outline(bitmap: Optional[Image.Image]) -> Optional[Any]:
-        """ビットマップをアウトライン（TTFグリフ）に変換 (2025-10-11: 安全な一時ファイル管理)"""
+        """
+        ビットマップをアウトライン（TTFグリフ）に変換 (2025-10-11: 安全な一時ファイル管理)
+        [MOD] 2026-10-19: 既定は内蔵トレーサーでメモリ上だけで変換（Config.TRACE_BACKEND='potrace' で従来方式）
+        """
         if bitmap is None:
             return None
-        
-        from fontTools.pens.ttGlyphPen import TTGlyphPen  # type: ignore
+        if TTFExporter._trace_backend() == 'native':
+            return TTFExporter._trace_native(bitmap)
+        return TTFExporter._trace_potrace(bitmap)
+    
+    @staticmethod
+    def _trace_native(bitmap: Image.Image, stats: Optional[List[int]] = None, target: str = 'glyf') -> Optional[Any]:
+        """
+        内蔵トレーサーで変換 (2026-10-19: 新規追加)
+        [MOD] 2026-10-19: 記録した輪郭を _optimize_outline で最適化してからグリフにする
+        """
+        from fontTools.pens.recordingPen import RecordingPen  # type: ignore
         
         try:
-            with TTFExporter._temp_files() as (bitmap_path, svg_path):
-                # 白黒反転（potraceは黒を輪郭として認識）
-                inverted = Image.eval(bitmap, lambda x: 255 - x)
-                inverted.save(bitmap_path)
-                
-                # potrace実行
-                result = subprocess.run(
-                    [
-                        'potrace',
-                        bitmap_path,
-                        '-s',  # SVG出力
-                        '-o', svg_path,
-                        '--turdsize', '2',  # ノイズ除去
-                        '--alphamax', '1.0',  # 角の鋭さ
-                        '--opttolerance', '0.2'  # 最適化
-                    ],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                
-                if result.returncode != 0:
-                    return None
-                
-                # SVGパスを読み込み
-                with open(svg_path, 'r') as f:
-                    svg_content = f.read()
-                
-                # パスデータを抽出
-                path_data = TTFExporter._extract_svg_paths(svg_content)
-                
-                if not path_data:
-                    return None
-                
-                # TTGlyphPenで描画
-                pen = TTGlyphPen(None)
-                
-                # SVGパスをTTFグリフに変換
-                TTFExporter._svg_path_to_ttglyph(path_data, pen, Config.CANVAS_SIZE)
-                
-                return pen.glyph()
-            
-        except subprocess.TimeoutExpired:
-            print('potrace タイムアウト')
-            return None
+            contours = BitmapTracer().trace(bitmap)
+            if not contours:
+                return None
+            recording = RecordingPen()
+            BitmapTracer.draw(contours, recording, bitmap.height, Config.CANVAS_SIZE / bitmap.width)
+            return TTFExporter._optimize_outline(recording.value, stats, target)
         except Exception as e:
             print(f'アウトライン変換エラー: {e}')
             return None
     
     @staticmethod
-    def _extract_svg_paths(svg_content: str) -> List[str]:
-        """SVGからパスデータを抽出"""
-        paths = []
+    def _trace_potrace(bitmap: Image.Image) -> Optional[Any]:
+        """
+        potraceコマンドで変換（従来方式） (2026-10-19: _bitmap_to_outline から分離)
+        [MOD] 2026-10-19: 一時ファイルを使わず、しきい値で1bit化してパイプで渡す
+        """
+        return TTFExporter._run_potrace(TTFExporter._pack_bitmap(bitmap))
+    
+    @staticmethod
+    def _run_potrace(
+        packed: Tuple[int, int, bytes],
+        stats: Optional[List[int]] = None,
+        target: str = 'glyf'
+    ) -> Optional[Any]:
+        """
+        1bit化したビットマップ (幅, 高さ, バイト列) を potrace で変換 (2026-10-19: 新規追加)
+        PBM を stdin へ書き、SVG を stdout から読む（インクを黒として渡す。potrace は黒を図形として扱う）
+        [MOD] 2026-10-19: 記録した輪郭を _optimize_outline で最適化してからグリフにする
+        """
+        from fontTools.pens.recordingPen import RecordingPen  # type: ignore
+        
+        width, height, data = packed
+        # PILの1bit画像とPBM(P4)は行をバイト境界で詰める並びが同じなので、ビットを反転するだけでよい
+        pbm = b'P4\n%d %d\n' % (width, height) + data.translate(TTFExporter._PBM_INVERT)
+        try:
+            result = subprocess.run(
+                [
+                    'potrace',
+                    '--svg',
+                    '--output', '-',
+                    '--turdsize', str(Config.TRACE_TURDSIZE),  # ノイズ除去
+                    '--alphamax', str(Config.TRACE_ALPHAMAX),  # 角の鋭さ
+                    '--opttolerance', str(Config.TRACE_OPTTOLERANCE),  # 最適化
+                    '-',
+                ],
+                input=pbm,
+                capture_output=True,
+                timeout=30
+            )
+        except subprocess.TimeoutExpired:
+            print('potrace タイムアウト')
+            return None
+        except OSError as e:
+            print(f'potrace 起動エラー: {e}')
+            return None
+        
+        if result.returncode != 0:
+            return None
         
-        # <path d="..." /> を抽出
-        path_pattern = r'<path[^>]*d="([^"]*)"'
-        matches = re.findall(path_pattern, svg_content)
+        try:
+            groups = TTFExporter._svg_contours(result.stdout)
+        except (ET.ParseError, ValueError) as e:
+            print(f'potrace 出力の解析エラー: {e}')
+            return None
         
-        for match in matches:
-            paths.append(match)
+        if not any(groups):
+            return None
         
-        return paths
+        recording = RecordingPen()
+        TTFExporter._draw_svg_contours(groups, recording, height, Config.CANVAS_SIZE / width)
+        return TTFExporter._optimize_outline(recording.value, stats, target)
     
     @staticmethod
-    def _svg_path_to_ttglyph(path_data_list: List[str], pen: Any, size: int) -> None:
-        """SVGパスデータをTTGlyphPenに描画"""
+    def _optimize_outline(
+        value: List[Tuple[str, Tuple[Any, ...]]],
+        stats: Optional[List[int]] = None,
+        target: str = 'glyf'
+    ) -> Optional[Any]:
+        """
+        変換した輪郭（RecordingPen の記録）を glyf 用に最適化したグリフを返す。輪郭が残らなければ None (2026-10-19: 新規追加)
+        重複点・直線上の点・小さな輪郭を除き、3次曲線は許容誤差内の2次曲線に変換する。
+        ビットマップから得た輪郭は互いに交差しないので、重なりの除去はしない。
+        stats を渡すと [最適化前の点数, 後の点数, 前のglyfバイト数, 後のglyfバイト数] に加算する
+        （最適化前 = 3次曲線のままの輪郭）
+        [MOD] 2026-10-19: target='cff' なら3次曲線のまま T2CharString にする（統計の点数は輪郭の点数、サイズは CharString）
+        """
+        from fontTools.pens.cu2quPen import Cu2QuPen  # type: ignore
+        from fontTools.pens.reverseContourPen import ReverseContourPen  # type: ignore
+        from fontTools.pens.t2CharStringPen import T2CharStringPen  # type: ignore
+        from fontTools.pens.ttGlyphPen import TTGlyphPen  # type: ignore
         
-        for path_data in path_data_list:
-            # SVGパスをパース
-            commands = TTFExporter._parse_svg_path(path_data)
-            
-            for cmd, args in commands:
-                if cmd == 'M':  # MoveTo
-                    x, y = args[0], args[1]
-                    pen.moveTo((x, size - y))  # Y軸反転
-                    
-                elif cmd == 'L':  # LineTo
-                    x, y = args[0], args[1]
-                    pen.lineTo((x, size - y))
-                    
-                elif cmd == 'C':  # CurveTo（3次ベジエ）
-                    x1, y1, x2, y2, x, y = args
-                    pen.curveTo(
-                        (x1, size - y1),
-                        (x2, size - y2),
-                        (x, size - y)
-                    )
-                    
-                elif cmd == 'Z':  # ClosePath
-                    pen.closePath()
+        def build(contours: List[Tuple[str, Tuple[Any, ...]]], quadratic: bool) -> Tuple[Any, int, int]:
+            """記録からグリフを作り (グリフ, 点数, バイト数) を返す"""
+            if target == 'cff':
+                # CFF は外側の輪郭を反時計回りにする
+                t2 = T2CharStringPen(Config.CANVAS_SIZE, None)
+                pen = ReverseContourPen(t2)
+                for op, args in contours:
+                    getattr(pen, op)(*args)
+                charstring = t2.getCharString()
+                points = sum(len(args) for op, args in contours if op != 'closePath')
+                return charstring, points, len(TTFExporter._compile_outline(charstring, target))
+            tt = TTGlyphPen(None)
+            pen = Cu2QuPen(tt, Config.OUTLINE_CU2QU_MAX_ERR, reverse_direction=False, all_quadratic=True) if quadratic else tt
+            for op, args in contours:
+                getattr(pen, op)(*args)
+            glyph = tt.glyph()
+            return glyph, len(glyph.coordinates), len(glyph.compile(None))
+        
+        contours = []
+        start: Optional[Tuple[float, float]] = None
+        segments: List[Tuple[str, List[Tuple[float, float]]]] = []
+        for op, args in value:
+            if op == 'moveTo':
+                start, segments = args[0], []
+            elif op in ('lineTo', 'curveTo', 'qCurveTo'):
+                segments.append((op, list(args)))
+            elif op in ('closePath', 'endPath') and start is not None:
+                contour = TTFExporter._simplify_contour(start, segments)
+                if contour:
+                    contours.append(contour)
+                start = None
+        
+        glyph = None
+        if contours:
+            optimized: List[Tuple[str, Tuple[Any, ...]]] = []
+            for contour in contours:
+                optimized.append(('moveTo', (contour[-1][1][-1],)))
+                optimized.extend((op, tuple(points)) for op, points in contour)
+                optimized.append(('closePath', ()))
+            glyph, points, size = build(optimized, True)
+            if stats is not None:
+                stats[1] += points
+                stats[3] += size
+        
+        if stats is not None:
+            _, points, size = build(value, False)
+            stats[0] += points
+            stats[2] += size
+        return glyph
     
     @staticmethod
-    def _parse_svg_path(path_data: str) -> List[Tuple[str, List[float]]]:
-        """SVGパスデータをパース"""
-        commands = []
-        
-        # 簡易パーサー（M, L, C, Zに対応）
-        tokens = re.findall(r'[MLCZ]|[-+]?[0-9]*\.?[0-9]+', path_data)
-        
+    def _simplify_contour(
+        start: Tuple[float, float],
+        segments: List[Tuple[str, List[Tuple[float, float]]]]
+    ) -> List[Tuple[str, List[Tuple[float, float]]]]:
+        """
+        閉じた輪郭の点を間引いた区間のリストを返す（区間 i は区間 i-1 の終点から始まる）。小さすぎる輪郭は空 (2026-10-19: 新規追加)
+        """
+        tolerance = Config.OUTLINE_SIMPLIFY_TOLERANCE
+        segments = list(segments)
+        if not segments:
+            return []
+        if tuple(segments[-1][1][-1]) != tuple(start):
+            segments.append(('lineTo', [start]))  # 暗黙の閉じ線
+        
+        def distance(p: Tuple[float, float], a: Tuple[float, float], b: Tuple[float, float]) -> float:
+            """点 p と線分 ab の距離"""
+            dx, dy = b[0] - a[0], b[1] - a[1]
+            length = dx * dx + dy * dy
+            t = 0.0 if length == 0 else max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / length))
+            return math.hypot(p[0] - a[0] - t * dx, p[1] - a[1] - t * dy)
+        
+        # 重複点（長さがほぼ0の区間）を除く
         i = 0
-        while i < len(tokens):
-            token = tokens[i]
-            
-            if token == 'M':
-                x, y = float(tokens[i+1]), float(tokens[i+2])
-                commands.append(('M', [x, y]))
-                i += 3
-                
-            elif token == 'L':
-                x, y = float(tokens[i+1]), float(tokens[i+2])
-                commands.append(('L', [x, y]))
-                i += 3
-                
-            elif token == 'C':
-                args = [float(tokens[i+j]) for j in range(1, 7)]
-                commands.append(('C', args))
-                i += 7
-                
-            elif token == 'Z' or token == 'z':
-                commands.append(('Z', []))
-                i += 1
-                
+        while i < len(segments) and len(segments) > 2:
+            previous = segments[i - 1][1][-1]
+            if all(math.hypot(x - previous[0], y - previous[1]) <= tolerance for x, y in segments[i][1]):
+                del segments[i]
             else:
                 i += 1
         
-        return commands
+        # 直線に挟まれた点が前後を結ぶ線分から許容誤差内なら除く（線分側で測るので折り返しは残る）
+        changed = tolerance > 0
+        while changed and len(segments) > 2:
+            changed = False
+            i = 0
+            while i < len(segments) and len(segments) > 2:
+                following = segments[(i + 1) % len(segments)]
+                if (
+                    segments[i][0] == 'lineTo' and following[0] == 'lineTo'
+                    and distance(segments[i][1][-1], segments[i - 1][1][-1], following[1][-1]) <= tolerance
+                ):
+                    del segments[i]
+                    changed = True
+                else:
+                    i += 1
+        
+        # 面積（制御点を含む多角形で近似）が小さい輪郭を捨てる
+        points = [point for _, segment in segments for point in segment]
+        area = 0.0
+        for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]):
+            area += x0 * y1 - x1 * y0
+        if len(segments) < 2 or abs(area) / 2 < Config.OUTLINE_MIN_CONTOUR_AREA:
+            return []
+        return segments
+    
+    @staticmethod
+    def _svg_contours(svg: bytes) -> List[List[Tuple[Tuple[float, float], List[Tuple[Any, ...]]]]]:
+        """
+        SVGの <path> 毎に、輪郭 (始点, [('L', 点) / ('C', 制御点1, 制御点2, 点)]) のリストを返す (2026-10-19: 新規追加)
+        要素の transform（potrace は translate と scale）を適用した画像座標にする
+        """
+        groups = []
+        stack = [(1.0, 0.0, 0.0, 1.0, 0.0, 0.0)]
+        for event, elem in ET.iterparse(io.BytesIO(svg), events=('start', 'end')):
+            if event == 'end':
+                stack.pop()
+                elem.clear()
+                continue
+            matrix = TTFExporter._svg_transform(stack[-1], elem.get('transform', ''))
+            stack.append(matrix)
+            if elem.tag.rsplit('}', 1)[-1] != 'path':
+                continue
+            a, b, c, d, e, f = matrix
+
+            def apply(x: float, y: float) -> Tuple[float, float]:
+                return (a * x + c * y + e, b * x + d * y + f)
+
+            contours: List[Tuple[Tuple[float, float], List[Tuple[Any, ...]]]] = []
+            for cmd, *args in TTFExporter._iter_svg_path(elem.get('d', '')):
+                if cmd == 'M':
+                    contours.append((apply(*args), []))
+                elif not contours:
+                    raise ValueError('パスが M で始まっていません')
+                elif cmd == 'L':
+                    contours[-1][1].append(('L', apply(*args)))
+                elif cmd == 'C':
+                    contours[-1][1].append(('C', apply(*args[0:2]), apply(*args[2:4]), apply(*args[4:6])))
+            groups.append([contour for contour in contours if contour[1]])
+        return groups
+    
+    @staticmethod
+    def _svg_transform(parent: Tuple[float, ...], text: str) -> Tuple[float, ...]:
+        """transform 属性を親の変換行列 (a, b, c, d, e, f) に合成 (2026-10-19: 新規追加)"""
+        matrix = parent
+        for name, values in TTFExporter._SVG_TRANSFORM.findall(text):
+            v = [float(x) for x in re.split(r'[\s,]+', values.strip()) if x]
+            if name == 'translate':
+                local = (1.0, 0.0, 0.0, 1.0, v[0], v[1] if len(v) > 1 else 0.0)
+            elif name == 'scale':
+                local = (v[0], 0.0, 0.0, v[1] if len(v) > 1 else v[0], 0.0, 0.0)
+            elif name == 'matrix' and len(v) == 6:
+                local = tuple(v)
+            else:
+                raise ValueError(f'未対応の transform です: {name}')
+            a1, b1, c1, d1, e1, f1 = matrix
+            a2, b2, c2, d2, e2, f2 = local
+            matrix = (a1 * a2 + c1 * b2, b1 * a2 + d1 * b2,
+                      a1 * c2 + c1 * d2, b1 * c2 + d1 * d2,
+                      a1 * e2 + c1 * f2 + e1, b1 * e2 + d1 * f2 + f1)
+        return matrix
+    
+    @staticmethod
+    def _iter_svg_path(path_data: str) -> Any:
+        """
+        SVGパスデータを先頭から順に解析し、絶対座標のコマンドを1つずつ返す (2026-10-19: 新規追加、旧 _parse_svg_path を置き換え)
+        ('M', x, y) / ('L', x, y) / ('C', x1, y1, x2, y2, x, y) / ('Z',)
+        相対座標（小文字）・H/V・S/Q/T・コマンドの省略（同じコマンドの引数の繰り返し）に対応（円弧 A は未対応）
+        """
+        cmd = None
+        args: List[float] = []
+        x = y = start_x = start_y = 0.0
+        prev = ''
+        ctrl = (0.0, 0.0)  # 直前の C/S の第2制御点、または Q/T の制御点（S/T の反射用）
+        
+        for m in TTFExporter._SVG_TOKEN.finditer(path_data):
+            letter, number = m.groups()
+            if letter:
+                if args:
+                    raise ValueError(f'SVGパスの引数が足りません: {cmd}')
+                if letter.upper() not in TTFExporter._SVG_ARGC:
+                    raise ValueError(f'未対応のSVGパスコマンドです: {letter}')
+                cmd = letter
+                if cmd in 'Zz':
+                    yield ('Z',)
+                    x, y = start_x, start_y
+                    prev = 'Z'
+                continue
+            if cmd is None or cmd in 'Zz':
+                raise ValueError('SVGパスのコマンドがありません')
+            args.append(float(number))
+            upper = cmd.upper()
+            if len(args) < TTFExporter._SVG_ARGC[upper]:
+                continue
+            dx, dy = (x, y) if cmd.islower() else (0.0, 0.0)
+            if upper == 'M':
+                x, y = args[0] + dx, args[1] + dy
+                start_x, start_y = x, y
+                yield ('M', x, y)
+                cmd = 'l' if cmd == 'm' else 'L'  # 続く座標は LineTo
+            elif upper == 'L':
+                x, y = args[0] + dx, args[1] + dy
+                yield ('L', x, y)
+            elif upper == 'H':
+                x = args[0] + dx
+                yield ('L', x, y)
+            elif upper == 'V':
+                y = args[0] + dy
+                yield ('L', x, y)
+            elif upper in ('C', 'S'):
+                if upper == 'C':
+                    x1, y1, x2, y2, ex, ey = args
+                    x1, y1 = x1 + dx, y1 + dy
+                else:
+                    x2, y2, ex, ey = args
+                    x1, y1 = (2 * x - ctrl[0], 2 * y - ctrl[1]) if prev in ('C', 'S') else (x, y)
+                x2, y2, ex, ey = x2 + dx, y2 + dy, ex + dx, ey + dy
+                yield ('C', x1, y1, x2, y2, ex, ey)
+                ctrl = (x2, y2)
+                x, y = ex, ey
+            else:  # Q, T は3次に変換
+                if upper == 'Q':
+                    qx, qy, ex, ey = args
+                    qx, qy = qx + dx, qy + dy
+                else:
+                    ex, ey = args
+                    qx, qy = (2 * x - ctrl[0], 2 * y - ctrl[1]) if prev in ('Q', 'T') else (x, y)
+                ex, ey = ex + dx, ey + dy
+                yield ('C', x + 2 * (qx - x) / 3, y + 2 * (qy - y) / 3,
+                       ex + 2 * (qx - ex) / 3, ey + 2 * (qy - ey) / 3, ex, ey)
+                ctrl = (qx, qy)
+                x, y = ex, ey
+            prev = upper
+            args = []
+        if args:
+            raise ValueError(f'SVGパスの引数が足りません: {cmd}')
+    
+    @staticmethod
+    def _draw_svg_contours(groups: List[List[Tuple[Tuple[float, float], List[Tuple[Any, ...]]]]],
+                           pen: Any, height: int, scale: float) -> None:
+        """
+        _svg_contours の結果をペンに描く（y軸を反転し、scale倍してフォント座標へ） (2026-10-19: 新規追加)
+        <path> 毎に先頭の輪郭（外側）が時計回りになるよう、必要ならその <path> 全体の向きを反転する
+        """
+        from fontTools.pens.reverseContourPen import ReverseContourPen  # type: ignore
+        
+        def pt(p: Tuple[float, float]) -> Tuple[float, float]:
+            return (p[0] * scale, (height - p[1]) * scale)
+        
+        for contours in groups:
+            if not contours:
+                continue
+            # 先頭の輪郭の符号付き面積（制御点も含めた多角形で向きを判定）
+            start, segments = contours[0]
+            points = [pt(start)] + [pt(p) for seg in segments for p in seg[1:]]
+            area = sum(x0 * y1 - x1 * y0 for (x0, y0), (x1, y1) in zip(points, points[1:] + points[:1]))
+            target = ReverseContourPen(pen) if area > 0 else pen
+            for start, segments in contours:
+                target.moveTo(pt(start))
+                for seg in segments:
+                    if seg[0] == 'L':
+                        target.lineTo(pt(seg[1]))
+                    else:
+                        target.curveTo(pt(seg[1]), pt(seg[2]), pt(seg[3]))
+                target.closePath()
 
 # ===== [BLOCK8-END] =====
 
@@ -4790,9 +9150,101 @@ class BackgroundLoader:
 
 # ===== [BLOCK10-BEGIN] 補助機能（安全保存＋未保存確認＋単一ファイルI/O＋GlyphEditor互換パッチ） (2025-10-11: 型ヒント追加、統合版) =====
 
+# --- 保存・読込の進捗表示（ステータスバー） ---
+def _io_progress(self: FontEditorApp, label: str) -> Callable[[int, int], None]:
+    """FontProject の progress コールバックを作成（約1%毎に更新） (2026-10-19: 新規追加)"""
+    last = [0]
+
+    def callback(current: int, total: int) -> None:
+        if current < total and current - last[0] < max(1, total // 100):
+            return
+        last[0] = current
+        try:
+            self.status_label.config(text=f'{label}... {current} / {total} 文字')
+            self.update_idletasks()
+        except tk.TclError:
+            pass
+    return callback
+
+
+# --- バックグラウンド保存（スナップショットをワーカースレッドで書き出す） ---
+def _start_background_job(self: FontEditorApp, label: str,
+                          job: Callable[[Callable[[int, int], None]], None],
+                          on_done: Callable[[Optional[Exception]], None]) -> None:
+    """
+    job(progress) をワーカースレッドで実行し、終了後 on_done(例外 or None) をUIスレッドで呼ぶ (2026-10-19: 新規追加)
+    進捗はキュー経由でステータスバーへ。同時に走らせるのは1件のみ（実行中なら完了を待ってから開始）
+    """
+    _wait_background_job(self)
+    results: queue.Queue = queue.Queue()
+
+    def worker() -> None:
+        try:
+            job(lambda current, total: results.put(('progress', current, total)))
+            results.put(('done', None, None))
+        except Exception as e:
+            results.put(('error', e, None))
+
+    # アプリ終了時に書き込み途中で打ち切られないよう非デーモンスレッドにする
+    thread = threading.Thread(target=worker, name='project-io', daemon=False)
+    self._bg_job = {
+        'thread': thread,
+        'results': results,
+        'progress': _io_progress(self, label),
+        'on_done': on_done,
+    }
+    thread.start()
+    self.after(100, lambda: _poll_background_job(self))
+
+
+def _poll_background_job(self: FontEditorApp) -> None:
+    """ワーカーからの進捗・完了通知を処理 (2026-10-19: 新規追加)"""
+    job = getattr(self, '_bg_job', None)
+    if job is None:
+        return
+    finished, error = False, None
+    while True:
+        try:
+            kind, value, total = job['results'].get_nowait()
+        except queue.Empty:
+            break
+        if kind == 'progress':
+            job['progress'](value, total)
+        else:
+            finished, error = True, value
+    if not finished:
+        self.after(100, lambda: _poll_background_job(self))
+        return
+    self._bg_job = None
+    self._bg_job_error = error
+    job['on_done'](error)
+
+
+def _wait_background_job(self: FontEditorApp) -> bool:
+    """実行中の保存があれば完了まで待つ。直前の保存が失敗していれば False (2026-10-19: 新規追加)"""
+    job = getattr(self, '_bg_job', None)
+    if job is None:
+        return getattr(self, '_bg_job_error', None) is None
+    job['thread'].join()
+    _poll_background_job(self)
+    return getattr(self, '_bg_job_error', None) is None
+
+
+def _show_io_error(title: str, message: str, error: Exception) -> None:
+    """保存・書き出しエラーの表示 (2026-10-19: 新規追加)"""
+    if isinstance(error, ProjectIOError):
+        messagebox.showerror(title, f'{message}:\n{error.summary()}')
+    elif isinstance(error, OSError):
+        messagebox.showerror(title, f'{message}:\n{error}')
+    else:
+        messagebox.showerror(title, f'予期しないエラー:\n{error}')
+
+
 # --- 未保存確認（Yes=保存 / No=保存せず続行 / Cancel=中止） ---
 def _confirm_unsaved_changes(self: FontEditorApp) -> bool:
     """未保存の変更確認"""
+    # [ADD] 2026-10-19: 保存中なら書き終わるまで待つ（続けて読込などを行うため）
+    _wait_background_job(self)
     if not self.project.dirty:
         return True
 
@@ -4804,7 +9256,8 @@ def _confirm_unsaved_changes(self: FontEditorApp) -> bool:
     if ans is None:
         return False
     if ans:
-        return self._save_project_dialog()
+        # [MOD] 2026-10-19: 保存はバックグラウンドで始まるため、続行前に完了を待つ
+        return self._save_project_dialog() and _wait_background_job(self)
     return True
 
 FontEditorApp._confirm_unsaved_changes = _confirm_unsaved_changes  # type: ignore
@@ -4812,12 +9265,10 @@ FontEditorApp._confirm_unsaved_changes = _confirm_unsaved_changes  # type: ignor
 
 # --- .fproj 保存：辞書スナップショットで安全保存 ---
 def _save_project_dialog_impl(self: FontEditorApp) -> bool:
-    """プロジェクト保存ダイアログ (2025-10-11: 型ヒント追加)"""
-    try:
-        if hasattr(self, '_stop_bg_loading'):
-            self._stop_bg_loading()
-    except Exception:
-        pass
+    """
+    プロジェクト保存ダイアログ (2025-10-11: 型ヒント追加)
+    [MOD] 2026-10-19: スナップショットを取ってワーカースレッドで保存（保存中も編集可能、進捗はステータスバー）
+    """
     try:
         if hasattr(self, '_commit_all_open_editors'):
             self._commit_all_open_editors()
@@ -4840,30 +9291,24 @@ def _save_project_dialog_impl(self: FontEditorApp) -> bool:
     if not path.endswith('.fproj'):
         path += '.fproj'
 
+    _wait_background_job(self)  # 前回の保存が終わってから差分を取る
     try:
-        with self.project._lock:  # (2025-10-11: スレッドセーフ化)
-            orig_glyphs = self.project.glyphs
-            snapshot = dict(orig_glyphs)
-            self.project.glyphs = snapshot
-        
-        try:
-            self.project.save_project(path)
-            self.project.dirty = False
-            messagebox.showinfo('保存完了', f'プロジェクトを保存しました:\n{path}')
-            return True
-        except OSError as e:
-            messagebox.showerror('保存エラー', f'保存に失敗しました:\n{e}')
-            return False
-        except Exception as e:
-            messagebox.showerror('保存エラー', f'予期しないエラー:\n{e}')
-            return False
-        finally:
-            with self.project._lock:
-                self.project.glyphs = orig_glyphs
+        plan = self.project.plan_save(path)
     except Exception as e:
         messagebox.showerror('保存エラー', f'保存処理中にエラーが発生しました:\n{e}')
         return False
 
+    def on_done(error: Optional[Exception]) -> None:
+        if error is not None:
+            _show_io_error('保存エラー', '保存に失敗しました', error)
+            return
+        self.project.finish_save(plan)
+        self.project.mark_clean(plan.clean_version)  # 保存中の編集は未保存のまま
+        self.status_label.config(text=f'プロジェクトを保存しました: {path}')
+
+    _start_background_job(self, '保存中', lambda progress: self.project.write_save(plan, progress), on_done)
+    return True
+
 
 # --- .fproj 読込 ---
 def _open_project_dialog_impl(self: FontEditorApp) -> None:
@@ -4876,6 +9321,17 @@ def _open_project_dialog_impl(self: FontEditorApp) -> None:
     try:
         self.project.load_project(folder)
         self.project.dirty = False
+        # [ADD] 2026-10-19: 異常終了などで保存されなかった編集の復元
+        pending = self.project.journal_pending()
+        if pending:
+            if messagebox.askyesno(
+                '編集の復元',
+                f'前回保存されなかった編集が {pending} 件残っています。復元しますか？\n\n'
+                'いいえ: 破棄して保存済みの状態で開く'
+            ):
+                self.project.recover_from_journal()
+            else:
+                self.project.discard_journal()
         if hasattr(self, 'grid_view'):
             self.grid_view.refresh()
         if hasattr(self, '_update_status'):
@@ -4887,14 +9343,178 @@ def _open_project_dialog_impl(self: FontEditorApp) -> None:
         messagebox.showerror('読込エラー', f'予期しないエラー:\n{e}')
 
 
-# --- .fprojz へ単一ファイル書出し ---
-def _export_project_singlefile_impl(self: FontEditorApp, dest: Optional[str] = None) -> bool:
-    """単一ファイル書出し (2025-10-11: 型ヒント追加、安全な一時ファイル管理)"""
+# --- バックアップ世代から復元 ---
+def _restore_backup_dialog_impl(self: FontEditorApp) -> None:
+    """バックアップ復元ダイアログ（プロジェクトを選び、世代を選んで復元） (2026-10-19: 新規追加)"""
+    if not self._confirm_unsaved_changes():
+        return
+    folder = filedialog.askdirectory(title='復元するプロジェクト（*.fproj フォルダ）を選択')
+    if not folder:
+        return
+    backups = self.project.list_backups(folder)
+    if not backups:
+        messagebox.showinfo('バックアップ', f'バックアップがありません:\n{folder}')
+        return
+
+    dialog = tk.Toplevel(self)
+    dialog.title('バックアップから復元')
+    dialog.geometry('320x300')
+    dialog.transient(self)
+    dialog.grab_set()  # モーダル化
+
+    tk.Label(dialog, text=os.path.basename(folder), font=('Arial', 11)).pack(pady=5)
+    listbox = tk.Listbox(dialog, font=('Arial', 10), height=10)
+    listbox.pack(fill='both', expand=True, padx=10)
+    for backup in backups:
+        listbox.insert(tk.END, backup['created'])
+    listbox.selection_set(0)
+
+    def restore() -> None:
+        selection = listbox.curselection()
+        if not selection:
+            return
+        backup = backups[selection[0]]
+        if not messagebox.askyesno('確認', f'{backup["created"]} の状態に戻しますか？\n現在の保存内容は置き換えられます', parent=dialog):
+            return
+        dialog.destroy()
+        try:
+            self.project.restore_backup(folder, backup['name'])
+            self.project.dirty = False
+            if hasattr(self, 'grid_view'):
+                self.grid_view.refresh()
+            if hasattr(self, '_update_status'):
+                self._update_status()
+            messagebox.showinfo('復元完了', f'{backup["created"]} の状態を復元しました:\n{folder}')
+        except (OSError, ValueError, zlib.error) as e:
+            messagebox.showerror('復元エラー', f'バックアップの復元に失敗しました:\n{e}')
+
+    button_frame = tk.Frame(dialog)
+    button_frame.pack(pady=10)
+    tk.Button(button_frame, text='復元', command=restore, width=10).pack(side='left', padx=5)
+    tk.Button(button_frame, text='キャンセル', command=dialog.destroy, width=10).pack(side='left', padx=5)
+    dialog.bind('<Escape>', lambda e: dialog.destroy())
+
+
+# --- サブセット書き出し（使う文字だけのTTF/WOFF/WOFF2） ---
+def _export_subset_dialog_impl(self: FontEditorApp) -> None:
+    """サブセット書き出しダイアログ（文章またはコードポイントで文字を指定） (2026-10-19: 新規追加)"""
+    if not self.project.glyphs:
+        messagebox.showwarning('警告', 'フォントが読み込まれていません')
+        return
+
+    dialog = tk.Toplevel(self)
+    dialog.title('サブセット書き出し')
+    dialog.geometry('480x420')
+    dialog.transient(self)
+    dialog.grab_set()  # モーダル化
+
+    tk.Label(dialog, text='収録する文字（文章、または U+4E00 / U+3040-309F 形式のコードポイント）',
+             font=('Arial', 10)).pack(anchor='w', padx=10, pady=(10, 2))
+    text = scrolledtext.ScrolledText(dialog, height=10, font=('Arial', 11))
+    text.pack(fill='both', expand=True, padx=10)
+    count_label = tk.Label(dialog, text='0 文字', font=('Arial', 10))
+    count_label.pack(anchor='w', padx=10)
+
+    def update_count(event: Optional[tk.Event] = None) -> None:
+        count_label.config(text=f'{len(TTFExporter.parse_codepoints(text.get("1.0", "end-1c")))} 文字')
+
+    def load_corpus() -> None:
+        path = filedialog.askopenfilename(title='テキストファイルを選択', parent=dialog,
+                                          filetypes=[('Text', '*.txt'), ('All Files', '*.*')])
+        if not path:
+            return
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                text.insert('end', f.read())
+        except OSError as e:
+            messagebox.showerror('読込エラー', f'テキストを読み込めません:\n{e}', parent=dialog)
+        update_count()
+
+    text.bind('<KeyRelease>', update_count)
+    tk.Button(dialog, text='テキストファイルから追加...', command=load_corpus).pack(anchor='w', padx=10, pady=5)
+
+    format_frame = tk.Frame(dialog)
+    format_frame.pack(anchor='w', padx=10)
+    format_vars = {}
+    for fmt in TTFExporter.SUBSET_FORMATS:
+        format_vars[fmt] = tk.BooleanVar(value=fmt != 'ttf')
+        check = tk.Checkbutton(format_frame, text=fmt.upper(), variable=format_vars[fmt])
+        check.pack(side='left', padx=5)
+        if fmt == 'woff2' and not TTFExporter.woff2_available():
+            format_vars[fmt].set(False)
+            check.config(state='disabled', text='WOFF2 (brotli が必要)')
+
+    def export() -> None:
+        codes = TTFExporter.parse_codepoints(text.get('1.0', 'end-1c'))
+        formats = tuple(fmt for fmt, var in format_vars.items() if var.get())
+        if not codes or not formats:
+            messagebox.showwarning('警告', '文字と書き出し形式を指定してください', parent=dialog)
+            return
+        path = filedialog.asksaveasfilename(
+            title='サブセットの保存先（拡張子は形式毎に付け替えます）', parent=dialog,
+            defaultextension=f'.{formats[0]}',
+            filetypes=[('Font', ' '.join(f'*.{fmt}' for fmt in formats)), ('All Files', '*.*')]
+        )
+        if not path:
+            return
+        dialog.destroy()
+        progress_win, progress_callback, cancel_event = self._export_progress('サブセット書き出し中...')
+        try:
+            sizes = TTFExporter.export_subset(self.project, path, codes, formats, progress_callback, cancel_event)
+        finally:
+            progress_win.destroy()
+        if sizes:
+            lines = [f'{fmt.upper()}: {size / 1024:,.1f} KB  {os.path.basename(out)}' for fmt, (out, size) in sizes.items()]
+            messagebox.showinfo('書き出し完了', f'{len(codes)} 文字のサブセットを書き出しました:\n\n' + '\n'.join(lines))
+        elif cancel_event.is_set():
+            messagebox.showinfo('書き出し中止', 'サブセット書き出しを中止しました')
+
+    button_frame = tk.Frame(dialog)
+    button_frame.pack(pady=10)
+    tk.Button(button_frame, text='書き出し', command=export, width=10).pack(side='left', padx=5)
+    tk.Button(button_frame, text='キャンセル', command=dialog.destroy, width=10).pack(side='left', padx=5)
+    dialog.bind('<Escape>', lambda e: dialog.destroy())
+
+
+# --- 従来のフォルダ形式（glyphs/*.png）で書出し ---
+def _export_project_folder_impl(self: FontEditorApp) -> bool:
+    """フォルダ形式書き出し（他ツール連携・旧バージョン互換用） (2026-10-19: 新規追加)"""
     try:
-        if hasattr(self, '_stop_bg_loading'):
-            self._stop_bg_loading()
+        if hasattr(self, '_commit_all_open_editors'):
+            self._commit_all_open_editors()
     except Exception:
         pass
+
+    path = filedialog.asksaveasfilename(
+        title='フォルダ形式で書き出し',
+        defaultextension='.fproj',
+        filetypes=[('Font Project', '*.fproj')]
+    )
+    if not path:
+        return False
+    if not path.endswith('.fproj'):
+        path += '.fproj'
+
+    _wait_background_job(self)
+    plan = self.project.plan_save(path, storage='folder', mark_saved=False)
+
+    def on_done(error: Optional[Exception]) -> None:
+        if error is not None:
+            _show_io_error('書き出しエラー', '書き出しに失敗しました', error)
+            return
+        self.status_label.config(text=f'フォルダ形式で書き出しました: {path}')
+
+    _start_background_job(self, '書き出し中', lambda progress: self.project.write_save(plan, progress), on_done)
+    return True
+
+
+# --- .fprojz へ単一ファイル書出し ---
+def _export_project_singlefile_impl(self: FontEditorApp, dest: Optional[str] = None) -> bool:
+    """
+    単一ファイル書出し (2025-10-11: 型ヒント追加、安全な一時ファイル管理)
+    [MOD] 2026-10-19: 書き出し・圧縮はワーカースレッドで実行（スナップショット保存）
+    [MOD] 2026-10-19: 一時フォルダを経由せずアーカイブへ直接書く（PNGは無圧縮メンバー）
+    """
     try:
         if hasattr(self, '_commit_all_open_editors'):
             self._commit_all_open_editors()
@@ -4912,44 +9532,29 @@ def _export_project_singlefile_impl(self: FontEditorApp, dest: Optional[str] = N
     if not dest.endswith('.fprojz'):
         dest += '.fprojz'
 
-    tmpdir = tempfile.mkdtemp(prefix='fproj_tmp_')
-    try:
-        with self.project._lock:  # (2025-10-11: スレッドセーフ化)
-            orig_glyphs = self.project.glyphs
-            snapshot = dict(orig_glyphs)
-            self.project.glyphs = snapshot
+    _wait_background_job(self)
+    plan = self.project.plan_save(dest, storage='folder', mark_saved=False)
 
-        temp_folder = os.path.join(tmpdir, 'project.fproj')
-        
-        try:
-            self.project.save_project(temp_folder)
+    def job(progress: Callable[[int, int], None]) -> None:
+        self.project.write_archive(plan, dest, progress)
 
-            with zipfile.ZipFile(dest, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
-                for root, dirs, files in os.walk(temp_folder):
-                    for name in files:
-                        abspath = os.path.join(root, name)
-                        arcname = os.path.relpath(abspath, start=tmpdir)
-                        zf.write(abspath, arcname)
+    def on_done(error: Optional[Exception]) -> None:
+        if error is not None:
+            _show_io_error('書き出しエラー', '単一ファイル書き出しに失敗しました', error)
+            return
+        self.project.mark_clean(plan.clean_version)
+        self.status_label.config(text=f'単一ファイルへ書き出しました: {dest}')
 
-            self.project.dirty = False
-            messagebox.showinfo('書き出し完了', f'単一ファイルへ書き出しました:\n{dest}')
-            return True
-        except OSError as e:
-            messagebox.showerror('書き出しエラー', f'単一ファイル書き出しに失敗しました:\n{e}')
-            return False
-        except Exception as e:
-            messagebox.showerror('書き出しエラー', f'予期しないエラー:\n{e}')
-            return False
-        finally:
-            with self.project._lock:
-                self.project.glyphs = orig_glyphs
-    finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
+    _start_background_job(self, '書き出し中', job, on_done)
+    return True
 
 
 # --- .fprojz 読込 ---
 def _open_project_singlefile_impl(self: FontEditorApp) -> None:
-    """単一ファイルプロジェクト読込"""
+    """
+    単一ファイルプロジェクト読込
+    [MOD] 2026-10-19: 展開せずにアーカイブのメンバーから直接（遅延）読み込む
+    """
     if not self._confirm_unsaved_changes():
         return
     src = filedialog.askopenfilename(
@@ -4958,32 +9563,18 @@ def _open_project_singlefile_impl(self: FontEditorApp) -> None:
     )
     if not src:
         return
-    tmpdir = tempfile.mkdtemp(prefix='fproj_open_')
     try:
-        with zipfile.ZipFile(src, 'r') as zf:
-            zf.extractall(tmpdir)
-        target = None
-        for entry in os.listdir(tmpdir):
-            p = os.path.join(tmpdir, entry)
-            if os.path.isdir(p) and entry.endswith('.fproj'):
-                target = p
-                break
-        if not target:
-            raise RuntimeError('アーカイブ内に .fproj フォルダが見つかりません')
-
-        self.project.load_project(target)
+        self.project.load_archive(src)
         self.project.dirty = False
         if hasattr(self, 'grid_view'):
             self.grid_view.refresh()
         if hasattr(self, '_update_status'):
             self._update_status()
         messagebox.showinfo('読込完了', f'単一ファイルのプロジェクトを読み込みました:\n{src}')
-    except OSError as e:
+    except (OSError, zipfile.BadZipFile) as e:
         messagebox.showerror('読込エラー', f'単一ファイル読込に失敗しました:\n{e}')
     except Exception as e:
         messagebox.showerror('読込エラー', f'予期しないエラー:\n{e}')
-    finally:
-        shutil.rmtree(tmpdir, ignore_errors=True)
 
 
 # --- FontEditorApp へバインド ---
@@ -4996,6 +9587,9 @@ FontEditorApp._save_project_dialog = _wrap(_save_project_dialog_impl)  # type: i
 FontEditorApp._open_project_dialog = _wrap(_open_project_dialog_impl)  # type: ignore
 FontEditorApp._export_project_singlefile = _wrap(_export_project_singlefile_impl)  # type: ignore
 FontEditorApp._open_project_singlefile = _wrap(_open_project_singlefile_impl)  # type: ignore
+FontEditorApp._export_project_folder = _wrap(_export_project_folder_impl)  # type: ignore
+FontEditorApp._restore_backup_dialog = _wrap(_restore_backup_dialog_impl)  # type: ignore
+FontEditorApp._export_subset_dialog = _wrap(_export_subset_dialog_impl)  # type: ignore
 
 
 # =========================
@@ -5009,6 +9603,8 @@ def _ge_commit(self: GlyphEditor) -> None:
     """エディタ内容をプロジェクトへ反映（BLOCK9互換）"""
     self.project.glyphs[self.char_code] = GlyphData(self.char_code, self.edit_bitmap.copy(), is_edited=True)
     self.project.dirty = True
+    if hasattr(self, '_set_session_modified'):
+        self._set_session_modified(False)
     if callable(getattr(self, 'on_commit', None)):
         self.on_commit(self.char_code)  # type: ignore
 
@@ -5122,7 +9718,7 @@ class GlyphFilterDialog(tk.Toplevel):
         self.result: str = current_filter
         
         self.title('グリフフィルタ')
-        self.geometry('400x350')
+        self.geometry('400x385')
         self.transient(parent)
         self.grab_set()
         
@@ -5142,7 +9738,8 @@ class GlyphFilterDialog(tk.Toplevel):
             ('edited', '編集済みのみ'),
             ('unedited', '未編集のみ'),
             ('defined', '定義済みのみ'),
-            ('empty', '空白のみ')
+            ('empty', '空白のみ'),
+            ('recent', f'最近変更したもののみ（{Config.RECENT_FILTER_HOURS}時間以内）')  # [ADD] 2026-10-19
         ]
         
         for value, label in filter_options:
@@ -0,0 +1,31 @@
+"""索引の「最近の変更」が編集済みのグリフだけを返すことの確認"""
+
+import importlib.util
+import os
+
+import pytest
+from PIL import Image, ImageDraw
+
+_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'font_editor1.841.py')
+_spec = importlib.util.spec_from_file_location('font_editor', _PATH)
+fe = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(fe)
+
+
+def _glyph_image(seed: int) -> Image.Image:
+    image = Image.new('L', (64, 64), 255)
+    ImageDraw.Draw(image).rectangle((seed % 32, 8, 48, 56), fill=0)
+    return image
+
+
+@pytest.mark.skipif(not fe.ProjectIndex.available(), reason='sqlite3 が無い環境では索引を作らない')
+def test_recently_changed_after_first_save_lists_only_edited(tmp_path):
+    project = fe.FontProject()
+    start = project.char_range[0]
+    for code in range(start, start + 10):
+        project.set_glyph(code, _glyph_image(code))  # フォントから読み込んだだけのグリフ
+    project.set_glyph(start + 3, _glyph_image(99), is_edited=True)
+
+    project.save_project(str(tmp_path / 'a.fproj'))
+
+    assert project.recently_changed(24) == {start + 3}